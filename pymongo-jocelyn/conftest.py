@@ -4,30 +4,67 @@ import os
 import pytest
 from pymongo import MongoClient
 from dotenv import load_dotenv
+from mongo_timing import COMMAND_TIMER
+import snapshot
 
 load_dotenv() 
 
+# Records per-test Mongo command latency and reports it (see mongo_timing.py)
+pytest_plugins = ["mongo_timing"]
+
 
 @pytest.fixture(scope="session")
 def mongo_client():
     """Shared MongoDB client for all tests."""
     uri = os.getenv("MONGO_URI")
     assert uri, "MONGO_URI is not set in .env"
-    client = MongoClient(uri)
+    client = MongoClient(uri, event_listeners=[COMMAND_TIMER])
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def fixture_client():
+    """
+    Client for the local mongod holding the snapshot dataset (see snapshot.py).
+    Only used when MONGO_FIXTURE_URI is set, e.g. mongodb://localhost:27017
+    """
+    uri = os.getenv("MONGO_FIXTURE_URI")
+    if not uri:
+        pytest.skip("MONGO_FIXTURE_URI is not set - snapshot dataset unavailable")
+    if not snapshot.available():
+        pytest.skip(f"No snapshot '{snapshot.SNAPSHOT_VERSION}' - run: python snapshot.py dump")
+    client = MongoClient(uri, event_listeners=[COMMAND_TIMER])
+    snapshot.load_pristine(client)     # no-op when loaded; other xdist workers wait for the one building it
     yield client
     client.close()
 
 
 @pytest.fixture(scope="session")
-def applications(mongo_client):
-    db = mongo_client["bitbybitdevelopment"]
-    return db["applications"]
+def dataset_db(request):
+    """
+    Database the filter tests read from: this worker's copy of the snapshot
+    when MONGO_FIXTURE_URI is set, the shared live database otherwise.
+    """
+    if os.getenv("MONGO_FIXTURE_URI"):
+        return snapshot.restore(request.getfixturevalue("fixture_client"))
+    return request.getfixturevalue("mongo_client")["bitbybitdevelopment"]
+
+
+@pytest.fixture
+def clean_dataset(fixture_client):
+    """For tests that mutate data: restore the snapshot copy before the test runs."""
+    return snapshot.restore(fixture_client)
+
+
+@pytest.fixture(scope="session")
+def applications(dataset_db):
+    return dataset_db["applications"]
 
 
 @pytest.fixture(scope="session")
-def chakra_results(mongo_client):
-    db = mongo_client["bitbybitdevelopment"]
-    return db["chakraassessments"]  
+def chakra_results(dataset_db):
+    return dataset_db["chakraassessments"]  
 
 
 @pytest.fixture
@@ -0,0 +1,161 @@
+"""
+Exhaustive filter-combination checker backed by NumPy bitsets.
+
+The collection is read ONCE (projected to the filter fields only) and every
+option of every filter dimension becomes a packed bitset over the documents:
+
+    ageBracket = "40-50"                 -> bitset
+    familiarWith ⊇ {"Reiki", "Yoga"}     -> AND of the per-value bitsets
+    submittedAt in [from, to]            -> bitset
+
+Counts for the full cartesian product of options are then computed with
+vectorized AND + popcount, so thousands of combinations take milliseconds
+instead of thousands of count_documents() calls. A random sample is
+re-checked against Mongo (and can be fed to the UI through
+FilterState.query_string()) to prove the bitsets match the real queries.
+"""
+import itertools
+import random
+import re
+from datetime import datetime
+
+import numpy as np
+
+from filter_dsl import AllOf, DateRange, Equals, Search
+
+# popcount of every possible byte
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint32)
+
+MAX_MATRIX_BYTES = 512 * 1024 * 1024
+
+
+class FilterBitsets:
+    """Packed bitsets for every option of every filter dimension of a FilterSpec."""
+
+    def __init__(self, spec, n_docs, options):
+        self.spec = spec
+        self.n_docs = n_docs
+        # {dimension name: [(value or None for 'not filtered', packed bitset)]}
+        self.options = options
+
+    @classmethod
+    def load(cls, collection, spec, search_terms=(), date_ranges=(), max_subset=2, batch_size=5000):
+        """
+        Read `collection` once and build the bitsets.
+
+        search_terms: search box values to include (free text can't be enumerated)
+        date_ranges:  (from, to) pairs to include for DateRange dimensions
+        max_subset:   largest checkbox subset to enumerate for AllOf dimensions
+        """
+        fields = set()
+        for dim in spec.dimensions.values():
+            fields.update(dim.fields if isinstance(dim, Search) else (dim.name,))
+        projection = {f: 1 for f in sorted(fields)}
+        projection["_id"] = 0
+
+        columns = {f: [] for f in fields}
+        for doc in collection.find({}, projection).batch_size(batch_size):
+            for f in fields:
+                columns[f].append(doc.get(f))
+        n = len(next(iter(columns.values()), []))
+
+        everything = np.packbits(np.ones(n, dtype=bool))
+        options = {}
+        for name, dim in spec.dimensions.items():
+            opts = [(None, everything)]
+            if isinstance(dim, Equals):
+                opts += [(v, np.packbits(m)) for v, m in _value_masks(columns[dim.name], n).items()]
+            elif isinstance(dim, AllOf):
+                masks = _value_masks(columns[dim.name], n)
+                values = sorted(masks, key=str)
+                for size in range(1, max_subset + 1):
+                    for subset in itertools.combinations(values, size):
+                        mask = np.logical_and.reduce([masks[v] for v in subset])
+                        opts.append((list(subset), np.packbits(mask)))
+            elif isinstance(dim, DateRange):
+                stamps = np.array(
+                    [np.datetime64(v, "ms") if isinstance(v, datetime) else np.datetime64("NaT") for v in columns[dim.name]],
+                    dtype="datetime64[ms]",
+                )
+                for date_from, date_to in date_ranges:
+                    # normalize through the DSL so inclusive 'to' dates match the real query
+                    date_from, date_to = dim.normalize((date_from, date_to))
+                    mask = ~np.isnat(stamps)
+                    if date_from is not None:
+                        mask &= stamps >= np.datetime64(date_from, "ms")
+                    if date_to is not None:
+                        mask &= stamps <= np.datetime64(date_to, "ms")
+                    opts.append(((date_from, date_to), np.packbits(mask)))
+            elif isinstance(dim, Search):
+                for term in search_terms:
+                    pattern = re.compile(re.escape(term), re.IGNORECASE)
+                    mask = np.zeros(n, dtype=bool)
+                    for f in dim.fields:
+                        mask |= np.array([isinstance(v, str) and bool(pattern.search(v)) for v in columns[f]], dtype=bool)
+                    opts.append((term, np.packbits(mask)))
+            options[name] = opts
+        return cls(spec, n, options)
+
+    def count_all(self):
+        """
+        Count every combination of options.
+
+        Returns (choices, counts): choices[i][d] is the option index picked for
+        dimension d in combination i, counts[i] its number of documents.
+        """
+        width = len(np.packbits(np.ones(self.n_docs, dtype=bool)))
+        total = int(np.prod([len(opts) for opts in self.options.values()]))
+        if total * max(width, 1) > MAX_MATRIX_BYTES:
+            raise ValueError(f"{total} combinations x {width} bytes is too large - lower max_subset")
+
+        bits = np.full((1, width), 0xFF, dtype=np.uint8)
+        choices = np.zeros((1, 0), dtype=np.int32)
+        for opts in self.options.values():
+            opt_bits = np.stack([b for _, b in opts])
+            k = len(opts)
+            bits = (bits[:, None, :] & opt_bits[None, :, :]).reshape(-1, width)
+            choices = np.concatenate(
+                [np.repeat(choices, k, axis=0), np.tile(np.arange(k, dtype=np.int32), len(choices))[:, None]],
+                axis=1,
+            )
+        return choices, _POPCOUNT[bits].sum(axis=1)
+
+    def state(self, choice):
+        """The FilterState for one row of `choices`."""
+        values = {}
+        for (name, opts), index in zip(self.options.items(), choice):
+            value = opts[index][0]
+            if value is not None:
+                values[name] = value
+        return self.spec.state(**values)
+
+    def spot_check(self, collection, choices, counts, sample=25, seed=None):
+        """
+        Re-run a random sample of combinations against Mongo.
+        Returns [(FilterState, bitset count, mongo count)] for every mismatch.
+        """
+        rng = random.Random(seed)
+        rows = rng.sample(range(len(counts)), min(sample, len(counts)))
+        mismatches = []
+        for row in rows:
+            state = self.state(choices[row])
+            expected = int(counts[row])
+            actual = collection.count_documents(state.query())
+            if actual != expected:
+                mismatches.append((state, expected, actual))
+        return mismatches
+
+
+def _value_masks(column, n):
+    # Arrays match on any element, like Mongo equality / $all do
+    masks = {}
+    for i, value in enumerate(column):
+        values = value if isinstance(value, list) else [value]
+        for v in values:
+            if v is None or isinstance(v, (dict, list)):
+                continue
+            mask = masks.get(v)
+            if mask is None:
+                mask = masks[v] = np.zeros(n, dtype=bool)
+            mask[i] = True
+    return masks
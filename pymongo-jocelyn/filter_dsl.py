@@ -0,0 +1,244 @@
+"""
+Filter DSL for the admin Application and Chakra result pages.
+
+A filter state (what an admin typed / checked on the results page) is built
+from a FilterSpec and compiles to:
+    - one canonical Mongo query (stable key ordering, cached by filter hash)
+    - the matching UI query string
+    - the matching UI control state (css selector -> value to set/check)
+
+So the same definition drives the DB oracle, the UI tests and benchmarks:
+
+    state = APPLICATION_FILTERS.state(isHealthcareWorker="Yes",
+                                      challenges=["Physical", "Emotional"])
+    applications.count_documents(state.query())
+    driver.get(f"{BASE_URL}/application-results?{state.query_string()}")
+"""
+import copy
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from urllib.parse import urlencode
+
+
+# ---------------- Dimensions (one per filter control) ----------------
+
+@dataclass(frozen=True)
+class Search:
+    """Free text search box -> case-insensitive `$or` over several fields."""
+    name: str
+    fields: tuple
+    param: str = "search"
+
+    def normalize(self, value):
+        value = (value or "").strip()
+        return value or None
+
+    def clause(self, value):
+        pattern = re.compile(re.escape(value), re.IGNORECASE)
+        return {"$or": [{f: pattern} for f in self.fields]}
+
+    def params(self, value):
+        return [(self.param, value)]
+
+    def controls(self, value):
+        return [(f"input[name='{self.param}']", value)]
+
+
+@dataclass(frozen=True)
+class Equals:
+    """Radio button / dropdown -> exact match on one field."""
+    name: str
+    param: str = None
+
+    def normalize(self, value):
+        if value is None or value == "":
+            return None
+        return value
+
+    def clause(self, value):
+        return {self.name: value}
+
+    def params(self, value):
+        return [(self.param or self.name, value)]
+
+    def controls(self, value):
+        return [(f"input[name='{self.param or self.name}'][value='{value}']", True)]
+
+
+@dataclass(frozen=True)
+class AllOf:
+    """Checkbox group -> `$all` of the checked values (order does not matter)."""
+    name: str
+    param: str = None
+
+    def normalize(self, value):
+        if not value:
+            return None
+        if isinstance(value, str):
+            value = [value]
+        return tuple(sorted(set(value)))
+
+    def clause(self, value):
+        return {self.name: {"$all": list(value)}}
+
+    def params(self, value):
+        return [(self.param or self.name, v) for v in value]
+
+    def controls(self, value):
+        return [(f"input[name='{self.param or self.name}'][value='{v}']", True) for v in value]
+
+
+@dataclass(frozen=True)
+class DateRange:
+    """From/To date pickers -> `$gte`/`$lte`, `to` is inclusive (end of day)."""
+    name: str
+    param_from: str = "dateFrom"
+    param_to: str = "dateTo"
+
+    def normalize(self, value):
+        if not value:
+            return None
+        date_from, date_to = value
+        date_from = _as_datetime(date_from, time.min)
+        date_to = _as_datetime(date_to, time(23, 59, 59))
+        if date_from is None and date_to is None:
+            return None
+        return (date_from, date_to)
+
+    def clause(self, value):
+        date_from, date_to = value
+        bounds = {}
+        if date_from is not None:
+            bounds["$gte"] = date_from
+        if date_to is not None:
+            bounds["$lte"] = date_to
+        return {self.name: bounds}
+
+    def params(self, value):
+        date_from, date_to = value
+        out = []
+        if date_from is not None:
+            out.append((self.param_from, date_from.strftime("%Y-%m-%d")))
+        if date_to is not None:
+            out.append((self.param_to, date_to.strftime("%Y-%m-%d")))
+        return out
+
+    def controls(self, value):
+        return [(f"input[name='{name}']", v) for name, v in self.params(value)]
+
+
+def _as_datetime(value, default_time):
+    # Plain dates get the start / end of the day, datetimes are kept as-is
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, default_time)
+    return datetime.combine(date.fromisoformat(value), default_time)
+
+
+# ---------------- Spec + state ----------------
+
+class FilterSpec:
+    """The set of filter controls on one results page, in UI order."""
+
+    def __init__(self, collection, *dimensions):
+        self.collection = collection
+        self.dimensions = {d.name: d for d in dimensions}
+
+    def state(self, **values):
+        unknown = set(values) - set(self.dimensions)
+        if unknown:
+            raise KeyError(f"Unknown filter(s) for {self.collection}: {sorted(unknown)}")
+        items = []
+        for name, dim in self.dimensions.items():
+            value = dim.normalize(values.get(name))
+            if value is not None:
+                items.append((name, value))
+        return FilterState(self, tuple(items))
+
+    def compile(self, **values):
+        return self.state(**values).query()
+
+
+@dataclass(frozen=True)
+class FilterState:
+    """An immutable, hashable filter selection. Build it with FilterSpec.state()."""
+    spec: FilterSpec = field(compare=False, repr=False)
+    items: tuple
+
+    @property
+    def key(self):
+        """Stable hash of the filter state, same across runs and processes."""
+        payload = json.dumps([self.spec.collection, self.items], default=str)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def query(self):
+        """Canonical Mongo query (a fresh copy of the cached one)."""
+        return compile_query(self)
+
+    def query_string(self):
+        params = []
+        for name, value in self.items:
+            params.extend(self.spec.dimensions[name].params(value))
+        return urlencode(params)
+
+    def controls(self):
+        """[(css selector, value)] - value True means 'check this box/radio'."""
+        out = []
+        for name, value in self.items:
+            out.extend(self.spec.dimensions[name].controls(value))
+        return out
+
+
+_COMPILED = {}
+
+
+def compile_query(state):
+    """
+    Compile a FilterState into a Mongo query.
+
+    No filters -> {}, one filter -> its clause, several -> `$and` of the
+    clauses in UI order. The result is cached by the state's hash; callers
+    get a deep copy, so mutating it never leaks into later calls.
+    """
+    key = state.key
+    query = _COMPILED.get(key)
+    if query is None:
+        clauses = [state.spec.dimensions[name].clause(value) for name, value in state.items]
+        if not clauses:
+            query = {}
+        elif len(clauses) == 1:
+            query = clauses[0]
+        else:
+            query = {"$and": clauses}
+        _COMPILED[key] = query
+    return copy.deepcopy(query)
+
+
+# ---------------- Filter pages of the app ----------------
+
+SEARCH_FIELDS = ("fullName", "email", "contactNumber", "jobTitle")
+
+APPLICATION_FILTERS = FilterSpec(
+    "applications",
+    Search("search", SEARCH_FIELDS),
+    Equals("ageBracket"),
+    Equals("isHealthcareWorker"),
+    Equals("workedWithPractitioner"),
+    AllOf("familiarWith"),
+    AllOf("challenges"),
+    DateRange("submittedAt"),
+)
+
+CHAKRA_FILTERS = FilterSpec(
+    "chakraassessments",
+    Search("search", SEARCH_FIELDS),
+    Equals("focusChakra"),
+    Equals("archetype"),
+    AllOf("familiarWith"),
+    AllOf("challenges"),
+    DateRange("createdAt"),
+)
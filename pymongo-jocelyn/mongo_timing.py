@@ -0,0 +1,155 @@
+"""
+Mongo command latency instrumentation for the pymongo test session.
+
+COMMAND_TIMER is a pymongo CommandListener that is registered on the shared
+`mongo_client` (see conftest.py). It records every command's name,
+collection, server duration and reply size, grouped by the running test.
+Raw replies are sized as they arrive; decoded ones are only re-encoded for
+the slowest commands, when the summary is printed, so the listener does
+no per-command encoding.
+
+As a pytest plugin this module also:
+    - adds a "DB time" column to the pytest-html report
+    - prints per-test DB time vs. total test time and the slowest commands
+      at the end of the run
+
+DB time is the time the server round trips took; whatever is left of the
+test duration is connection setup and Python overhead.
+"""
+import heapq
+import itertools
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Optional
+
+import bson
+import pytest
+from bson.raw_bson import RawBSONDocument
+from pymongo import monitoring
+
+SESSION_SCOPE = "<session>"     # commands issued outside of any test (fixtures, setup)
+SLOWEST_COMMANDS_SHOWN = 10
+
+
+@dataclass
+class CommandRecord:
+    test: str
+    name: str
+    collection: str
+    database: str
+    duration_ms: float
+    ok: bool
+    reply_bytes: Optional[int] = None   # None until sized (see CommandTimer.slowest)
+
+
+class CommandTimer(monitoring.CommandListener):
+    """Collects CommandRecords per test. Thread-safe enough for pymongo's callbacks."""
+
+    def __init__(self):
+        self.current_test = SESSION_SCOPE
+        self.records = defaultdict(list)
+        self._pending = {}
+        self._slowest = []      # min-heap of (duration_ms, seq, record, reply), SLOWEST_COMMANDS_SHOWN long
+        self._seq = itertools.count()
+
+    def started(self, event):
+        value = event.command.get(event.command_name)
+        collection = value if isinstance(value, str) else ""
+        self._pending[(event.connection_id, event.request_id)] = (self.current_test, collection)
+
+    def succeeded(self, event):
+        self._finish(event, ok=True, reply=event.reply)
+
+    def failed(self, event):
+        self._finish(event, ok=False, reply=None)
+
+    def _finish(self, event, ok, reply):
+        test, collection = self._pending.pop(
+            (event.connection_id, event.request_id), (self.current_test, "")
+        )
+        record = CommandRecord(
+            test=test,
+            name=event.command_name,
+            collection=collection,
+            database=event.database_name,
+            duration_ms=event.duration_micros / 1000.0,
+            ok=ok,
+            reply_bytes=0 if reply is None else (len(reply.raw) if isinstance(reply, RawBSONDocument) else None),
+        )
+        self.records[test].append(record)
+        # only the slowest commands keep their decoded reply, to be sized later
+        entry = (record.duration_ms, next(self._seq), record, reply if record.reply_bytes is None else None)
+        if len(self._slowest) < SLOWEST_COMMANDS_SHOWN:
+            heapq.heappush(self._slowest, entry)
+        elif entry[0] > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def db_time_ms(self, test):
+        return sum(r.duration_ms for r in self.records.get(test, ()))
+
+    def slowest(self, n=SLOWEST_COMMANDS_SHOWN):
+        """The n slowest records (n <= SLOWEST_COMMANDS_SHOWN), reply sizes filled in."""
+        out = []
+        for _, _, record, reply in heapq.nlargest(n, self._slowest):
+            if record.reply_bytes is None:
+                record.reply_bytes = len(bson.encode(reply))
+            out.append(record)
+        return out
+
+
+COMMAND_TIMER = CommandTimer()
+
+
+# ---------------- pytest hooks ----------------
+
+_test_wall_ms = {}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    COMMAND_TIMER.current_test = item.nodeid
+    start = time.perf_counter()
+    yield
+    _test_wall_ms[item.nodeid] = (time.perf_counter() - start) * 1000.0
+    COMMAND_TIMER.current_test = SESSION_SCOPE
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    if call.when == "call":
+        # user_properties survive xdist serialization, report attributes don't
+        item.user_properties.append(("db_time_ms", round(COMMAND_TIMER.db_time_ms(item.nodeid), 3)))
+    yield
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_header(cells):
+    cells.insert(2, "<th>DB time</th>")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_table_row(report, cells):
+    db_time = dict(report.user_properties).get("db_time_ms")
+    cells.insert(2, f"<td>{db_time:.1f} ms</td>" if db_time is not None else "<td></td>")
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not COMMAND_TIMER.records:
+        return
+    tr = terminalreporter
+    tr.write_sep("=", "Mongo command latency")
+    tr.write_line(f"{'test':<60} {'cmds':>5} {'db ms':>9} {'total ms':>9}")
+    for test, records in COMMAND_TIMER.records.items():
+        total = _test_wall_ms.get(test)
+        total_text = f"{total:9.1f}" if total is not None else f"{'-':>9}"
+        tr.write_line(f"{test[-60:]:<60} {len(records):>5} {COMMAND_TIMER.db_time_ms(test):9.1f} {total_text}")
+
+    tr.write_line("")
+    tr.write_line(f"Slowest {SLOWEST_COMMANDS_SHOWN} commands:")
+    for r in COMMAND_TIMER.slowest():
+        status = "" if r.ok else " FAILED"
+        tr.write_line(
+            f"  {r.duration_ms:8.1f} ms  {r.name:<16} {r.database}.{r.collection:<20} "
+            f"{r.reply_bytes:>9} B  {r.test}{status}"
+        )
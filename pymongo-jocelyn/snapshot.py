@@ -0,0 +1,172 @@
+"""
+Versioned BSON snapshot of the filter test dataset for a local mongod.
+
+Layout (mongodump style, one concatenated-BSON file per collection):
+    snapshots/<version>/applications.bson
+    snapshots/<version>/chakraassessments.bson
+
+The snapshot is loaded ONCE into a pristine database on the local server
+(skipped entirely if that version is already there); concurrent xdist
+workers serialise on a lock document, so one builds it and the others wait
+for its checksum. Each test worker gets
+its own working database, and a restore is a server-side `$out` from the
+pristine copy - no documents travel through Python between tests.
+
+Create / refresh a snapshot from the shared database:
+    python snapshot.py dump --version v2
+"""
+import argparse
+import hashlib
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import bson
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo import MongoClient
+from pymongo.errors import DuplicateKeyError
+
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), "snapshots")
+SNAPSHOT_VERSION = os.getenv("MONGO_SNAPSHOT_VERSION", "v1")
+COLLECTIONS = ("applications", "chakraassessments")
+SOURCE_DB = "bitbybitdevelopment"
+INSERT_BATCH = 1000
+META_COLLECTION = "_snapshot_meta"
+LOCK_TIMEOUT_S = 600        # a build lock older than this is considered abandoned
+
+
+def snapshot_path(version, collection):
+    return os.path.join(SNAPSHOT_DIR, version, f"{collection}.bson")
+
+
+def available(version=SNAPSHOT_VERSION):
+    return all(os.path.exists(snapshot_path(version, name)) for name in COLLECTIONS)
+
+
+def _checksum(version):
+    digest = hashlib.sha1()
+    for name in COLLECTIONS:
+        with open(snapshot_path(version, name), "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def pristine_db_name(version):
+    return f"fixture_pristine_{version}"
+
+
+def worker_db_name(version):
+    # One working database per xdist worker so parallel tests never collide
+    worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+    return f"fixture_{version}_{worker}"
+
+
+def _loaded(db, checksum):
+    meta = db[META_COLLECTION].find_one({"_id": "snapshot"})
+    return bool(meta) and meta.get("checksum") == checksum
+
+
+def _acquire(db, owner):
+    """Atomic insert of the lock document: True if this process now holds it."""
+    try:
+        db[META_COLLECTION].insert_one({"_id": "lock", "owner": owner, "at": datetime.utcnow()})
+        return True
+    except DuplicateKeyError:
+        # the holder died mid-build: break its lock (by owner, so a lock taken since is left alone)
+        lock = db[META_COLLECTION].find_one({"_id": "lock"})
+        if lock and lock["at"] < datetime.utcnow() - timedelta(seconds=LOCK_TIMEOUT_S):
+            db[META_COLLECTION].delete_one({"_id": "lock", "owner": lock["owner"]})
+        return False
+
+
+def _build(db, version, checksum):
+    for name in COLLECTIONS:
+        db.drop_collection(name)
+        batch = []
+        with open(snapshot_path(version, name), "rb") as f:
+            for doc in bson.decode_file_iter(f, CodecOptions(document_class=RawBSONDocument)):
+                batch.append(doc)
+                if len(batch) >= INSERT_BATCH:
+                    db[name].insert_many(batch, ordered=False)
+                    batch = []
+        if batch:
+            db[name].insert_many(batch, ordered=False)
+
+    db[META_COLLECTION].replace_one(
+        {"_id": "snapshot"}, {"_id": "snapshot", "version": version, "checksum": checksum}, upsert=True
+    )
+
+
+def load_pristine(client, version=SNAPSHOT_VERSION, timeout=2 * LOCK_TIMEOUT_S):
+    """
+    Load the snapshot into the pristine database unless the same version
+    (same file checksum) is already loaded. Returns the pristine Database.
+
+    Only the worker holding the lock document builds; the others poll until
+    the checksum is recorded (or raise TimeoutError after `timeout` seconds).
+    """
+    db = client[pristine_db_name(version)]
+    checksum = _checksum(version)
+    owner = f"{os.getenv('PYTEST_XDIST_WORKER', 'main')}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    deadline = time.monotonic() + timeout
+    while not _loaded(db, checksum):
+        if _acquire(db, owner):
+            try:
+                # another worker may have finished between the check and the lock
+                if not _loaded(db, checksum):
+                    _build(db, version, checksum)
+            finally:
+                db[META_COLLECTION].delete_one({"_id": "lock", "owner": owner})
+            break
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Snapshot '{version}' still being loaded by another worker after {timeout}s")
+        time.sleep(0.5)
+    return db
+
+
+def restore(client, version=SNAPSHOT_VERSION, collections=COLLECTIONS):
+    """Server-side copy of the pristine collections into this worker's database."""
+    pristine = client[pristine_db_name(version)]
+    target = worker_db_name(version)
+    for name in collections:
+        # $out replaces the target collection atomically (MongoDB 4.4+ for cross-db)
+        pristine[name].aggregate([{"$out": {"db": target, "coll": name}}])
+    return client[target]
+
+
+def dump(source_uri, version):
+    """Write the source collections to snapshots/<version>/ as raw BSON."""
+    os.makedirs(os.path.join(SNAPSHOT_DIR, version), exist_ok=True)
+    client = MongoClient(source_uri, document_class=RawBSONDocument)
+    try:
+        db = client[SOURCE_DB]
+        for name in COLLECTIONS:
+            count = 0
+            with open(snapshot_path(version, name), "wb") as f:
+                # Sorted by _id so the same data always produces the same file
+                for doc in db[name].find().sort("_id", 1).batch_size(INSERT_BATCH):
+                    f.write(doc.raw)
+                    count += 1
+            print(f"{name}: {count} documents -> {snapshot_path(version, name)}")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Manage the Mongo fixture snapshot")
+    sub = parser.add_subparsers(dest="command", required=True)
+    dump_cmd = sub.add_parser("dump", help="snapshot the shared database into snapshots/<version>/")
+    dump_cmd.add_argument("--version", default=SNAPSHOT_VERSION)
+    dump_cmd.add_argument("--source-uri", default=os.getenv("MONGO_URI"))
+    args = parser.parse_args()
+
+    if args.command == "dump":
+        if not args.source_uri:
+            parser.error("MONGO_URI is not set in .env (or pass --source-uri)")
+        dump(args.source_uri, args.version)
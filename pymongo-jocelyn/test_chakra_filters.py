@@ -1,6 +1,6 @@
 import pytest
 from datetime import datetime
-import re
+from filter_dsl import CHAKRA_FILTERS
 
 
 # TEST FOCUS CHAKRA FILTER
@@ -8,9 +8,7 @@ import re
 def test_focus_chakra_filter(chakra_results):
     focus_chakra = "solarPlexusChakra"
 
-    query = {
-        "focusChakra": focus_chakra,
-    }
+    query = CHAKRA_FILTERS.compile(focusChakra=focus_chakra)
 
     count = chakra_results.count_documents(query)
     print(f"\n[Focus Chakra] Docs with focusChakra='{focus_chakra}': {count}\n")
@@ -24,9 +22,7 @@ def test_focus_chakra_filter(chakra_results):
 def test_archetype_filter(chakra_results):
     archetype = "workerBee"
 
-    query = {
-        "archetype": archetype,
-    }
+    query = CHAKRA_FILTERS.compile(archetype=archetype)
 
     count = chakra_results.count_documents(query)
     print(f"\n[Archetype] Docs with archetype='{archetype}' : {count}\n")
@@ -46,10 +42,10 @@ def test_familiar_with_and_challenges_combined(chakra_results):
         "spiritual"
     ]
 
-    query = {
-        "familiarWith": {"$all": familiar_values},
-        "challenges": {"$all": challenge_values},
-    }
+    query = CHAKRA_FILTERS.compile(
+        familiarWith=familiar_values,
+        challenges=challenge_values,
+    )
 
     count = chakra_results.count_documents(query)
     print(
@@ -65,29 +61,14 @@ def test_familiar_with_and_challenges_combined(chakra_results):
 @pytest.mark.chakra
 def test_search_and_date_range_combined(chakra_results):
     search_term = "camacho"
-    pattern = re.compile(search_term, re.IGNORECASE)
 
     date_from = datetime(2025, 11, 12)
     date_to = datetime(2025, 11, 20, 23, 59, 59)
 
-    query = {
-        "$and": [
-            {
-                "createdAt": {
-                    "$gte": date_from,
-                    "$lte": date_to,
-                }
-            },
-            {
-                "$or": [
-                    {"fullName": pattern},
-                    {"email": pattern},
-                    {"contactNumber": pattern},
-                    {"jobTitle": pattern},
-                ]
-            },
-        ]
-    }
+    query = CHAKRA_FILTERS.compile(
+        search=search_term,
+        createdAt=(date_from, date_to),
+    )
 
     count = chakra_results.count_documents(query)
     print(
@@ -0,0 +1,40 @@
+import pytest
+from datetime import datetime
+from filter_bitsets import FilterBitsets
+from filter_dsl import APPLICATION_FILTERS, CHAKRA_FILTERS
+
+
+#EXHAUSTIVE APPLICATION FILTER COMBINATIONS (bitsets) + MONGO SPOT CHECK
+@pytest.mark.application
+def test_application_filter_combinations(applications, search_term):
+    index = FilterBitsets.load(
+        applications,
+        APPLICATION_FILTERS,
+        search_terms=[search_term],
+        date_ranges=[(datetime(2025, 11, 12), datetime(2025, 11, 19, 23, 59, 59))],
+    )
+    choices, counts = index.count_all()
+    print(f"\n[Combinations] {len(counts)} application filter combinations over {index.n_docs} docs\n")
+
+    mismatches = index.spot_check(applications, choices, counts, sample=25)
+    assert not mismatches, "\n".join(
+        f"{state.query_string()}: bitsets={expected} mongo={actual}" for state, expected, actual in mismatches
+    )
+
+
+#EXHAUSTIVE CHAKRA FILTER COMBINATIONS (bitsets) + MONGO SPOT CHECK
+@pytest.mark.chakra
+def test_chakra_filter_combinations(chakra_results, search_term):
+    index = FilterBitsets.load(
+        chakra_results,
+        CHAKRA_FILTERS,
+        search_terms=[search_term],
+        date_ranges=[(datetime(2025, 11, 12), datetime(2025, 11, 20, 23, 59, 59))],
+    )
+    choices, counts = index.count_all()
+    print(f"\n[Combinations] {len(counts)} chakra filter combinations over {index.n_docs} docs\n")
+
+    mismatches = index.spot_check(chakra_results, choices, counts, sample=25)
+    assert not mismatches, "\n".join(
+        f"{state.query_string()}: bitsets={expected} mongo={actual}" for state, expected, actual in mismatches
+    )
@@ -0,0 +1,75 @@
+import re
+from datetime import date, datetime
+
+import pytest
+from filter_dsl import APPLICATION_FILTERS, CHAKRA_FILTERS, compile_query
+
+
+#TEST EMPTY / SINGLE / COMBINED FILTERS
+def test_no_filters_compile_to_empty_query():
+    assert APPLICATION_FILTERS.compile() == {}
+    assert APPLICATION_FILTERS.compile(search="  ", challenges=[]) == {}
+
+
+def test_single_filter_is_its_clause():
+    assert APPLICATION_FILTERS.compile(ageBracket="40-50") == {"ageBracket": "40-50"}
+
+
+def test_several_filters_are_anded_in_ui_order():
+    query = APPLICATION_FILTERS.compile(isHealthcareWorker="Yes", ageBracket="40-50")
+    assert query == {"$and": [{"ageBracket": "40-50"}, {"isHealthcareWorker": "Yes"}]}
+
+
+#TEST DIMENSIONS
+def test_search_is_case_insensitive_escaped_or():
+    query = APPLICATION_FILTERS.compile(search=" a.b ")
+    patterns = [clause[name] for clause in query["$or"] for name in clause]
+    assert [name for clause in query["$or"] for name in clause] == ["fullName", "email", "contactNumber", "jobTitle"]
+    assert all(p.pattern == re.escape("a.b") and p.flags & re.IGNORECASE for p in patterns)
+
+
+def test_checkbox_group_is_order_independent():
+    first = APPLICATION_FILTERS.state(challenges=["Physical", "Emotional"])
+    second = APPLICATION_FILTERS.state(challenges=["Emotional", "Physical", "Physical"])
+    assert first == second and first.key == second.key
+    assert first.query() == {"challenges": {"$all": ["Emotional", "Physical"]}}
+
+
+def test_date_range_to_is_end_of_day():
+    query = CHAKRA_FILTERS.compile(createdAt=("2025-11-12", date(2025, 11, 19)))
+    assert query == {"createdAt": {"$gte": datetime(2025, 11, 12), "$lte": datetime(2025, 11, 19, 23, 59, 59)}}
+    assert CHAKRA_FILTERS.compile(createdAt=(None, "2025-11-19")) == {
+        "createdAt": {"$lte": datetime(2025, 11, 19, 23, 59, 59)}
+    }
+
+
+def test_unknown_filter_is_rejected():
+    with pytest.raises(KeyError):
+        CHAKRA_FILTERS.state(isHealthcareWorker="Yes")
+
+
+#TEST UI QUERY STRING / CONTROLS
+def test_query_string_and_controls():
+    state = APPLICATION_FILTERS.state(isHealthcareWorker="Yes", challenges=["Physical", "Emotional"],
+                                      submittedAt=("2025-11-12", None))
+    assert state.query_string() == (
+        "isHealthcareWorker=Yes&challenges=Emotional&challenges=Physical&dateFrom=2025-11-12"
+    )
+    assert state.controls() == [
+        ("input[name='isHealthcareWorker'][value='Yes']", True),
+        ("input[name='challenges'][value='Emotional']", True),
+        ("input[name='challenges'][value='Physical']", True),
+        ("input[name='dateFrom']", "2025-11-12"),
+    ]
+
+
+#TEST CACHE
+def test_key_is_stable_across_states():
+    assert APPLICATION_FILTERS.state(ageBracket="40-50").key == APPLICATION_FILTERS.state(ageBracket="40-50").key
+    assert APPLICATION_FILTERS.state(ageBracket="40-50").key != CHAKRA_FILTERS.state().key
+
+
+def test_mutating_a_compiled_query_does_not_poison_the_cache():
+    state = APPLICATION_FILTERS.state(challenges=["Physical"], ageBracket="40-50")
+    compile_query(state)["$and"][1]["challenges"]["$all"].append("Emotional")
+    assert compile_query(state) == {"$and": [{"ageBracket": "40-50"}, {"challenges": {"$all": ["Physical"]}}]}
@@ -1,21 +1,12 @@
 import pytest
 from datetime import datetime
-import re
+from filter_dsl import APPLICATION_FILTERS
 
 
 #TEST SEARCH FILTER(name/email/phone/jobTitle)
 @pytest.mark.application
 def test_search_filter_count(applications, search_term):
-    pattern = re.compile(search_term, re.IGNORECASE)
-
-    query = {
-        "$or": [
-            {"fullName": pattern},
-            {"email": pattern},
-            {"contactNumber": pattern},
-            {"jobTitle": pattern},
-        ]
-    }
+    query = APPLICATION_FILTERS.compile(search=search_term)
 
     count = applications.count_documents(query)
     print(f"\n[Search] Documents matching '{search_term}': {count}\n")
@@ -26,7 +17,7 @@ def test_search_filter_count(applications, search_term):
 #TEST AGE BRACKET FILTER
 @pytest.mark.application
 def test_age_bracket_count(applications):
-    query = {"ageBracket": "40-50"}
+    query = APPLICATION_FILTERS.compile(ageBracket="40-50")
     count = applications.count_documents(query)
     print(f"\n[Age] Documents with ageBracket '40-50': {count}\n")
 
@@ -37,7 +28,7 @@ def test_age_bracket_count(applications):
 # TEST HEALTHCARE WORKER FILTER
 @pytest.mark.application 
 def test_healthcare_worker_count(applications):
-    query = {"isHealthcareWorker": "Yes"}
+    query = APPLICATION_FILTERS.compile(isHealthcareWorker="Yes")
     count = applications.count_documents(query)
     print(f"\n[HC Worker] Documents with isHealthcareWorker='Yes': {count}\n")
 
@@ -48,7 +39,7 @@ def test_healthcare_worker_count(applications):
 #TEST WORK WITH PRACTITIONER
 @pytest.mark.application
 def test_worked_with_practitioner(applications):
-    query = {"workedWithPractitioner": "Currently working with one"}
+    query = APPLICATION_FILTERS.compile(workedWithPractitioner="Currently working with one")
 
     count = applications.count_documents(query)
     print(f"\n[Practitioner] Docs with workedWithPractitioner='Currently working with one': {count}\n")
@@ -61,11 +52,7 @@ def test_worked_with_practitioner(applications):
 #TEST FAMILUR WITH FILTER 
 @pytest.mark.application
 def test_familiar_with_count(applications):
-    query = {
-        "familiarWith":{
-            "$all": ["Kundalini Yoga", "Life Coaching"]
-        }
-    } 
+    query = APPLICATION_FILTERS.compile(familiarWith=["Kundalini Yoga", "Life Coaching"])
     count = applications.count_documents(query)
     print(f"\n[FamiliarWith] Docs familiar with 'Kundalini Yoga' and 'Life Coaching' : {count}\n")
 
@@ -77,11 +64,7 @@ def test_familiar_with_count(applications):
 # TEST CHALLENGES CHECKBOX FILTER 
 @pytest.mark.application
 def test_challenges_count(applications):
-    query = {
-        "challenges":{
-            "$all": ["Physical", "Emotional"]
-        }
-    }
+    query = APPLICATION_FILTERS.compile(challenges=["Physical", "Emotional"])
     count = applications.count_documents(query)
     print(f"\n[Challenges] Docs with 'Physical' and 'Emotional' challenge: {count}\n")
 
@@ -95,12 +78,7 @@ def test_date_range_filter(applications):
     date_from = datetime(2025, 11, 12)
     date_to = datetime(2025, 11, 19, 23, 59, 59)
 
-    query = {
-        "submittedAt": {
-            "$gte": date_from,
-            "$lte": date_to,
-        }
-    }
+    query = APPLICATION_FILTERS.compile(submittedAt=(date_from, date_to))
 
     count = applications.count_documents(query)
     print(f"\n[Date] Docs submitted between {date_from} and {date_to}: {count}\n")
@@ -112,14 +90,12 @@ def test_date_range_filter(applications):
 #COMBINED FILTER SEARCH 
 @pytest.mark.application
 def test_combined_multiple_filters(applications):
-    query = {
-        "$and": [
-            {"workedWithPractitioner": "Currently working with one"},
-            {"isHealthcareWorker": "Yes"},
-            {"familiarWith": {"$all": ["Life Coaching", "Kundalini Yoga"]}},
-            {"challenges": {"$all": ["Physical", "Emotional"]}}
-        ]
-    }
+    query = APPLICATION_FILTERS.compile(
+        workedWithPractitioner="Currently working with one",
+        isHealthcareWorker="Yes",
+        familiarWith=["Life Coaching", "Kundalini Yoga"],
+        challenges=["Physical", "Emotional"],
+    )
 
     count = applications.count_documents(query)
     print(
@@ -12,6 +12,7 @@ from selenium.webdriver.support import expected_conditions as EC# Pre-built wait
 from selenium.webdriver.common.by import By                     # Locators: By.ID, By.PATH, By.CSS_SELECTOR,...
 from webdriver_manager.chrome import ChromeDriverManager        # Automatically downloads & manages correct ChromeDriver version
 from dotenv import load_dotenv                                  # Loads var from .env file into os.getenv()
+from pymongo import MongoClient                                 # Direct DB access for UI-to-DB verification
 
 # Load environment variables
 load_dotenv()
@@ -92,6 +93,19 @@ def logged_in_driver(driver):
 
     yield driver
 
+"""
+    Database behind the app, for verifying admin tables against their documents
+    Tests using it are skipped when MONGO_URI is not set in .env
+"""
+@pytest.fixture(scope="session")
+def mongo_db():
+    uri = os.getenv("MONGO_URI")
+    if not uri:
+        pytest.skip("MONGO_URI is not set in .env")
+    client = MongoClient(uri)
+    yield client[os.getenv("MONGO_DB_NAME", "bitbybitdevelopment")]
+    client.close()
+
 """
     Provides a WebDriverWait instance for explicit waits
 """
@@ -0,0 +1,212 @@
+"""
+Bulk UI-to-DB verification for the admin result tables.
+
+Instead of checking one id in page_source, read the WHOLE table in one
+execute_script call, fetch the documents of exactly the rows shown (one
+$in query with a tight projection, RawBSONDocument batches, so nothing but
+the shown fields is decoded) and compare the normalized cells column by
+column:
+
+    driver.get("http://localhost:8080/clientmanagement/chakraquiz-results")
+    result = verify_table(driver, mongo_db, CHAKRA_QUIZ_RESULTS)
+    assert result.ok, result.summary()
+
+Columns are taken from the table's own header cells: a header is compared
+when it matches a spec field ("fullName" matches "Full Name") or one of its
+aliases. Pagination and filters don't matter, only the rows on the page
+are looked up.
+"""
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from bson import ObjectId
+from bson.codec_options import CodecOptions
+from bson.errors import InvalidId
+from bson.raw_bson import RawBSONDocument
+
+DB_BATCH_SIZE = 2000
+
+# Returns {headers: [...], rows: [[id, cell, cell, ...], ...]} for the whole table at once
+READ_TABLE_JS = """
+const [tableSel, rowSel, idSel, idAttr] = arguments;
+const table = document.querySelector(tableSel);
+if (!table) { return null; }
+const headers = Array.from(table.querySelectorAll("thead th")).map(th => th.textContent.trim());
+const rows = Array.from(table.querySelectorAll(rowSel)).map(tr => {
+    const idEl = idSel ? tr.querySelector(idSel) : tr;
+    const id = idEl ? idEl.getAttribute(idAttr) : null;
+    return [id].concat(Array.from(tr.querySelectorAll("td")).map(td => td.textContent));
+});
+return {headers: headers, rows: rows};
+"""
+
+
+def _text(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, (list, tuple)):
+        return ", ".join(_text(v) for v in value)
+    return str(value)
+
+
+def normalize(text):
+    """Whitespace-collapsed, lower-cased cell text."""
+    return " ".join(str(text).split()).lower()
+
+
+def field_label(name):
+    """fullName -> "full name", client_email -> "client email" """
+    return normalize(re.sub(r"(?<=[a-z0-9])(?=[A-Z])|_", " ", name))
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """How one admin table maps onto its collection."""
+    path: str
+    collection: str
+    # document fields that may be shown; matched against the table's header cells
+    fields: tuple
+    # {document field: (other header labels, ...)} for headers that don't spell the field name
+    aliases: dict = field(default_factory=dict)
+    id_selector: str = None         # element inside the row carrying the _id (None = the <tr> itself)
+    id_attribute: str = "value"
+    table_selector: str = "table"
+    row_selector: str = "tbody tr"
+    # {document field: callable(value) -> displayed text}, defaults to _text
+    formatters: dict = field(default_factory=dict)
+
+    def field_for(self, header):
+        """The document field a header cell shows, or None."""
+        header = normalize(header)
+        for name in self.fields:
+            if header == field_label(name) or header in (normalize(a) for a in self.aliases.get(name, ())):
+                return name
+        return None
+
+
+@dataclass
+class VerificationResult:
+    rows: int
+    columns: dict           # {header: document field} compared
+    missing_in_db: list
+    mismatched: list        # [(id, [(header, table text, db text), ...])]
+
+    @property
+    def ok(self):
+        return not (self.missing_in_db or self.mismatched)
+
+    def summary(self, limit=5):
+        lines = [f"{self.rows} table rows checked on columns {list(self.columns)}"]
+        if self.missing_in_db:
+            lines.append(f"in table but not in DB ({len(self.missing_in_db)}): {self.missing_in_db[:limit]}")
+        for _id, diffs in self.mismatched[:limit]:
+            lines.append(f"row {_id}: " + "; ".join(f"{h}: table={ui!r} db={db!r}" for h, ui, db in diffs))
+        return "\n".join(lines)
+
+
+def read_table(driver, spec):
+    """
+    Read every row of the table on the current page in one script call.
+    Returns ({header: document field}, {id: {header: cell text}}).
+    """
+    data = driver.execute_script(
+        READ_TABLE_JS, spec.table_selector, spec.row_selector, spec.id_selector, spec.id_attribute
+    )
+    assert data is not None, f"Table '{spec.table_selector}' not found on {driver.current_url}"
+    columns = {}
+    for position, header in enumerate(data["headers"]):
+        name = spec.field_for(header)
+        if name is not None:
+            columns[position] = (header, name)
+    assert columns, f"None of the table headers {data['headers']} match the fields {list(spec.fields)}"
+
+    rows = {}
+    for row in data["rows"]:
+        _id, cells = row[0], row[1:]
+        if _id is None:     # e.g. "No results" placeholder rows
+            continue
+        rows[_id] = {header: cells[p] if p < len(cells) else "" for p, (header, _) in columns.items()}
+    return {header: name for header, name in columns.values()}, rows
+
+
+def _object_id(_id):
+    try:
+        return ObjectId(_id)
+    except (InvalidId, TypeError):
+        return _id
+
+
+def fetch_rows(db, spec, ids, fields):
+    """
+    The documents with the given ids, projected to `fields`.
+    Returns {id: {field: displayed text}}.
+    """
+    raw = db[spec.collection].with_options(codec_options=CodecOptions(document_class=RawBSONDocument))
+    query = {"_id": {"$in": [_object_id(i) for i in ids]}}
+    cursor = raw.find(query, {f: 1 for f in fields}).batch_size(DB_BATCH_SIZE)
+
+    rows = {}
+    for doc in cursor:
+        rows[str(doc["_id"])] = {f: spec.formatters.get(f, _text)(doc.get(f)) for f in fields}
+    return rows
+
+
+def verify_table(driver, db, spec):
+    """Compare the rows on the current page against their documents, cell by cell."""
+    columns, ui_rows = read_table(driver, spec)
+    db_rows = fetch_rows(db, spec, list(ui_rows), sorted(set(columns.values())))
+
+    mismatched = []
+    for _id, cells in ui_rows.items():
+        if _id not in db_rows:
+            continue
+        diffs = [
+            (header, cells[header], db_rows[_id][name])
+            for header, name in columns.items()
+            if normalize(cells[header]) != normalize(db_rows[_id][name])
+        ]
+        if diffs:
+            mismatched.append((_id, diffs))
+    return VerificationResult(
+        rows=len(ui_rows),
+        columns=columns,
+        missing_in_db=sorted(ui_rows.keys() - db_rows.keys()),
+        mismatched=mismatched,
+    )
+
+
+def exists_in_db(db, collection, _id):
+    """Cheap single-id check, e.g. after a delete."""
+    return db[collection].count_documents({"_id": ObjectId(_id)}, limit=1) > 0
+
+
+# ---------------- Admin tables of the app ----------------
+
+CHAKRA_QUIZ_RESULTS = TableSpec(
+    path="/clientmanagement/chakraquiz-results",
+    collection="chakraassessments",
+    fields=("fullName", "email", "focusChakra", "archetype"),
+    aliases={"fullName": ("name",)},
+    id_selector="input[type='checkbox'][name='ids[]']",
+)
+
+APPLICATION_RESULTS = TableSpec(
+    path="/clientmanagement/prequiz-results",
+    collection="applications",
+    fields=("fullName", "email", "contactNumber", "ageBracket"),
+    aliases={"fullName": ("name",), "contactNumber": ("phone", "contact"), "ageBracket": ("age",)},
+    id_selector="input[type='checkbox'][name='ids[]']",
+)
+
+APPOINTMENTS = TableSpec(
+    path="/adminportal/appointments",
+    collection="appointments",
+    fields=("clientName", "clientEmail", "status"),
+    aliases={"clientName": ("client", "name"), "clientEmail": ("email",)},
+    id_selector=".status-dropdown",
+    id_attribute="data-id",
+    row_selector="#allAppointmentsTableBody tr",
+)
@@ -6,6 +6,8 @@ from selenium.webdriver.common.alert import Alert
 from dotenv import load_dotenv
 import os
 
+from table_verifier import CHAKRA_QUIZ_RESULTS, verify_table
+
 import time
 
 load_dotenv()
@@ -88,4 +90,24 @@ def test_delete_energy_leak_results(driver):
     page_source = driver.page_source
 
     # 10. confirm deleted
-    assert deleted_id not in page_source
\ No newline at end of file
+    assert deleted_id not in page_source
+
+
+def test_energy_leak_results_table_matches_db(driver, mongo_db):
+    # 1. Wait for page to load
+    wait = WebDriverWait(driver, 10)
+
+    # 2. Log into Admin Portal
+    admin_login(driver, wait)
+
+    # 3. Go to Energy Leak Results
+    driver.get("http://localhost:8080" + CHAKRA_QUIZ_RESULTS.path)
+    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table")))
+
+    # 4. Compare every row on the page with its document, column by column (one script call + one query)
+    result = verify_table(driver, mongo_db, CHAKRA_QUIZ_RESULTS)
+    print(result.summary())
+
+    # 5. confirm table and DB agree
+    assert result.ok, result.summary()
+
@@ -0,0 +1,202 @@
+"""
+Concurrent booking benchmark: what /appointments/book does when a popular slot opens.
+
+test_book_appointment books one slot through the UI; this replays the same
+request (POST /appointments/book, JSON body with the page's _csrf token) at
+HTTP level from many concurrent clients, each with its own session:
+
+    same       every client races for the same slot, released at the same
+               instant - exactly one 201 is correct, everything else 409
+    different  every client books its own slot - all should succeed
+
+Reported: throughput, latency percentiles, status counts and double
+bookings (more than one 201 for a slot, or the slot listed twice in
+/appointments/available-slots afterwards).
+
+    python booking_bench.py --standin --clients 50 --rounds 5
+    python booking_bench.py https://staging.example.com --mode different --clients 20
+
+It refuses the production app (PRODUCTION_HOSTS). Bookings are made as
+"Selenium Test User", so `python data_registry.py sweep` removes them from
+a staging database. Results are appended to reports/perf/booking_bench.jsonl.
+"""
+import argparse
+import asyncio
+import time
+from dataclasses import asdict, dataclass, field
+from urllib.parse import urlparse
+
+import aiohttp
+
+import perf_run
+from data_registry import RUN_ID
+from seeding import (AVAILABLE_SLOTS_PATH, BOOK_APPOINTMENT_PATH, BOOKING_PAGE_PATH, SeedingUnavailable, check_slots,
+                     extract_csrf, free_slots)
+
+PRODUCTION_HOSTS = {"graceful-living-web-application.onrender.com", "coachshante.com", "www.coachshante.com"}
+JSONL = "booking_bench.jsonl"
+CLIENT_NAME = "Selenium Test User"
+
+
+@dataclass
+class BenchReport:
+    base_url: str
+    mode: str
+    clients: int
+    rounds: int
+    wall_s: float = 0.0
+    latencies_ms: list = field(default_factory=list)
+    statuses: dict = field(default_factory=dict)        # {status: count}
+    double_booked: list = field(default_factory=list)   # ["date time", ...]
+    missing: list = field(default_factory=list)         # 201 but not listed as booked / raced slot nobody got
+
+    def stat(self, pct):
+        return perf_run.percentile(self.latencies_ms, pct) if self.latencies_ms else 0
+
+    @property
+    def ok(self):
+        return not self.double_booked and not self.missing and not any(s >= 500 or s == 0 for s in self.statuses)
+
+    def lines(self):
+        total = len(self.latencies_ms)
+        return [
+            f"{self.mode} slot x {self.clients} clients x {self.rounds} round(s) against {self.base_url}",
+            f"  {total} requests in {self.wall_s:.2f}s = {total / self.wall_s if self.wall_s else 0:.1f} req/s",
+            f"  latency ms: p50 {self.stat(50):.0f}  p95 {self.stat(95):.0f}  p99 {self.stat(99):.0f}  "
+            f"max {max(self.latencies_ms, default=0):.0f}",
+            "  statuses: " + ", ".join(f"{status}={n}" for status, n in sorted(self.statuses.items())),
+            f"  double bookings: {', '.join(self.double_booked) or 'none'}"
+            + (f"; not booked as expected: {', '.join(self.missing)}" if self.missing else ""),
+        ]
+
+    def record(self):
+        data = asdict(self)
+        data.update(requests=len(self.latencies_ms), p50=self.stat(50), p95=self.stat(95), p99=self.stat(99))
+        del data["latencies_ms"]
+        data["statuses"] = {str(k): v for k, v in self.statuses.items()}
+        perf_run.append_jsonl(JSONL, [data])
+
+
+def refuse_production(base_url):
+    host = urlparse(base_url).hostname or ""
+    if host in PRODUCTION_HOSTS:
+        raise SystemExit(f"Refusing to benchmark bookings against production ({host}); use --standin or a staging URL")
+
+
+class Client:
+    """One browser-like visitor: own cookie jar, CSRF token from the booking page."""
+
+    def __init__(self, base_url, index, timeout):
+        self.base_url = base_url
+        self.index = index
+        # unsafe: keep cookies for IP hosts such as the local stand-in
+        self.session = aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar(unsafe=True), timeout=timeout)
+        self.csrf = None
+
+    async def prepare(self):
+        async with self.session.get(self.base_url + BOOKING_PAGE_PATH) as response:
+            self.csrf = extract_csrf(await response.text())
+
+    async def book(self, day, slot, round_):
+        body = {
+            "date": day, "time": slot, "clientName": CLIENT_NAME,
+            "clientEmail": f"selenium+seedbench{self.index}-{round_}.{RUN_ID}@test.com",
+            "clientPhone": "111-555-1234", "_csrf": self.csrf,
+        }
+        start = time.perf_counter()
+        try:
+            async with self.session.post(self.base_url + BOOK_APPOINTMENT_PATH, json=body) as response:
+                await response.read()
+                status = response.status
+        except aiohttp.ClientError:
+            status = 0
+        return status, (time.perf_counter() - start) * 1000
+
+    async def close(self):
+        await self.session.close()
+
+
+async def _slots(session, base_url):
+    async with session.get(base_url + AVAILABLE_SLOTS_PATH) as response:
+        return await response.json(content_type=None)
+
+
+async def run_bench(base_url, mode="same", clients=20, rounds=1, timeout_s=60):
+    report = BenchReport(base_url, mode, clients, rounds)
+    timeout = aiohttp.ClientTimeout(total=timeout_s)
+    async with aiohttp.ClientSession(timeout=timeout) as probe:
+        needed = rounds if mode == "same" else clients * rounds
+        try:
+            slots = check_slots(await _slots(probe, base_url))
+        except (SeedingUnavailable, aiohttp.ContentTypeError, ValueError) as e:
+            raise SystemExit(f"Can't pick slots to book: {e}")
+        targets = free_slots(slots, needed)
+        if len(targets) < needed:
+            raise SystemExit(f"Only {len(targets)} open slot(s), {needed} needed")
+
+        visitors = [Client(base_url, i, timeout) for i in range(clients)]
+        try:
+            await asyncio.gather(*(v.prepare() for v in visitors))
+            wins = {}
+            started = time.perf_counter()
+            for round_ in range(rounds):
+                # every client fires at the same moment, like a slot opening
+                if mode == "same":
+                    plan = [(v, targets[round_]) for v in visitors]
+                else:
+                    plan = [(v, targets[round_ * clients + i]) for i, v in enumerate(visitors)]
+                results = await asyncio.gather(*(v.book(day, slot, round_) for v, (day, slot) in plan))
+                for (_, target), (status, ms) in zip(plan, results):
+                    report.latencies_ms.append(ms)
+                    report.statuses[status] = report.statuses.get(status, 0) + 1
+                    if status in (200, 201):
+                        wins[target] = wins.get(target, 0) + 1
+            report.wall_s = time.perf_counter() - started
+        finally:
+            await asyncio.gather(*(v.close() for v in visitors))
+
+        after = await _slots(probe, base_url)
+        for (day, slot), count in wins.items():
+            listed = after.get("booked", {}).get(day, [])
+            if count > 1 or listed.count(slot) > 1:
+                report.double_booked.append(f"{day} {slot} ({max(count, listed.count(slot))}x)")
+            elif slot not in listed:
+                report.missing.append(f"{day} {slot}")
+        if mode == "same":
+            report.missing += [f"{day} {slot} (no winner)" for day, slot in targets if (day, slot) not in wins]
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrent booking contention / throughput benchmark")
+    parser.add_argument("base_url", nargs="?", help="staging URL (not production); omit with --standin")
+    parser.add_argument("--standin", action="store_true", help="start the local stand-in server and use it")
+    parser.add_argument("--mode", choices=["same", "different", "both"], default="both")
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0, help="stand-in server latency")
+    args = parser.parse_args()
+
+    server = None
+    if args.standin:
+        from standin_server import StandInServer
+        server = StandInServer(latency_ms=args.latency_ms).start()
+        base_url = server.url
+    elif args.base_url:
+        base_url = args.base_url.rstrip("/")
+    else:
+        parser.error("give a staging base_url or --standin")
+    refuse_production(base_url)
+
+    failed = False
+    try:
+        for mode in (["same", "different"] if args.mode == "both" else [args.mode]):
+            result = asyncio.run(run_bench(base_url, mode, args.clients, args.rounds))
+            result.record()
+            for line in result.lines():
+                print(line)
+            failed = failed or not result.ok
+    finally:
+        if server:
+            server.stop()
+    raise SystemExit(1 if failed else 0)
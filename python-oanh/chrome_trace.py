@@ -0,0 +1,259 @@
+"""
+Chrome DevTools performance traces of slow tests (pytest plugin).
+
+A trace (the Performance panel's categories: scripting, style/layout,
+paint, long tasks, network) is recorded with CDP Tracing.start / Tracing.end
+around the test body and saved as reports/traces/<test>.json.gz, which
+loads as-is in chrome://tracing, Perfetto or the DevTools Performance panel.
+
+Which tests are traced:
+
+    --trace-slow            every test; the trace is kept when the body took longer
+                            than trace_slow_seconds (pytest.ini, default 20)
+    (default)               tests whose body took longer than trace_slow_seconds in
+                            the previous run (remembered in the pytest cache);
+                            trace_known_slow = false turns this off
+
+Tracing events only arrive over the DevTools websocket, which Selenium's
+execute_cdp_cmd doesn't expose, so this talks to the browser's
+debuggerAddress directly (websocket-client).
+"""
+import base64
+import gzip
+import html
+import json
+import logging
+import os
+import re
+import time
+from urllib.request import urlopen
+
+import pytest
+
+try:
+    import websocket
+except ImportError:     # websocket-client not installed: no traces
+    websocket = None
+
+try:
+    from pytest_html import extras as html_extras
+except ImportError:
+    html_extras = None
+
+logger = logging.getLogger(__name__)
+
+TRACE_DIR = os.getenv("TRACE_DIR", os.path.join(os.path.dirname(__file__), "reports", "traces"))
+CACHE_KEY = "chrome_trace/slow"
+CATEGORIES = [
+    "-*",
+    "devtools.timeline",
+    "disabled-by-default-devtools.timeline",
+    "disabled-by-default-devtools.timeline.frame",
+    "disabled-by-default-devtools.timeline.stack",
+    "disabled-by-default-v8.cpu_profiler",
+    "v8.execute",
+    "blink",
+    "blink.user_timing",
+    "loading",
+    "latencyInfo",
+    "toplevel",
+]
+
+_drivers = []
+_settings = {"all": False, "threshold": 20.0, "known_slow": set()}
+_durations = {}         # controller: nodeid -> seconds of the test body
+_saved = []             # controller: (nodeid, path)
+_current = []           # traces kept for the current test
+
+
+class CdpSocket:
+    """Minimal CDP client on the browser's DevTools websocket."""
+
+    def __init__(self, debugger_address, timeout=30):
+        with urlopen(f"http://{debugger_address}/json/version", timeout=10) as response:
+            url = json.load(response)["webSocketDebuggerUrl"]
+        # Chrome rejects websocket clients that send an Origin it doesn't know
+        self.ws = websocket.create_connection(url, timeout=timeout, suppress_origin=True)
+        self.next_id = 0
+        self.events = []
+
+    def call(self, method, **params):
+        self.next_id += 1
+        self.ws.send(json.dumps({"id": self.next_id, "method": method, "params": params}))
+        while True:
+            message = json.loads(self.ws.recv())
+            if message.get("id") == self.next_id:
+                if "error" in message:
+                    raise RuntimeError(f"{method}: {message['error'].get('message')}")
+                return message.get("result", {})
+            if "method" in message:
+                self.events.append(message)
+
+    def wait_event(self, method, timeout=60):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            for event in self.events:
+                if event["method"] == method:
+                    self.events.remove(event)
+                    return event["params"]
+            message = json.loads(self.ws.recv())
+            if "method" in message:
+                self.events.append(message)
+        raise TimeoutError(f"no {method} within {timeout}s")
+
+    def close(self):
+        try:
+            self.ws.close()
+        except Exception:
+            pass
+
+
+class Tracer:
+    def __init__(self, driver):
+        self.address = driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+        self.cdp = None
+
+    def start(self):
+        if self.cdp is None:
+            self.cdp = CdpSocket(self.address)
+        self.cdp.call("Tracing.start", transferMode="ReturnAsStream", streamCompression="gzip",
+                      traceConfig={"recordMode": "recordAsMuchAsPossible", "includedCategories": CATEGORIES})
+
+    def stop(self, path=None):
+        """End the trace; write it to `path` (gzipped JSON), or discard it."""
+        self.cdp.call("Tracing.end")
+        complete = self.cdp.wait_event("Tracing.tracingComplete")
+        stream = complete["stream"]
+        try:
+            if path is None:
+                return None
+            chunks = []
+            while True:
+                chunk = self.cdp.call("IO.read", handle=stream, size=1 << 20)
+                data = chunk.get("data", "")
+                chunks.append(base64.b64decode(data) if chunk.get("base64Encoded") else data.encode("utf-8"))
+                if chunk.get("eof"):
+                    break
+            raw = b"".join(chunks)
+            if complete.get("streamCompression") != "gzip" and not raw.startswith(b"\x1f\x8b"):
+                raw = gzip.compress(raw)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(raw)
+            return path
+        finally:
+            self.cdp.call("IO.close", handle=stream)
+
+    def close(self):
+        if self.cdp is not None:
+            self.cdp.close()
+            self.cdp = None
+
+
+def trace_path(nodeid):
+    name = re.sub(r"[^\w.-]+", "_", nodeid).strip("_")[:150]
+    return os.path.join(TRACE_DIR, f"{name}.json.gz")
+
+
+def watch(driver):
+    """Called by the driver fixture: `driver` can be traced."""
+    if websocket is not None:
+        _drivers.append(Tracer(driver))
+    return driver
+
+
+def pytest_addoption(parser):
+    parser.addoption("--trace-slow", action="store_true",
+                     help="record a Chrome trace of every test and keep those slower than trace_slow_seconds")
+    parser.addini("trace_slow_seconds", "test body duration (s) above which a Chrome trace is kept", default="20")
+    parser.addini("trace_known_slow", "trace the tests that were slow in the previous run", type="bool", default=True)
+
+
+def pytest_configure(config):
+    _settings["all"] = config.getoption("--trace-slow")
+    _settings["threshold"] = float(config.getini("trace_slow_seconds"))
+    if config.getini("trace_known_slow") and config.cache is not None:
+        _settings["known_slow"] = set(config.cache.get(CACHE_KEY, []))
+    if _settings["all"] and websocket is None:
+        logger.warning("--trace-slow needs websocket-client (pip install websocket-client); no traces recorded")
+
+
+def _wanted(item):
+    return _settings["all"] or item.nodeid in _settings["known_slow"]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    tracing = []
+    if _wanted(item):
+        for tracer in _drivers:
+            try:
+                tracer.start()
+                tracing.append(tracer)
+            except Exception as e:
+                logger.warning("could not start Chrome trace: %s", e)
+                tracer.close()
+    started = time.perf_counter()
+    yield
+    slow = time.perf_counter() - started >= _settings["threshold"]
+    for index, tracer in enumerate(tracing):
+        path = trace_path(item.nodeid if index == 0 else f"{item.nodeid}-{index}")
+        try:
+            if tracer.stop(path if slow or item.nodeid in _settings["known_slow"] else None):
+                _current.append(path)
+        except Exception as e:
+            logger.warning("could not save Chrome trace: %s", e)
+            tracer.close()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if call.when == "call" and _current:
+        if html_extras is not None:
+            extras = getattr(report, "extras", [])
+            for path in _current:
+                link = os.path.relpath(path, os.path.dirname(os.path.abspath(item.config.option.htmlpath or ".")))
+                extras.append(html_extras.html(
+                    f'<p>Chrome trace: <a href="{html.escape(link)}">{html.escape(os.path.basename(path))}</a> '
+                    "(open in chrome://tracing or the DevTools Performance panel)</p>"
+                ))
+            report.extras = extras
+    if call.when == "teardown":
+        report.user_properties.append(("chrome_traces", json.dumps(_current)))
+        _current.clear()
+
+
+def pytest_runtest_logreport(report):
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    if report.when == "call":
+        _durations[report.nodeid] = report.duration
+    elif report.when == "teardown":
+        for name, value in report.user_properties:
+            if name == "chrome_traces":
+                _saved.extend((report.nodeid, path) for path in json.loads(value))
+
+
+def pytest_sessionfinish(session):
+    for tracer in _drivers:
+        tracer.close()
+    if os.getenv("PYTEST_XDIST_WORKER") or session.config.cache is None or not _durations:
+        return
+    # Slow tests stay known-slow until a run where they are fast again
+    known = set(session.config.cache.get(CACHE_KEY, []))
+    for nodeid, duration in _durations.items():
+        if duration >= _settings["threshold"]:
+            known.add(nodeid)
+        else:
+            known.discard(nodeid)
+    session.config.cache.set(CACHE_KEY, sorted(known))
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _saved:
+        return
+    terminalreporter.write_sep("-", f"Chrome traces ({len(_saved)})")
+    for nodeid, path in _saved:
+        terminalreporter.write_line(f"{nodeid}: {os.path.relpath(path)}")
@@ -18,6 +18,23 @@ import os
 import time                                                      # For sleep/delays
 sys.path.insert(0, os.path.dirname(__file__))
 from helpers import wait_for_page_load                          # Helper function for waiting for page load
+from seeding import HttpSeeder, SeedingUnavailable, make_seeder # Direct (HTTP / local Mongo) test-data seeding
+from data_registry import REGISTRY, cleanup_uri                 # Run-tagged registry of created test data
+from standin_server import StandInServer, parse_route_latency   # Hermetic local stand-in for the app
+from har_proxy import HarProxy                                  # HAR record/replay proxy in front of the app
+import warmup                                                   # Cold-start warmup of the deployed app
+import request_blocking                                         # Third-party request blocking (CDP)
+import profile_template                                         # Pre-warmed Chrome profile (primed HTTP cache)
+import shutil
+import nav_timing                                               # Navigation Timing per page load
+import resource_timing                                          # fetch/XHR timing of the app's API calls
+import web_vitals                                               # LCP / CLS / INP / long tasks on public pages
+import chrome_trace                                             # DevTools traces of slow tests
+import resource_monitor                                         # CPU / RSS of the browser process tree
+
+pytest_plugins = ["request_blocking", "perf_run", "nav_timing", "resource_timing", "perf_budgets", "web_vitals",
+                  "results_store", "steps", "chrome_trace",
+                  "leak_check", "resource_monitor"]
 
 # Load environment variables
 load_dotenv()
@@ -25,6 +42,76 @@ load_dotenv()
 # Base URL for the app
 BASE_URL = os.getenv("TEST_BASE_URL", "https://graceful-living-web-application.onrender.com")
 
+# TEST_STANDIN=1 runs against the local stand-in server instead (see standin_server.py)
+# Each xdist worker gets its own port: STANDIN_PORT + worker number
+USE_STANDIN = os.getenv("TEST_STANDIN") == "1"
+if USE_STANDIN:
+    STANDIN_PORT = int(os.getenv("STANDIN_PORT", "8765")) + int(os.getenv("PYTEST_XDIST_WORKER", "gw0")[2:] or 0)
+    BASE_URL = f"http://127.0.0.1:{STANDIN_PORT}"
+
+# HAR_MODE=record|replay puts the HAR proxy (see har_proxy.py) between the browser and the app
+HAR_MODE = os.getenv("HAR_MODE")
+UPSTREAM_URL = BASE_URL
+if HAR_MODE:
+    HAR_PROXY_PORT = int(os.getenv("HAR_PROXY_PORT", "8775")) + int(os.getenv("PYTEST_XDIST_WORKER", "gw0")[2:] or 0)
+    BASE_URL = f"http://127.0.0.1:{HAR_PROXY_PORT}"
+
+_standin = None
+_har_proxy = None
+
+def pytest_configure(config):
+    # Started here (not in a fixture) so they are up before any fixture touches BASE_URL
+    global _standin, _har_proxy
+    if USE_STANDIN and _standin is None:
+        _standin = StandInServer(
+            port=STANDIN_PORT,
+            latency_ms=float(os.getenv("STANDIN_LATENCY_MS", "0")),
+            route_latency=parse_route_latency(os.getenv("STANDIN_ROUTE_LATENCY", "")),
+        ).start()
+    if HAR_MODE and _har_proxy is None:
+        _har_proxy = HarProxy(
+            UPSTREAM_URL, HAR_MODE, port=HAR_PROXY_PORT, unmatched=os.getenv("HAR_UNMATCHED", "passthrough")
+        ).start()
+
+"""
+    Wake the deployed app up before any browser starts (see warmup.py)
+    Skipped for the stand-in / HAR replay, on xdist workers (the controller
+    already did it) and with WARMUP=0. WARMUP_REQUIRED=1 aborts the run if
+    the backend never gets warm.
+"""
+_warmup_reports = []
+
+def pytest_sessionstart(session):
+    if os.getenv("WARMUP", "1") == "0" or USE_STANDIN or HAR_MODE == "replay" or os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    report = warmup.warm_up(UPSTREAM_URL)
+    warmup.record(report)
+    _warmup_reports.append(report)
+    if not report.warm and os.getenv("WARMUP_REQUIRED") == "1":
+        pytest.exit(report.lines()[0], returncode=3)
+
+def pytest_unconfigure(config):
+    global _standin, _har_proxy
+    for server in (_har_proxy, _standin):
+        if server is not None:
+            server.stop()
+    _standin = _har_proxy = None
+
+"""
+    Record / replay one HAR per test when HAR_MODE is set
+    With HAR_UNMATCHED=fail a request missing from the recording fails the test
+"""
+@pytest.fixture(autouse=True)
+def har_capture(request):
+    if _har_proxy is None:
+        yield None
+        return
+    _har_proxy.begin_test(request.node.nodeid)
+    yield _har_proxy
+    misses = _har_proxy.end_test()
+    if misses and HAR_MODE == "replay" and _har_proxy.unmatched == "fail":
+        pytest.fail(f"{len(misses)} request(s) not in the recording: {misses[:5]}")
+
 @pytest.fixture(scope="session")
 def base_url():
     # Provide BASE_URL to tests
@@ -37,7 +124,7 @@ ADMIN_PASSWORD = os.getenv("TEST_ADMIN_PASSWORD", "changeyou")
 # Create and configure Chrome WebDriver instance
 # This fixture is session-scoped, so it's created once per test session
 @pytest.fixture(scope="session")
-def driver():
+def driver(pytestconfig):
     chrome_options = Options()
 
     # Add options for better compatibility
@@ -46,20 +133,49 @@ def driver():
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
+    if request_blocking.enabled(pytestconfig):
+        request_blocking.enable_performance_log(chrome_options)
 
     # If we want tests to run in headless mode which is no browser window, uncomment the below
     # chrome_options.add_argument("--headless")
 
     # Initialize Chrome driver
     service = Service(ChromeDriverManager().install())
+
+    # PROFILE_TEMPLATE=1 starts from a clone of a profile whose HTTP cache already
+    # holds the app's static assets (see profile_template.py)
+    profile_dir = None
+    if os.getenv("PROFILE_TEMPLATE") == "1":
+        def make_template_driver(user_data_dir):
+            template_options = Options()
+            for arg in ("--no-sandbox", "--disable-dev-shm-usage", "--headless=new", f"--user-data-dir={user_data_dir}"):
+                template_options.add_argument(arg)
+            return webdriver.Chrome(service=service, options=template_options)
+        profile_dir = profile_template.clone_profile(BASE_URL, make_template_driver, ADMIN_USERNAME, ADMIN_PASSWORD)
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+
     driver = webdriver.Chrome(service=service, options=chrome_options)
     driver.maximize_window()
     driver.implicitly_wait(10)
+    # Only the app's host + pytest.ini allowlist when block_third_party is on
+    request_blocking.start_blocking(driver, pytestconfig, BASE_URL)
+    # Navigation Timing after every page load (reports/perf/nav_timing.jsonl)
+    nav_timing.watch(driver)
+    # fetch/XHR timing of every API call (reports/perf/api_timing.json)
+    resource_timing.instrument(driver)
+    # Core Web Vitals of the public pages (web_vitals_routes in pytest.ini)
+    web_vitals.instrument(driver)
+    # Chrome trace of slow tests (--trace-slow, reports/traces)
+    chrome_trace.watch(driver)
+    # CPU / memory of chromedriver + Chrome, summarised per worker with a suggested -n
+    resource_monitor.watch(driver)
 
     yield driver
 
     # Cleanup
     driver.quit()
+    if profile_dir:
+        shutil.rmtree(profile_dir, ignore_errors=True)
 
 """
     Fixture that logs in as admin and returns the driver
@@ -208,6 +324,64 @@ def logged_in_driver(driver):
 
     yield driver
 
+"""
+    Test-data seeding (see seeding.py): preconditions are created through the
+    app's HTTP endpoints, or bulk Mongo inserts when SEED_MONGO_URI is a local DB,
+    instead of multi-step UI flows
+"""
+@pytest.fixture(scope="session")
+def seeder():
+    seeder = make_seeder(BASE_URL, ADMIN_USERNAME, ADMIN_PASSWORD)
+    yield seeder
+    if hasattr(seeder, "close"):
+        seeder.close()
+
+"""
+    Remove everything this run created (see data_registry.py) with one bulk
+    delete per collection once the session is over when CLEANUP_MONGO_URI is
+    set, or through the admin endpoints otherwise (never the shared MONGO_URI)
+    Set CLEANUP_KNOWN_DEBRIS=1 to also sweep fixed test identities from other runs
+"""
+@pytest.fixture(scope="session", autouse=True)
+def test_data_cleanup():
+    if os.getenv("CLEANUP_KNOWN_DEBRIS") == "1":
+        REGISTRY.register_known_debris()
+    yield REGISTRY
+    if os.getenv("KEEP_TEST_DATA") == "1":
+        return
+    uri = cleanup_uri()
+    if uri:
+        report = REGISTRY.cleanup_with_uri(uri, os.getenv("CLEANUP_MONGO_DB", "bitbybitdevelopment"))
+    else:
+        # No database access (HTTP seeding against the deployed app): go through the admin endpoints
+        report = REGISTRY.cleanup_over_http(HttpSeeder(BASE_URL, ADMIN_USERNAME, ADMIN_PASSWORD))
+    _cleanup_reports.append(report)
+
+_cleanup_reports = []
+
+def pytest_terminal_summary(terminalreporter):
+    for report in _warmup_reports:
+        terminalreporter.write_sep("-", "backend warmup")
+        for line in report.lines():
+            terminalreporter.write_line(line)
+    for report in _cleanup_reports:
+        terminalreporter.write_sep("-", "test data cleanup")
+        for line in report.lines():
+            terminalreporter.write_line(line, yellow=not report.complete)
+
+@pytest.fixture
+def seeded_appointments(seeder):
+    # A few appointments on free future slots so status-change tests always have their own rows
+    try:
+        return seeder.appointments(count=3)
+    except SeedingUnavailable as e:
+        pytest.skip(f"Could not seed appointments: {e}")
+
+@pytest.fixture
+def seeded_slide(seeder):
+    # One uniquely named "Selenium Test Slide ..." so edit/delete tests never touch real slides
+    return seeder.carousel_slides(count=1)[0]
+
 """
     Provides a WebDriverWait instance for explicit waits
 """
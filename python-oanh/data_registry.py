@@ -0,0 +1,178 @@
+"""
+Registry of test data created during a run, removed in bulk at session end.
+
+Every record a test run creates is registered with the run id - seeded
+records directly (MongoSeeder tags documents with `testRunId`), UI-created
+ones by a natural key that contains the run id (slide title, client email, ...):
+
+    REGISTRY.register("carousels", {"title": f"Selenium Test Slide {RUN_ID}"}, source=request.node.nodeid)
+
+At session end cleanup() issues ONE delete_many per collection (an `$or`
+of everything registered for it) and returns a report of what was removed.
+Database cleanup only runs when CLEANUP_MONGO_URI is set explicitly (never
+the app's shared MONGO_URI). Without it cleanup_over_http() removes what the
+admin endpoints allow instead and reports what it had to leave behind.
+Either way only this run's records match: registered filters carry the run
+id, the fixed identities below are swept only on request.
+
+Debris left by other suites (python-rafael / python-jocelyn submissions
+with test@example.com / rafael@example.com, ...) can be swept with:
+    python data_registry.py sweep
+"""
+import argparse
+import os
+import re
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+RUN_ID = os.getenv("TEST_RUN_ID") or uuid.uuid4().hex[:12]
+RUN_TAG_FIELD = "testRunId"
+
+# Fixed identities the suites in this repo use when they create data through the UI
+KNOWN_DEBRIS = {
+    "carousels": [{"title": {"$regex": "^Selenium test", "$options": "i"}}],
+    "appointments": [
+        {"clientName": "Selenium Test User"},
+        {"clientEmail": {"$regex": r"^testclient\.admin(\+.*)?@example\.com$"}},
+        {"clientEmail": {"$regex": r"^selenium(\+.*)?@test\.com$"}},
+        {"clientEmail": "rafael@example.com"},
+    ],
+    "applications": [{"email": "test@example.com"}],
+    # python-rafael's assessment journey fills in rafael@example.com
+    "chakraassessments": [{"email": "test@example.com"}, {"email": "rafael@example.com"}],
+}
+
+
+def matches(filter_, record):
+    """Whether `record` matches a registry filter (equality, $regex/$options and $or only)."""
+    for key, condition in filter_.items():
+        if key == "$or":
+            if not any(matches(f, record) for f in condition):
+                return False
+            continue
+        value = record.get(key)
+        if isinstance(condition, dict) and "$regex" in condition:
+            flags = re.IGNORECASE if "i" in condition.get("$options", "") else 0
+            if not isinstance(value, str) or not re.search(condition["$regex"], value, flags):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+def cleanup_uri():
+    return os.getenv("CLEANUP_MONGO_URI")
+
+
+@dataclass
+class CleanupReport:
+    run_id: str
+    deleted: dict = field(default_factory=dict)     # {collection: count}
+    left: list = field(default_factory=list)        # collections that could not be cleaned up
+    skipped: str = ""
+
+    @property
+    def complete(self):
+        return not self.skipped and not self.left
+
+    def lines(self):
+        if self.skipped:
+            return [f"Test data cleanup skipped ({self.skipped})"]
+        total = sum(self.deleted.values())
+        out = [f"Test data cleanup for run {self.run_id}: {total} record(s) removed"]
+        out += [f"  {name:<20} {count:>6}" for name, count in sorted(self.deleted.items())]
+        if self.left:
+            out.append(f"  NOT cleaned up (no admin endpoint, set CLEANUP_MONGO_URI): {', '.join(sorted(self.left))}")
+        return out
+
+
+class TestDataRegistry:
+    """Filters of everything created in this run, grouped by collection."""
+
+    __test__ = False    # not a test class, despite the name
+
+    def __init__(self, run_id=RUN_ID):
+        self.run_id = run_id
+        self.entries = defaultdict(list)    # {collection: [(filter, source)]}
+
+    def register(self, collection, filter_, source=""):
+        self.entries[collection].append((filter_, source))
+
+    def register_run_tag(self, collection, source=""):
+        """Everything in `collection` tagged with this run's id."""
+        self.register(collection, {RUN_TAG_FIELD: self.run_id}, source)
+
+    def register_known_debris(self):
+        for collection, filters in KNOWN_DEBRIS.items():
+            for filter_ in filters:
+                self.register(collection, filter_, source="known debris")
+
+    def filters(self):
+        """{collection: [distinct filters]}"""
+        out = {}
+        for collection, entries in self.entries.items():
+            unique = out.setdefault(collection, [])
+            for filter_, _ in entries:
+                if filter_ not in unique:
+                    unique.append(filter_)
+        return out
+
+    def cleanup(self, db):
+        """One delete_many per collection. Clears the registry."""
+        report = CleanupReport(self.run_id)
+        for collection, unique in self.filters().items():
+            query = unique[0] if len(unique) == 1 else {"$or": unique}
+            report.deleted[collection] = db[collection].delete_many(query).deleted_count
+        self.entries.clear()
+        return report
+
+    def cleanup_over_http(self, seeder):
+        """Fallback without a Mongo URI: seeding.HttpSeeder.remove() per collection. Clears the registry."""
+        if not self.entries:
+            return CleanupReport(self.run_id, skipped="nothing registered")
+        report = CleanupReport(self.run_id)
+        for collection, unique in self.filters().items():
+            removed = seeder.remove(collection, lambda record, unique=unique: any(matches(f, record) for f in unique))
+            if removed is None:
+                report.left.append(collection)
+            else:
+                report.deleted[collection] = removed
+        self.entries.clear()
+        return report
+
+    def cleanup_with_uri(self, uri, db_name):
+        if not self.entries:
+            return CleanupReport(self.run_id, skipped="nothing registered")
+        if not uri:
+            return CleanupReport(self.run_id, skipped="no CLEANUP_MONGO_URI")
+        from pymongo import MongoClient
+
+        client = MongoClient(uri)
+        try:
+            return self.cleanup(client[db_name])
+        finally:
+            client.close()
+
+
+REGISTRY = TestDataRegistry()
+
+
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Remove test data left behind by the Selenium suites")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sweep = sub.add_parser("sweep", help="delete every known test-data pattern (all suites)")
+    sweep.add_argument("--uri", default=cleanup_uri())
+    sweep.add_argument("--db", default=os.getenv("CLEANUP_MONGO_DB", "bitbybitdevelopment"))
+    args = parser.parse_args()
+
+    if args.command == "sweep":
+        if not args.uri:
+            parser.error("sweeping needs database access: set CLEANUP_MONGO_URI or pass --uri")
+        registry = TestDataRegistry(run_id="sweep")
+        registry.register_known_debris()
+        for line in registry.cleanup_with_uri(args.uri, args.db).lines():
+            print(line)
@@ -0,0 +1,85 @@
+"""
+Hooks around every WebDriver command.
+
+install(driver) wraps the driver's `execute` on the instance. Every command
+(driver.get, element clicks, find_element, switch_to, ...) goes through
+it, so measuring plugins can react to commands without touching the tests:
+
+    driver_hooks.add_hook(before=fn, after=fn)   # fn(driver, command, params[, response])
+
+Hooks added with innermost=True run closest to the command: their `before`
+after every other `before`, their `after` before every other `after` - for
+timing the command itself without the other hooks' work.
+
+Commands issued by a hook itself (execute_script, execute_cdp_cmd) don't
+re-enter the hooks. A failing hook is logged and never fails the test.
+"""
+import logging
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+_hooks = []
+_state = threading.local()
+
+
+def add_hook(before=None, after=None, innermost=False):
+    _hooks.append((before, after, innermost))
+
+
+def _ordered(kind):
+    outer = [h for h in _hooks if not h[2]]
+    inner = [h for h in _hooks if h[2]]
+    return outer + inner if kind == "before" else inner + outer
+
+
+def _run(kind, *args):
+    _state.busy = True
+    try:
+        for before, after, _ in _ordered(kind):
+            fn = before if kind == "before" else after
+            if fn is None:
+                continue
+            try:
+                fn(*args)
+            except Exception as e:
+                logger.warning("driver hook %s failed: %s", getattr(fn, "__qualname__", fn), e)
+    finally:
+        _state.busy = False
+
+
+def install(driver):
+    """Route every command of `driver` through the registered hooks (idempotent)."""
+    if getattr(driver, "_hooks_installed", False):
+        return driver
+    original = driver.execute
+
+    def execute(driver_command, params=None):
+        if getattr(_state, "busy", False) or not _hooks:
+            return original(driver_command, params)
+        _run("before", driver, driver_command, params)
+        response = original(driver_command, params)
+        _run("after", driver, driver_command, params, response)
+        return response
+
+    driver.execute = execute
+    driver._hooks_installed = True
+    return driver
+
+
+@contextmanager
+def suspended():
+    """Commands issued inside don't trigger the hooks."""
+    previous = getattr(_state, "busy", False)
+    _state.busy = True
+    try:
+        yield
+    finally:
+        _state.busy = previous
+
+
+def quietly(driver, script, *args):
+    """execute_script from outside a hook without triggering the hooks."""
+    with suspended():
+        return driver.execute_script(script, *args)
@@ -0,0 +1,425 @@
+"""
+HAR record-and-replay reverse proxy for the browser suites.
+
+    HAR_MODE=record pytest      # browser -> proxy -> real app, one HAR per test in HAR_DIR
+    HAR_MODE=replay pytest      # browser -> proxy -> HAR files on disk, no backend at all
+
+The proxy listens on 127.0.0.1 and BASE_URL is pointed at it (see conftest.py).
+Requests are matched on method + path + query + body, after dropping the
+parameters listed in HAR_IGNORE_PARAMS (CSRF tokens, cache busters) and
+masking timestamps. Repeated identical requests replay in recorded order.
+
+Cookie, Set-Cookie and Authorization values and the password/_csrf form
+fields (HAR_REDACT_FIELDS) are redacted before a HAR is written; the matcher
+ignores those fields, so replays still line up.
+
+Requests with no recording either pass through to the upstream app
+(HAR_UNMATCHED=passthrough, the default) or get a 599 and fail the test
+(HAR_UNMATCHED=fail).
+
+The recorded timings are a latency baseline of the real app:
+    python har_proxy.py baseline har/
+"""
+import argparse
+import base64
+import glob
+import json
+import os
+import re
+import statistics
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from http.cookiejar import DefaultCookiePolicy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+import requests
+
+HAR_DIR = os.getenv("HAR_DIR", os.path.join(os.path.dirname(__file__), "har"))
+DEFAULT_IGNORE_PARAMS = ("_csrf", "_", "t", "ts", "timestamp", "cacheBust")
+DEFAULT_REDACT_FIELDS = ("password", "_csrf")
+REDACT_HEADERS = ("cookie", "set-cookie", "authorization", "proxy-authorization")
+REDACTED = "REDACTED"
+UNMATCHED_STATUS = 599
+
+HOP_BY_HOP = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailers",
+    "transfer-encoding", "upgrade", "content-encoding", "content-length", "host",
+    "accept-encoding",  # let requests negotiate what it can decode
+}
+TEXT_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg")
+
+# ISO dates/times and epoch milliseconds inside values
+TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:?\d{2})?|\b1\d{12}\b")
+
+
+def ignore_params():
+    names = os.getenv("HAR_IGNORE_PARAMS")
+    return tuple(n.strip() for n in names.split(",")) if names else DEFAULT_IGNORE_PARAMS
+
+
+def redact_fields():
+    names = os.getenv("HAR_REDACT_FIELDS")
+    return tuple(n.strip() for n in names.split(",")) if names else DEFAULT_REDACT_FIELDS
+
+
+def har_path(nodeid, har_dir=HAR_DIR):
+    """reports/test_x.py::test_y[param] -> <har_dir>/test_x.py__test_y_param_.har"""
+    return os.path.join(har_dir, re.sub(r"[^\w.-]+", "_", nodeid.replace("::", "__")) + ".har")
+
+
+# ---------------- Matching ----------------
+
+def _mask(value):
+    return TIMESTAMP.sub("<ts>", value)
+
+
+def _normalize_pairs(pairs, ignored):
+    return sorted((k, _mask(v)) for k, v in pairs if k not in ignored)
+
+
+def _normalize_json(value, ignored):
+    if isinstance(value, dict):
+        return {k: _normalize_json(v, ignored) for k, v in value.items() if k not in ignored}
+    if isinstance(value, list):
+        return [_normalize_json(v, ignored) for v in value]
+    if isinstance(value, str):
+        return _mask(value)
+    return value
+
+
+def normalize_body(content_type, body, ignored):
+    if not body:
+        return ""
+    content_type = (content_type or "").lower()
+    if "json" in content_type:
+        try:
+            return json.dumps(_normalize_json(json.loads(body), ignored), sort_keys=True)
+        except ValueError:
+            pass
+    if "x-www-form-urlencoded" in content_type:
+        return urlencode(_normalize_pairs(parse_qsl(body, keep_blank_values=True), ignored))
+    if "multipart/form-data" in content_type:
+        # boundaries and file bytes differ per run - match on the method/path only
+        return "<multipart>"
+    return _mask(body)
+
+
+def request_key(method, path, content_type, body, ignored=None):
+    """What two requests must share to be considered the same."""
+    ignored = ignore_params() + redact_fields() if ignored is None else ignored
+    url = urlparse(path)
+    query = urlencode(_normalize_pairs(parse_qsl(url.query, keep_blank_values=True), ignored))
+    return method.upper(), url.path, query, normalize_body(content_type, body, ignored)
+
+
+# ---------------- HAR ----------------
+
+def _redact_cookies(value, set_cookie=False):
+    """a=1; b=2 -> a=REDACTED; b=REDACTED (Set-Cookie: only the value, attributes stay)."""
+    parts = value.split(";")
+    if set_cookie:
+        name = parts[0].split("=", 1)[0]
+        return ";".join([f"{name}={REDACTED}"] + parts[1:])
+    return "; ".join(f"{p.split('=', 1)[0].strip()}={REDACTED}" for p in parts if p.strip())
+
+
+def _headers(pairs):
+    out = []
+    for k, v in pairs:
+        name = k.lower()
+        if name in ("cookie", "set-cookie"):
+            v = _redact_cookies(v, set_cookie=name == "set-cookie")
+        elif name in REDACT_HEADERS:
+            v = REDACTED
+        out.append({"name": k, "value": v})
+    return out
+
+
+def _redact_json(value, fields):
+    if isinstance(value, dict):
+        return {k: REDACTED if k in fields else _redact_json(v, fields) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_redact_json(v, fields) for v in value]
+    return value
+
+
+def redact_body(content_type, body):
+    """Request body text with the HAR_REDACT_FIELDS values replaced."""
+    fields = redact_fields()
+    content_type = (content_type or "").lower()
+    if "json" in content_type:
+        try:
+            return json.dumps(_redact_json(json.loads(body), fields))
+        except ValueError:
+            return body
+    if "x-www-form-urlencoded" in content_type:
+        pairs = parse_qsl(body, keep_blank_values=True)
+        return urlencode([(k, REDACTED if k in fields else v) for k, v in pairs])
+    if "multipart/form-data" in content_type:
+        for name in fields:
+            body = re.sub(r'(name="%s"\r?\n\r?\n)[^\r\n]*' % re.escape(name), r"\g<1>" + REDACTED, body)
+    return body
+
+
+def _content(mime_type, body):
+    if any(mime_type.startswith(t) for t in TEXT_TYPES):
+        return {"size": len(body), "mimeType": mime_type, "text": body.decode("utf-8", "replace")}
+    return {"size": len(body), "mimeType": mime_type, "text": base64.b64encode(body).decode(), "encoding": "base64"}
+
+
+def _body_bytes(content):
+    if content.get("encoding") == "base64":
+        return base64.b64decode(content.get("text", ""))
+    return content.get("text", "").encode()
+
+
+def make_entry(started, url, method, req_headers, req_body, status, reason, resp_headers, resp_body, wait_ms):
+    req_type = dict((k.lower(), v) for k, v in req_headers).get("content-type", "")
+    resp_type = dict((k.lower(), v) for k, v in resp_headers).get("content-type", "application/octet-stream")
+    query = parse_qsl(urlparse(url).query, keep_blank_values=True)
+    entry = {
+        "startedDateTime": started.isoformat(),
+        "time": wait_ms,
+        "request": {
+            "method": method, "url": url, "httpVersion": "HTTP/1.1", "cookies": [],
+            "headers": _headers(req_headers), "queryString": [{"name": k, "value": v} for k, v in query],
+            "headersSize": -1, "bodySize": len(req_body),
+        },
+        "response": {
+            "status": status, "statusText": reason, "httpVersion": "HTTP/1.1", "cookies": [],
+            "headers": _headers(resp_headers), "content": _content(resp_type.split(";")[0], resp_body),
+            "redirectURL": dict((k.lower(), v) for k, v in resp_headers).get("location", ""),
+            "headersSize": -1, "bodySize": len(resp_body),
+        },
+        "cache": {},
+        "timings": {"send": 0, "wait": wait_ms, "receive": 0},
+    }
+    if req_body:
+        text = redact_body(req_type, req_body.decode("utf-8", "replace"))
+        entry["request"]["postData"] = {"mimeType": req_type, "text": text}
+    return entry
+
+
+def write_har(path, entries):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    har = {"log": {"version": "1.2", "creator": {"name": "har_proxy", "version": "1.0"}, "pages": [], "entries": entries}}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(har, f, indent=1)
+
+
+def load_har(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["log"]["entries"]
+
+
+class Recording:
+    """Recorded entries indexed by request_key, replayed in order (last one repeats)."""
+
+    def __init__(self, entries):
+        self.by_key = defaultdict(deque)
+        for entry in entries:
+            request = entry["request"]
+            url = urlparse(request["url"])
+            path = url.path + (f"?{url.query}" if url.query else "")
+            post = request.get("postData") or {}
+            key = request_key(request["method"], path, post.get("mimeType"), post.get("text", ""))
+            self.by_key[key].append(entry)
+
+    def take(self, key):
+        queue = self.by_key.get(key)
+        if not queue:
+            return None
+        return queue.popleft() if len(queue) > 1 else queue[0]
+
+
+# ---------------- Proxy ----------------
+
+class HarProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._handle()
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = do_GET
+
+    def _handle(self):
+        proxy = self.server
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        key = request_key(self.command, self.path, self.headers.get("Content-Type"), body.decode("utf-8", "replace"))
+
+        if proxy.mode == "replay":
+            entry = proxy.recording.take(key) if proxy.recording else None
+            if entry is not None:
+                response = entry["response"]
+                headers = [(h["name"], h["value"]) for h in response["headers"]]
+                return self._respond(
+                    response["status"], response["statusText"], *proxy.localize(headers, _body_bytes(response["content"]))
+                )
+            proxy.misses.append(f"{self.command} {self.path}")
+            if proxy.unmatched == "fail":
+                return self._respond(UNMATCHED_STATUS, "No Recording", [("Content-Type", "text/plain")],
+                                     f"No recorded response for {self.command} {self.path}".encode())
+
+        self._forward(body)
+
+    def _forward(self, body):
+        proxy = self.server
+        headers = {
+            k: proxy.to_upstream(v) for k, v in self.headers.items() if k.lower() not in HOP_BY_HOP
+        }
+        started = datetime.now(timezone.utc)
+        t0 = time.perf_counter()
+        try:
+            upstream = proxy.session.request(
+                self.command, proxy.upstream + self.path, headers=headers, data=body or None,
+                allow_redirects=False, timeout=proxy.timeout,
+            )
+        except requests.RequestException as e:
+            return self._respond(502, "Bad Gateway", [("Content-Type", "text/plain")], str(e).encode())
+        wait_ms = round((time.perf_counter() - t0) * 1000, 1)
+
+        resp_headers = [(k, v) for k, v in upstream.raw.headers.iteritems() if k.lower() not in HOP_BY_HOP]
+        if proxy.mode == "record":
+            # stored as the upstream sent it, so replays work on any proxy port
+            proxy.record(make_entry(
+                started, proxy.upstream + self.path, self.command, list(self.headers.items()), body,
+                upstream.status_code, upstream.reason, resp_headers, upstream.content, wait_ms,
+            ))
+        self._respond(upstream.status_code, upstream.reason, *proxy.localize(resp_headers, upstream.content))
+
+    def _respond(self, status, reason, headers, body):
+        self.send_response(status, reason)
+        for k, v in headers:
+            if k.lower() not in HOP_BY_HOP:
+                self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+
+class HarProxy(ThreadingHTTPServer):
+    """
+    Reverse proxy in front of `upstream`.
+    mode: "record" (forward and save), "replay" (serve from HAR) or "passthrough".
+    """
+
+    daemon_threads = True
+
+    def __init__(self, upstream, mode="record", har_dir=HAR_DIR, port=0, unmatched="passthrough", timeout=90):
+        super().__init__(("127.0.0.1", port), HarProxyHandler)
+        self.upstream = upstream.rstrip("/")
+        self.mode = mode
+        self.har_dir = har_dir
+        self.unmatched = unmatched
+        self.timeout = timeout
+        self.session = requests.Session()
+        # the browser owns the cookies, the proxy just forwards them
+        self.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        self.recording = None
+        self.misses = []
+        self._entries = []
+        self._lock = threading.Lock()
+        self._test = None
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def to_local(self, value):
+        return value.replace(self.upstream, self.url)
+
+    def to_upstream(self, value):
+        return value.replace(self.url, self.upstream)
+
+    def localize(self, headers, body):
+        """Point redirects, cookies and absolute links of an upstream response at the proxy."""
+        out, content_type = [], ""
+        for k, v in headers:
+            if k.lower() == "location":
+                v = self.to_local(v)
+            elif k.lower() == "set-cookie":
+                # the proxy is plain http on 127.0.0.1 (and SameSite=None needs Secure)
+                v = re.sub(r";\s*(Secure|Domain=[^;]*|SameSite=None)(?=;|$)", "", v, flags=re.IGNORECASE)
+            elif k.lower() == "content-type":
+                content_type = v
+            out.append((k, v))
+        if any(content_type.startswith(t) for t in TEXT_TYPES):
+            body = body.replace(self.upstream.encode(), self.url.encode())
+        return out, body
+
+    def record(self, entry):
+        with self._lock:
+            self._entries.append(entry)
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, name="har-proxy", daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    # ---- per test ----
+    def begin_test(self, nodeid):
+        self._test = nodeid
+        self.misses = []
+        with self._lock:
+            self._entries = []
+        if self.mode == "replay":
+            path = har_path(nodeid, self.har_dir)
+            self.recording = Recording(load_har(path)) if os.path.exists(path) else None
+
+    def end_test(self):
+        """Write the test's HAR (record mode). Returns the unmatched requests (replay mode)."""
+        if self.mode == "record" and self._test:
+            with self._lock:
+                entries, self._entries = self._entries, []
+            if entries:
+                write_har(har_path(self._test, self.har_dir), entries)
+        self._test = None
+        return list(self.misses)
+
+
+# ---------------- Baseline ----------------
+
+def baseline(har_dir=HAR_DIR):
+    """{(method, path): [recorded wait ms]} over every HAR in har_dir."""
+    waits = defaultdict(list)
+    for path in glob.glob(os.path.join(har_dir, "*.har")):
+        for entry in load_har(path):
+            url = urlparse(entry["request"]["url"])
+            waits[(entry["request"]["method"], url.path)].append(entry["timings"]["wait"])
+    return waits
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HAR record/replay proxy tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    base = sub.add_parser("baseline", help="recorded latency per route")
+    base.add_argument("har_dir", nargs="?", default=HAR_DIR)
+    serve = sub.add_parser("serve", help="run the proxy by hand")
+    serve.add_argument("upstream")
+    serve.add_argument("--mode", choices=["record", "replay", "passthrough"], default="passthrough")
+    serve.add_argument("--port", type=int, default=8775)
+    args = parser.parse_args()
+
+    if args.command == "baseline":
+        rows = sorted(baseline(args.har_dir).items(), key=lambda kv: -statistics.median(kv[1]))
+        print(f"{'route':<55} {'n':>5} {'median ms':>10} {'max ms':>10}")
+        for (method, path), waits in rows:
+            print(f"{method + ' ' + path:<55} {len(waits):>5} {statistics.median(waits):>10.1f} {max(waits):>10.1f}")
+    else:
+        proxy = HarProxy(args.upstream, args.mode, port=args.port)
+        print(f"Proxying {proxy.url} -> {proxy.upstream} ({args.mode})")
+        try:
+            proxy.serve_forever()
+        except KeyboardInterrupt:
+            proxy.server_close()
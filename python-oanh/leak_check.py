@@ -0,0 +1,162 @@
+"""
+JS heap / DOM node / event listener leak detection for the admin pages (pytest plugin).
+
+The session-scoped driver keeps one page context for the whole run, and the
+admin pages re-create iframes and tables on every tab click. A leak check
+repeats such a navigation loop and samples CDP Performance.getMetrics after
+a forced GC on every iteration:
+
+    check = LeakCheck(driver, "content-management tabs")
+    for _ in range(leak_iterations):
+        switch_all_tabs()
+        check.sample()
+    check.assert_no_leak()
+
+A metric is flagged when it grows on (nearly) every iteration after the
+warmup AND by more than its threshold overall; one-off growth such as a
+cache filling up is not a leak.
+
+Tests marked `leak` only run with --leak-check[=N] (N iterations, default 10).
+Results go to the terminal and reports/perf/leak_check.jsonl.
+"""
+import json
+import os
+from dataclasses import asdict, dataclass
+
+import pytest
+
+import perf_run
+
+JSONL = "leak_check.jsonl"
+DEFAULT_ITERATIONS = 10
+WARMUP = 2              # first iterations fill caches / lazy modules
+MONOTONIC_SHARE = 0.8   # share of iteration-to-iteration steps that must grow
+
+# metric -> growth over the loop that counts as a leak
+THRESHOLDS = {
+    "JSHeapUsedSize": 2 * 1024 * 1024,
+    "Nodes": 200,
+    "JSEventListeners": 50,
+    "Documents": 3,
+    "Frames": 3,
+}
+
+_results = []           # this process, current test
+_run_results = []       # controller: whole run
+
+
+@dataclass
+class MetricTrend:
+    metric: str
+    first: float
+    last: float
+    growth: float
+    per_iteration: float
+    monotonic: float    # share of growing steps after warmup
+    leaking: bool
+
+    def line(self):
+        unit = " KiB" if self.metric == "JSHeapUsedSize" else ""
+        scale = 1024 if unit else 1
+        flag = "LEAK" if self.leaking else "ok"
+        return (f"{self.metric:<17} {self.first / scale:>10.0f}{unit} -> {self.last / scale:>10.0f}{unit}  "
+                f"{self.per_iteration / scale:+9.1f}/iter  growing {self.monotonic:>4.0%}  {flag}")
+
+
+def get_metrics(driver):
+    """Performance.getMetrics after a forced GC, as {name: value}."""
+    driver.execute_cdp_cmd("HeapProfiler.collectGarbage", {})
+    metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    return {m["name"]: m["value"] for m in metrics if m["name"] in THRESHOLDS}
+
+
+def slope(values):
+    """Least-squares growth per iteration."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mean_x, mean_y = (n - 1) / 2.0, sum(values) / n
+    num = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    den = sum((x - mean_x) ** 2 for x in range(n))
+    return num / den
+
+
+def trend(metric, values, warmup=WARMUP):
+    steady = values[warmup:] if len(values) > warmup + 2 else values
+    steps = list(zip(steady, steady[1:]))
+    monotonic = sum(1 for a, b in steps if b > a) / len(steps) if steps else 0.0
+    growth = steady[-1] - steady[0]
+    leaking = monotonic >= MONOTONIC_SHARE and growth > THRESHOLDS[metric]
+    return MetricTrend(metric, steady[0], steady[-1], growth, slope(steady), monotonic, leaking)
+
+
+class LeakCheck:
+    def __init__(self, driver, name, warmup=WARMUP):
+        self.driver = driver
+        self.name = name
+        self.warmup = warmup
+        self.samples = []
+        driver.execute_cdp_cmd("Performance.enable", {})
+
+    def sample(self):
+        self.samples.append(get_metrics(self.driver))
+
+    def trends(self):
+        metrics = [m for m in THRESHOLDS if all(m in s for s in self.samples)]
+        return [trend(m, [s[m] for s in self.samples], self.warmup) for m in metrics]
+
+    def assert_no_leak(self):
+        trends = self.trends()
+        _results.append({"test": perf_run.current_test(), "loop": self.name, "iterations": len(self.samples),
+                         "trends": [asdict(t) for t in trends]})
+        leaks = [t for t in trends if t.leaking]
+        assert not leaks, f"{self.name}: growth across {len(self.samples)} iterations\n" + "\n".join(
+            t.line() for t in leaks
+        )
+
+
+def pytest_addoption(parser):
+    parser.addoption("--leak-check", nargs="?", type=int, const=DEFAULT_ITERATIONS, default=None, metavar="N",
+                     help="run the `leak` tests with N navigation iterations (default %d)" % DEFAULT_ITERATIONS)
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--leak-check"):
+        return
+    skip = pytest.mark.skip(reason="leak check: run with --leak-check[=N]")
+    for item in items:
+        if "leak" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def leak_iterations(pytestconfig):
+    return pytestconfig.getoption("--leak-check") or DEFAULT_ITERATIONS
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when == "teardown":
+        outcome.get_result().user_properties.append(("leak_check", json.dumps(_results)))
+        _results.clear()
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown" or os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    for name, value in report.user_properties:
+        if name == "leak_check":
+            _run_results.extend(json.loads(value))
+
+
+def pytest_sessionfinish(session):
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        perf_run.append_jsonl(JSONL, _run_results)
+
+
+def pytest_terminal_summary(terminalreporter):
+    for result in _run_results:
+        terminalreporter.write_sep("-", f"leak check: {result['loop']} ({result['iterations']} iterations)")
+        for t in result["trends"]:
+            terminalreporter.write_line(MetricTrend(**t).line())
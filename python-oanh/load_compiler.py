@@ -0,0 +1,296 @@
+"""
+Turn a recorded browser journey into an asyncio load scenario, and run it.
+
+1. Record one run of a journey through the HAR proxy (see har_proxy.py):
+
+    HAR_MODE=record pytest "test_appointment_management.py::TestAppointmentManagement::test_book_appointment"
+
+2. Compile the HAR into a scenario (JSON, meant to be reviewed and kept):
+
+    python load_compiler.py compile har/test_appointment_management.py__...har -o scenarios/booking.json
+
+   Static assets are dropped. CSRF tokens become {{csrf}}, which is filled
+   from the last HTML page the virtual user loaded. Emails, names, phones,
+   usernames and passwords become variables; passwords are never written
+   out, only read from TEST_ADMIN_USERNAME / TEST_ADMIN_PASSWORD at run time.
+   Use --param FIELD to turn more body fields into variables, e.g. date and time.
+
+3. Run it with ramp-up and steady-state phases:
+
+    python load_compiler.py run scenarios/booking.json --base-url http://127.0.0.1:8765 \\
+        --users 20 --ramp 30 --steady 60 [--data users.json]
+
+   Each virtual user has its own cookie jar and loops the journey. --data is
+   a JSON list of {variable: value} rows, one per virtual user (cycled).
+   Latency percentiles per step and phase are printed and appended to
+   reports/perf/load_runs.jsonl. Production hosts are refused.
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import time
+from collections import defaultdict
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+import aiohttp
+
+import perf_run
+from booking_bench import refuse_production
+from data_registry import RUN_ID
+from har_proxy import REDACTED, load_har
+from nav_timing import route_of
+from seeding import extract_csrf
+
+JSONL = "load_runs.jsonl"
+STATIC = re.compile(r"(^/static/|^/favicon|\.(css|js|mjs|map|png|jpe?g|gif|svg|ico|webp|woff2?|ttf|eot)$)", re.I)
+CSRF_FIELDS = ("_csrf",)
+CSRF_HEADERS = ("csrf-token", "x-csrf-token")
+KEEP_HEADERS = ("content-type", "accept", "x-requested-with") + CSRF_HEADERS
+# body field -> variable
+PARAM_FIELDS = {
+    "email": "email", "clientEmail": "email",
+    "name": "name", "clientName": "name",
+    "phone": "phone", "clientPhone": "phone",
+    "username": "username", "password": "password",
+}
+# recorded values are kept as defaults, except these
+RUNTIME_DEFAULTS = {
+    "email": "selenium+seedload{{vu}}-{{iteration}}.{{run_id}}@test.com",
+    "username": "env:TEST_ADMIN_USERNAME",
+    "password": "env:TEST_ADMIN_PASSWORD",
+}
+TEMPLATE = re.compile(r"\{\{(\w+)\}\}")
+
+
+# ---------------- Compiling ----------------
+
+def _parameterize(fields, variables, extra_params, csrf_values):
+    """[(key, value)] with CSRF tokens / known fields replaced by {{placeholders}}."""
+    out = []
+    for key, value in fields:
+        if key in CSRF_FIELDS:
+            csrf_values.add(value)
+            value = "{{csrf}}"
+        elif key in PARAM_FIELDS or key in extra_params:
+            name = PARAM_FIELDS.get(key, key)
+            variables.setdefault(name, RUNTIME_DEFAULTS.get(name, value))
+            value = "{{%s}}" % name
+        out.append([key, value])
+    return out
+
+
+def compile_har(entries, name, extra_params=(), keep_static=False):
+    variables = {}
+    csrf_values = set()
+    steps = []
+    previous_end = None
+    for entry in sorted(entries, key=lambda e: e["startedDateTime"]):
+        request, response = entry["request"], entry["response"]
+        url = urlparse(request["url"])
+        if not keep_static and STATIC.search(url.path):
+            continue
+        started = datetime.fromisoformat(entry["startedDateTime"].replace("Z", "+00:00")).timestamp() * 1000
+        headers = {h["name"].lower(): h["value"] for h in request.get("headers", []) if h["name"].lower() in KEEP_HEADERS}
+        for header in CSRF_HEADERS:
+            if header in headers:
+                csrf_values.add(headers[header])
+                headers[header] = "{{csrf}}"
+        step = {
+            "name": f"{request['method']} {route_of(request['url'])}",
+            "method": request["method"],
+            "path": url.path + (f"?{url.query}" if url.query else ""),
+            "headers": headers,
+            "expect": response["status"],
+            "think_ms": max(0, round(started - previous_end)) if previous_end is not None else 0,
+        }
+        post = request.get("postData")
+        if post and post.get("text"):
+            mime = post.get("mimeType", "")
+            if mime.startswith("application/json"):
+                body = json.loads(post["text"])
+                if isinstance(body, dict):
+                    body = dict(_parameterize(body.items(), variables, extra_params, csrf_values))
+                step["json"] = body
+            elif mime.startswith("application/x-www-form-urlencoded"):
+                step["form"] = _parameterize(parse_qsl(post["text"], keep_blank_values=True), variables, extra_params,
+                                             csrf_values)
+            else:
+                step["raw"] = post["text"]
+        steps.append(step)
+        previous_end = started + (entry.get("time") or 0)
+
+    # tokens can also sit inside multipart bodies (redacted ones included)
+    csrf_values.add(REDACTED)
+    for step in steps:
+        for value in csrf_values:
+            if "raw" in step and value:
+                step["raw"] = step["raw"].replace(value, "{{csrf}}")
+    return {"name": name, "recorded_at": datetime.now().isoformat(timespec="seconds"), "variables": variables,
+            "steps": steps}
+
+
+# ---------------- Running ----------------
+
+def render(value, context):
+    if isinstance(value, str):
+        return TEMPLATE.sub(lambda m: str(context.get(m.group(1), m.group(0))), value)
+    if isinstance(value, list):
+        return [render(v, context) for v in value]
+    if isinstance(value, dict):
+        return {k: render(v, context) for k, v in value.items()}
+    return value
+
+
+def vu_context(scenario, vu, iteration, data_rows):
+    context = {"vu": vu, "iteration": iteration, "run_id": RUN_ID, "csrf": ""}
+    row = data_rows[vu % len(data_rows)] if data_rows else {}
+    for name, default in scenario["variables"].items():
+        value = row.get(name, default)
+        if isinstance(value, str) and value.startswith("env:"):
+            value = os.getenv(value[4:], "")
+        context[name] = value
+    # variables may refer to vu / iteration / run_id
+    return {k: render(v, context) for k, v in context.items()}
+
+
+class LoadRun:
+    def __init__(self, scenario, base_url, users, ramp_s, steady_s, think=1.0, max_think_ms=5000, data_rows=None,
+                 timeout_s=60):
+        self.scenario = scenario
+        self.base_url = base_url.rstrip("/")
+        self.users = users
+        self.ramp_s = ramp_s
+        self.steady_s = steady_s
+        self.think = think
+        self.max_think_ms = max_think_ms
+        self.data_rows = data_rows or []
+        self.timeout = aiohttp.ClientTimeout(total=timeout_s)
+        self.samples = []       # (phase, step, ms, ok)
+        self.iterations = defaultdict(int)
+        self.start = None
+
+    def phase(self):
+        return "ramp" if time.monotonic() - self.start < self.ramp_s else "steady"
+
+    async def _request(self, session, step, context):
+        kwargs = {"headers": render(step["headers"], context), "allow_redirects": False}
+        if "json" in step:
+            kwargs["data"] = json.dumps(render(step["json"], context))
+            kwargs["headers"].setdefault("content-type", "application/json")
+        elif "form" in step:
+            kwargs["data"] = urlencode(render(step["form"], context))
+            kwargs["headers"].setdefault("content-type", "application/x-www-form-urlencoded")
+        elif "raw" in step:
+            kwargs["data"] = render(step["raw"], context).encode("utf-8")
+        phase = self.phase()
+        started = time.perf_counter()
+        try:
+            async with session.request(step["method"], self.base_url + render(step["path"], context), **kwargs) as response:
+                body = await response.read()
+                ok = response.status == step["expect"]
+                if "text/html" in response.headers.get("content-type", ""):
+                    context["csrf"] = extract_csrf(body.decode("utf-8", "replace")) or context["csrf"]
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            ok = False
+        self.samples.append((phase, step["name"], (time.perf_counter() - started) * 1000, ok))
+
+    async def virtual_user(self, vu, deadline):
+        await asyncio.sleep(self.ramp_s * vu / max(self.users, 1))
+        iteration = 0
+        while time.monotonic() < deadline:
+            context = vu_context(self.scenario, vu, iteration, self.data_rows)
+            async with aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar(unsafe=True), timeout=self.timeout) as session:
+                for step in self.scenario["steps"]:
+                    if time.monotonic() >= deadline:
+                        return
+                    if step["think_ms"] and self.think:
+                        await asyncio.sleep(min(step["think_ms"], self.max_think_ms) * self.think / 1000)
+                    await self._request(session, step, context)
+            self.iterations[self.phase()] += 1
+            iteration += 1
+
+    async def run(self):
+        self.start = time.monotonic()
+        deadline = self.start + self.ramp_s + self.steady_s
+        await asyncio.gather(*(self.virtual_user(vu, deadline) for vu in range(self.users)))
+        return self.summary()
+
+    def summary(self):
+        grouped = defaultdict(list)
+        for phase, step, ms, ok in self.samples:
+            grouped[(phase, step)].append((ms, ok))
+        rows = []
+        for (phase, step), items in sorted(grouped.items()):
+            latencies = [ms for ms, _ in items]
+            rows.append({
+                "phase": phase, "step": step, "count": len(items), "errors": sum(1 for _, ok in items if not ok),
+                "p50": perf_run.percentile(latencies, 50), "p95": perf_run.percentile(latencies, 95),
+                "p99": perf_run.percentile(latencies, 99), "max": max(latencies),
+            })
+        steady = [s for s in self.samples if s[0] == "steady"]
+        return {
+            "scenario": self.scenario["name"], "base_url": self.base_url, "users": self.users,
+            "ramp_s": self.ramp_s, "steady_s": self.steady_s,
+            "steady_rps": len(steady) / self.steady_s if self.steady_s else None,
+            "steady_iterations": self.iterations["steady"], "steps": rows,
+        }
+
+
+def print_summary(summary):
+    print(f"{summary['scenario']}: {summary['users']} users, ramp {summary['ramp_s']}s, steady {summary['steady_s']}s "
+          f"against {summary['base_url']}")
+    if summary["steady_rps"] is not None:
+        print(f"steady state: {summary['steady_rps']:.1f} req/s, {summary['steady_iterations']} journeys completed")
+    print(f"{'phase':<7} {'step':<50} {'n':>6} {'err':>5} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7}")
+    for r in summary["steps"]:
+        print(f"{r['phase']:<7} {r['step']:<50} {r['count']:>6} {r['errors']:>5} {r['p50']:>7.0f} {r['p95']:>7.0f} "
+              f"{r['p99']:>7.0f} {r['max']:>7.0f}")
+
+
+if __name__ == "__main__":
+    # before the parser is built: --base-url defaults to TEST_BASE_URL, which may come from .env
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+    parser = argparse.ArgumentParser(description="Compile recorded journeys into load scenarios and run them")
+    sub = parser.add_subparsers(dest="command", required=True)
+    comp = sub.add_parser("compile", help="HAR file -> scenario JSON")
+    comp.add_argument("har")
+    comp.add_argument("-o", "--output", required=True)
+    comp.add_argument("--name", help="scenario name (default: output file name)")
+    comp.add_argument("--param", action="append", default=[], help="also turn this body field into a variable")
+    comp.add_argument("--keep-static", action="store_true", help="keep CSS/JS/image requests")
+    run = sub.add_parser("run", help="run a scenario")
+    run.add_argument("scenario")
+    run.add_argument("--base-url", default=os.getenv("TEST_BASE_URL"), required=not os.getenv("TEST_BASE_URL"))
+    run.add_argument("--users", type=int, default=10)
+    run.add_argument("--ramp", type=float, default=30, help="seconds to start all users")
+    run.add_argument("--steady", type=float, default=60, help="seconds at full load")
+    run.add_argument("--think", type=float, default=1.0, help="scale of the recorded think times (0 = none)")
+    run.add_argument("--data", help="JSON list of per-user variable rows")
+    args = parser.parse_args()
+
+    if args.command == "compile":
+        scenario = compile_har(load_har(args.har), args.name or os.path.splitext(os.path.basename(args.output))[0],
+                               extra_params=args.param, keep_static=args.keep_static)
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(scenario, f, indent=1)
+        print(f"{len(scenario['steps'])} steps, variables: {', '.join(scenario['variables']) or 'none'} -> {args.output}")
+    else:
+        refuse_production(args.base_url)
+        with open(args.scenario, encoding="utf-8") as f:
+            scenario = json.load(f)
+        rows = None
+        if args.data:
+            with open(args.data, encoding="utf-8") as f:
+                rows = json.load(f)
+        summary = asyncio.run(LoadRun(scenario, args.base_url, args.users, args.ramp, args.steady, args.think,
+                                      data_rows=rows).run())
+        perf_run.append_jsonl(JSONL, [summary])
+        print_summary(summary)
@@ -0,0 +1,230 @@
+"""
+Navigation Timing for every page load the suites make (pytest plugin).
+
+The suites open nearly every route of the app, so they double as a free
+performance probe. After each driver.get / refresh / back / forward the
+page's PerformanceNavigationTiming entry is read (via driver_hooks, no test
+changes):
+
+    dns, connect, tls, ttfb, server, dom_content_loaded, load,
+    transfer_size, decoded_body_size     (ms / bytes)
+
+Navigations started by a click or key press are only measured with
+nav_timing_clicks = true (pytest.ini) or NAV_TIMING_CLICKS=1: finding out
+whether one happened costs an alert check and a script before the next
+interaction, which would slow down the suite being measured.
+
+Samples are stored per route (ids normalized: /carousel/:id/edit) and per
+test, appended to reports/perf/nav_timing.jsonl (history across runs) and
+summarised as a per-route table in the terminal and the HTML report.
+"""
+import html
+import json
+import os
+import re
+import time
+from collections import defaultdict
+from urllib.parse import urlparse
+
+import pytest
+from selenium.common.exceptions import NoAlertPresentException
+from selenium.webdriver.remote.command import Command
+
+import driver_hooks
+import perf_run
+
+JSONL = "nav_timing.jsonl"
+LOAD_WAIT_S = 5
+
+NAV_COMMANDS = {Command.GET, Command.REFRESH, Command.GO_BACK, Command.GO_FORWARD}
+MAYBE_NAV_COMMANDS = {Command.CLICK_ELEMENT, Command.SEND_KEYS_TO_ELEMENT}
+METRICS = ("dns", "connect", "tls", "ttfb", "server", "dom_content_loaded", "load", "transfer_size", "decoded_body_size")
+
+NAV_TIMING_JS = """
+const n = performance.getEntriesByType("navigation")[0];
+if (!n) { return null; }
+return {
+    url: location.href, timeOrigin: performance.timeOrigin, readyState: document.readyState, type: n.type,
+    dns: n.domainLookupEnd - n.domainLookupStart,
+    connect: n.connectEnd - n.connectStart,
+    tls: n.secureConnectionStart > 0 ? n.connectEnd - n.secureConnectionStart : 0,
+    ttfb: n.responseStart - n.startTime,
+    server: n.responseStart - n.requestStart,
+    dom_content_loaded: n.domContentLoadedEventEnd - n.startTime,
+    load: n.loadEventEnd - n.startTime,
+    loadEventEnd: n.loadEventEnd,
+    transfer_size: n.transferSize,
+    decoded_body_size: n.decodedBodySize
+};
+"""
+
+_samples = []           # this process, current test
+_run_samples = []       # everything reported this run (controller side)
+_listeners = []
+_settings = {"clicks": False}
+
+
+def add_listener(fn):
+    """fn(sample) is called for every navigation sample as it is taken."""
+    _listeners.append(fn)
+
+
+def route_of(url):
+    path = urlparse(url).path or "/"
+    path = re.sub(r"/[0-9a-fA-F]{24}(?=/|$)", "/:id", path)
+    return re.sub(r"/\d+(?=/|$)", "/:n", path)
+
+
+def alert_open(driver):
+    try:
+        driver.switch_to.alert.text
+        return True
+    except NoAlertPresentException:
+        return False
+
+
+def _probe(driver, trigger):
+    if trigger == "click" and alert_open(driver):
+        # running a script now would dismiss the confirm()/alert() the test is about to handle
+        return None
+    driver._nav_pending = False
+    deadline = time.time() + LOAD_WAIT_S
+    while True:
+        timing = driver.execute_script(NAV_TIMING_JS)
+        if not timing or timing["timeOrigin"] == getattr(driver, "_nav_last_origin", None):
+            return None     # no navigation happened (or already recorded)
+        if timing["readyState"] == "complete" and timing["loadEventEnd"] > 0:
+            break
+        if time.time() > deadline:
+            return None
+        time.sleep(0.1)
+    driver._nav_last_origin = timing["timeOrigin"]
+    sample = {"test": perf_run.current_test(), "route": route_of(timing["url"]), "url": timing["url"],
+              "trigger": trigger, "type": timing["type"]}
+    sample.update({m: round(timing[m], 1) for m in METRICS})
+    _samples.append(sample)
+    for listener in _listeners:
+        listener(sample)
+    return sample
+
+
+def pytest_addoption(parser):
+    parser.addini("nav_timing_clicks", "also time navigations started by clicks / key presses", type="bool",
+                  default=False)
+
+
+def pytest_configure(config):
+    env = os.getenv("NAV_TIMING_CLICKS")
+    _settings["clicks"] = env == "1" if env is not None else config.getini("nav_timing_clicks")
+
+
+def _before_command(driver, command, params):
+    if getattr(driver, "_nav_pending", False) and (command in NAV_COMMANDS or command in MAYBE_NAV_COMMANDS):
+        _probe(driver, "click")
+
+
+def _after_command(driver, command, params, response):
+    if command in NAV_COMMANDS:
+        _probe(driver, command)
+    elif command in MAYBE_NAV_COMMANDS and _settings["clicks"]:
+        driver._nav_pending = True
+
+
+driver_hooks.add_hook(before=_before_command, after=_after_command)
+
+_drivers = []
+
+
+def watch(driver):
+    """Called by the driver fixture: hook the driver's commands."""
+    driver_hooks.install(driver)
+    _drivers.append(driver)
+    return driver
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    yield
+    # a click at the very end of the test may have navigated
+    for driver in _drivers:
+        if getattr(driver, "_nav_pending", False):
+            try:
+                with driver_hooks.suspended():
+                    _probe(driver, "click")
+            except Exception:
+                driver._nav_pending = False
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when == "teardown":
+        report = outcome.get_result()
+        report.user_properties.append(("nav_timing", json.dumps(_samples)))
+        _samples.clear()
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown" or os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    for name, value in report.user_properties:
+        if name == "nav_timing":
+            _run_samples.extend(json.loads(value))
+
+
+def route_table(samples):
+    """[(route, n, ttfb p50, dcl p50, load p50, load p95, transfer KiB p50)] slowest first."""
+    by_route = defaultdict(list)
+    for s in samples:
+        by_route[s["route"]].append(s)
+    rows = []
+    for route, items in by_route.items():
+        p = lambda m, pct: perf_run.percentile([i[m] for i in items], pct)
+        rows.append((route, len(items), p("ttfb", 50), p("dom_content_loaded", 50), p("load", 50), p("load", 95),
+                     p("transfer_size", 50) / 1024))
+    return sorted(rows, key=lambda r: -r[5])
+
+
+def _history_p50():
+    """{route: p50 load of previous runs}"""
+    loads = defaultdict(list)
+    for record in perf_run.read_jsonl(JSONL):
+        if record.get("run_id") != perf_run.RUN_ID:
+            loads[record["route"]].append(record["load"])
+    return {route: perf_run.percentile(values, 50) for route, values in loads.items()}
+
+
+def pytest_sessionfinish(session):
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        perf_run.append_jsonl(JSONL, _run_samples)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _run_samples:
+        return
+    history = _history_p50()
+    terminalreporter.write_sep("-", "navigation timing per route (ms)")
+    terminalreporter.write_line(
+        f"{'route':<42} {'n':>4} {'ttfb p50':>9} {'dcl p50':>8} {'load p50':>9} {'load p95':>9} {'KiB':>7} {'prev p50':>9}"
+    )
+    for route, n, ttfb, dcl, load, load95, kib in route_table(_run_samples):
+        prev = history.get(route)
+        terminalreporter.write_line(
+            f"{route:<42} {n:>4} {ttfb:>9.0f} {dcl:>8.0f} {load:>9.0f} {load95:>9.0f} {kib:>7.1f} "
+            f"{prev if prev is not None else '-':>9}"
+        )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    if not _run_samples:
+        return
+    rows = "".join(
+        f"<tr><td>{html.escape(route)}</td><td>{n}</td><td>{ttfb:.0f}</td><td>{dcl:.0f}</td>"
+        f"<td>{load:.0f}</td><td>{load95:.0f}</td><td>{kib:.1f}</td></tr>"
+        for route, n, ttfb, dcl, load, load95, kib in route_table(_run_samples)
+    )
+    prefix.append(
+        "<h2>Navigation timing per route (ms)</h2><table><tr><th>Route</th><th>n</th><th>TTFB p50</th>"
+        f"<th>DCL p50</th><th>Load p50</th><th>Load p95</th><th>KiB p50</th></tr>{rows}</table>"
+    )
@@ -0,0 +1,196 @@
+"""
+Declarative performance budgets, enforced while the suites run (pytest plugin).
+
+perf_budgets.json maps routes, API calls and named timers to thresholds:
+
+    "routes": {"/booking": {"load": {"p95": 2000}}}                 Navigation Timing metrics
+    "api":    {"/appointments/available*": {"duration": {"max": 500}}}   fetch/XHR calls (resource_timing)
+    "timers": {"appointments table ready": {"max": 3000}}           budget_timer() blocks
+
+`max` is checked against every sample as it is taken, `p50` / `p95` over
+the whole run. Tests measure their normal flows:
+
+    with budget_timer("appointments table ready"):
+        WebDriverWait(driver, 15).until(...)
+
+Breaches are listed as "performance failures", apart from functional
+failures. They only fail the run with --perf-strict (or
+perf_budgets_strict = true in pytest.ini).
+"""
+import fnmatch
+import html
+import json
+import os
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+
+import pytest
+
+import nav_timing
+import perf_run
+import resource_timing
+
+DEFAULT_BUDGET_FILE = os.path.join(os.path.dirname(__file__), "perf_budgets.json")
+STATS = {"p50": 50, "p95": 95}
+
+@dataclass
+class Breach:
+    kind: str           # route | api | timer
+    name: str           # route / URL path / timer name
+    metric: str
+    stat: str           # max | p50 | p95
+    limit: float
+    value: float
+    test: str = None
+
+    def line(self):
+        where = f" in {self.test}" if self.test else ""
+        return f"{self.kind} {self.name} {self.metric} {self.stat} = {self.value:.0f} ms > {self.limit:.0f} ms{where}"
+
+
+class Budgets:
+    def __init__(self, data):
+        self.sections = {kind: data.get(section, {}) for kind, section in
+                         (("route", "routes"), ("api", "api"), ("timer", "timers"))}
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            return cls({})
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def rules(self, kind, name):
+        """[(metric, stat, limit)] of every pattern matching `name`."""
+        out = []
+        for pattern, metrics in self.sections[kind].items():
+            if kind == "timer":
+                # timers are {stat: limit} directly
+                metrics = {"duration": metrics}
+            if (pattern == name if kind == "timer" else fnmatch.fnmatchcase(name, pattern)):
+                for metric, limits in metrics.items():
+                    out += [(metric, stat, float(limit)) for stat, limit in limits.items()]
+        return out
+
+    def __bool__(self):
+        return any(self.sections.values())
+
+
+BUDGETS = Budgets({})
+_samples = []           # this process, current test: [kind, name, metric, value, test]
+_breaches = []          # this process, current test: per-sample (max) breaches
+_run_samples = []       # controller: all samples of the run
+_run_breaches = []      # controller: all breaches of the run
+
+
+def record(kind, name, metric, value):
+    """Add a measurement; `max` budgets are checked right away."""
+    test = perf_run.current_test()
+    _samples.append([kind, name, metric, value, test])
+    for rule_metric, stat, limit in BUDGETS.rules(kind, name):
+        if rule_metric == metric and stat == "max" and value > limit:
+            _breaches.append(Breach(kind, name, metric, stat, limit, value, test))
+
+
+@contextmanager
+def budget_timer(name):
+    """Time the block as timer `name`.
+
+    Only recorded when the block completes: a wait that times out (and ends
+    in skip / fail) is a functional failure, not a budget breach.
+    """
+    start = time.perf_counter()
+    yield
+    record("timer", name, "duration", (time.perf_counter() - start) * 1000)
+
+
+def _on_navigation(sample):
+    for metric, _, _ in BUDGETS.rules("route", sample["route"]):
+        if metric in sample:
+            record("route", sample["route"], metric, sample[metric])
+
+
+def _on_api_call(call):
+    for metric, _, _ in BUDGETS.rules("api", call["path"]):
+        if call.get(metric) is not None:
+            record("api", call["path"], metric, call[metric])
+
+
+nav_timing.add_listener(_on_navigation)
+resource_timing.add_listener(_on_api_call)
+
+
+def pytest_addoption(parser):
+    parser.addoption("--perf-strict", action="store_true", help="fail the run when a performance budget is breached")
+    parser.addini("perf_budgets", "performance budget file", default=DEFAULT_BUDGET_FILE)
+    parser.addini("perf_budgets_strict", "fail the run when a performance budget is breached", type="bool", default=False)
+
+
+def pytest_configure(config):
+    global BUDGETS
+    path = config.getini("perf_budgets")
+    if not os.path.isabs(path):
+        path = os.path.join(str(config.rootpath), path)
+    BUDGETS = Budgets.load(path)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when == "teardown":
+        report = outcome.get_result()
+        report.user_properties.append(("perf_samples", json.dumps(_samples)))
+        report.user_properties.append(("perf_breaches", json.dumps([asdict(b) for b in _breaches])))
+        _samples.clear()
+        _breaches.clear()
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown" or os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    for name, value in report.user_properties:
+        if name == "perf_samples":
+            _run_samples.extend(json.loads(value))
+        elif name == "perf_breaches":
+            _run_breaches.extend(Breach(**b) for b in json.loads(value))
+
+
+def session_breaches(samples):
+    """p50/p95 breaches over all samples of the run."""
+    values = defaultdict(list)
+    for kind, name, metric, value, _ in samples:
+        values[(kind, name, metric)].append(value)
+    out = []
+    for (kind, name, metric), vals in values.items():
+        for rule_metric, stat, limit in BUDGETS.rules(kind, name):
+            if rule_metric == metric and stat in STATS:
+                measured = perf_run.percentile(vals, STATS[stat])
+                if measured > limit:
+                    out.append(Breach(kind, name, metric, f"{stat} of {len(vals)}", limit, measured))
+    return out
+
+
+def pytest_sessionfinish(session):
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    _run_breaches.extend(session_breaches(_run_samples))
+    strict = session.config.getoption("--perf-strict") or session.config.getini("perf_budgets_strict")
+    if strict and _run_breaches and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _run_breaches:
+        return
+    terminalreporter.write_sep("=", f"performance failures ({len(_run_breaches)})", red=True)
+    for breach in _run_breaches:
+        terminalreporter.write_line(breach.line())
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix):
+    if _run_breaches:
+        items = "".join(f"<li>{html.escape(b.line())}</li>" for b in _run_breaches)
+        prefix.append(f"<h2>Performance failures ({len(_run_breaches)})</h2><ul>{items}</ul>")
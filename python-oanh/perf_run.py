@@ -0,0 +1,60 @@
+"""
+Shared bookkeeping for the performance plugins (pytest plugin).
+
+    RUN_ID          one id per test run (same as the test-data registry)
+    current_test()  node id of the test running right now, or None
+    append_jsonl()  add records to reports/perf/<name>.jsonl, which grows across runs
+"""
+import json
+import math
+import os
+from datetime import datetime
+
+import pytest
+
+from data_registry import RUN_ID
+
+PERF_DIR = os.getenv("PERF_DIR", os.path.join(os.path.dirname(__file__), "reports", "perf"))
+
+_current = {"test": None}
+
+
+def current_test():
+    return _current["test"]
+
+
+def perf_path(name):
+    return os.path.join(PERF_DIR, name)
+
+
+def append_jsonl(name, records):
+    """Append dict records (tagged with run id and timestamp) to PERF_DIR/name."""
+    if not records:
+        return
+    os.makedirs(PERF_DIR, exist_ok=True)
+    at = datetime.now().isoformat(timespec="seconds")
+    with open(perf_path(name), "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(dict(record, run_id=RUN_ID, at=at)) + "\n")
+
+
+def read_jsonl(name):
+    path = perf_path(name)
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    _current["test"] = item.nodeid
+    yield
+    _current["test"] = None
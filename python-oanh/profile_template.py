@@ -0,0 +1,158 @@
+"""
+Pre-warmed Chrome profile template with a primed static-asset cache.
+
+A fresh Chrome starts with an empty HTTP cache and re-downloads the app's
+CSS, JS and images every session. With PROFILE_TEMPLATE=1 the driver
+fixture instead:
+
+    1. builds a template --user-data-dir ONCE (per BASE_URL, refreshed after
+       PROFILE_TEMPLATE_MAX_AGE_H hours) by visiting the app's routes,
+       logged out and logged in, then scrubs cookies/storage/history so
+       only the caches are left,
+    2. clones it for every driver (cp --reflink=auto, so copy-on-write on
+       filesystems that support it, a plain copy elsewhere).
+
+Building is guarded by a file lock, so parallel xdist workers wait for the
+first one instead of building their own.
+"""
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+
+import warmup
+
+TEMPLATE_ROOT = os.getenv("PROFILE_TEMPLATE_DIR", os.path.join(tempfile.gettempdir(), "selenium-profile-template"))
+MAX_AGE_H = float(os.getenv("PROFILE_TEMPLATE_MAX_AGE_H", "24"))
+STAMP = "template.json"
+
+# Mutable per-session state removed from the template (paths relative to the profile)
+SCRUB = [
+    "Default/Cookies", "Default/Cookies-journal", "Default/Network/Cookies", "Default/Network/Cookies-journal",
+    "Default/Local Storage", "Default/Session Storage", "Default/IndexedDB", "Default/Service Worker",
+    "Default/Sessions", "Default/Current Session", "Default/Current Tabs", "Default/Last Session", "Default/Last Tabs",
+    "Default/History", "Default/History-journal", "Default/Login Data", "Default/Login Data-journal",
+    "SingletonLock", "SingletonCookie", "SingletonSocket",
+]
+# Left behind by a running Chrome, must never be cloned
+SINGLETONS = ["SingletonLock", "SingletonCookie", "SingletonSocket"]
+
+
+@contextmanager
+def file_lock(path, timeout=600):
+    """Exclusive lock across processes (xdist workers)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as handle:
+        try:
+            import fcntl
+        except ImportError:     # Windows
+            import msvcrt
+
+            deadline = time.time() + timeout
+            while True:
+                try:
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    if time.time() > deadline:
+                        raise TimeoutError(f"Could not lock {path}")
+                    time.sleep(0.5)
+            try:
+                yield
+            finally:
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            return
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def template_dir(base_url):
+    key = "".join(c if c.isalnum() else "_" for c in base_url.split("://")[-1]).strip("_")
+    return os.path.join(TEMPLATE_ROOT, key)
+
+
+def _is_fresh(path, base_url):
+    stamp = os.path.join(path, STAMP)
+    if not os.path.exists(stamp):
+        return False
+    with open(stamp, encoding="utf-8") as f:
+        info = json.load(f)
+    return info.get("base_url") == base_url and time.time() - info.get("built_at", 0) < MAX_AGE_H * 3600
+
+
+def _scrub(path):
+    for rel in SCRUB:
+        target = os.path.join(path, rel)
+        if os.path.isdir(target):
+            shutil.rmtree(target, ignore_errors=True)
+        elif os.path.exists(target) or os.path.islink(target):
+            os.remove(target)
+
+
+def _visit(driver, base_url, routes, username=None, password=None):
+    from selenium.webdriver.common.by import By
+
+    for route in routes:
+        driver.get(base_url + route)
+    if username and password:
+        driver.get(base_url + "/login")
+        driver.find_element(By.NAME, "username").send_keys(username)
+        driver.find_element(By.NAME, "password").send_keys(password)
+        driver.find_element(By.CSS_SELECTOR, "button.login_button[type='submit']").click()
+        time.sleep(2)
+        for route in routes:
+            driver.get(base_url + route)
+
+
+def build_template(base_url, make_driver, username=None, password=None, routes=None):
+    """
+    Build the template profile for base_url with a driver from make_driver(user_data_dir).
+    Returns the template path.
+    """
+    path = template_dir(base_url)
+    building = path + ".building"
+    shutil.rmtree(building, ignore_errors=True)
+    os.makedirs(building)
+    driver = make_driver(building)
+    try:
+        _visit(driver, base_url.rstrip("/"), routes or warmup.extract_routes(), username, password)
+    finally:
+        # quit() lets Chrome flush its cache index to disk
+        driver.quit()
+    _scrub(building)
+    with open(os.path.join(building, STAMP), "w", encoding="utf-8") as f:
+        json.dump({"base_url": base_url, "built_at": time.time()}, f)
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(building, path)
+    return path
+
+
+def ensure_template(base_url, make_driver, username=None, password=None):
+    """The template for base_url, built (once, under a lock) if missing or stale."""
+    path = template_dir(base_url)
+    with file_lock(path + ".lock"):
+        if not _is_fresh(path, base_url):
+            build_template(base_url, make_driver, username, password)
+    return path
+
+
+def clone_profile(base_url, make_driver, username=None, password=None):
+    """A private copy of the (warmed) template to pass as --user-data-dir."""
+    template = ensure_template(base_url, make_driver, username, password)
+    clone = tempfile.mkdtemp(prefix="selenium-profile-")
+    try:
+        subprocess.run(["cp", "-a", "--reflink=auto", template + "/.", clone], check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError):
+        shutil.rmtree(clone, ignore_errors=True)
+        shutil.copytree(template, clone, symlinks=True, dirs_exist_ok=True)
+    for name in SINGLETONS:
+        target = os.path.join(clone, name)
+        if os.path.lexists(target):
+            os.remove(target)
+    return clone
@@ -0,0 +1,207 @@
+"""
+Third-party request blocking for the browser suites (pytest plugin).
+
+Public pages pull fonts, analytics and external assets the tests never
+assert on. With blocking on, only the app's own host and the hosts in the
+suite's allowlist (pytest.ini) are loaded:
+
+    [pytest]
+    block_third_party = true
+    third_party_allowlist =
+        cdn.jsdelivr.net
+
+The allowlist is enforced at request time: CDP Fetch.enable pauses every
+request and Fetch.requestPaused either continues it (allowed host) or fails
+it with BlockedByClient, so a foreign host is blocked the first time it
+appears. Those events only arrive over the DevTools websocket, which
+Selenium's execute_cdp_cmd doesn't expose, so a thread answers them on the
+browser's debuggerAddress (websocket-client, see chrome_trace.CdpSocket).
+
+Without websocket-client only Network.setBlockedURLs with the well-known
+patterns below is possible; that is a denylist, and a warning says so.
+
+Blocked requests are counted per page (from the performance log) and per
+host. Nothing is fetched to estimate their size: that would contact the
+very hosts being blocked.
+"""
+import json
+import logging
+import os
+import threading
+from collections import defaultdict
+from urllib.parse import urlparse
+
+import pytest
+
+from chrome_trace import CdpSocket, websocket
+
+logger = logging.getLogger(__name__)
+
+# Fonts, analytics, tag managers, ads and social widgets (denylist fallback only)
+KNOWN_THIRD_PARTY = [
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*", "*google-analytics.com*", "*googletagmanager.com*",
+    "*doubleclick.net*", "*googlesyndication.com*", "*facebook.net*", "*facebook.com/tr*",
+    "*hotjar.com*", "*clarity.ms*", "*use.typekit.net*", "*use.fontawesome.com*",
+]
+
+
+def pytest_addoption(parser):
+    parser.addini("block_third_party", "block requests to hosts other than the app and the allowlist", type="bool", default=False)
+    parser.addini("third_party_allowlist", "hosts (and their subdomains) the browser may still load", type="linelist", default=[])
+
+
+def enabled(config):
+    env = os.getenv("BLOCK_THIRD_PARTY")
+    return env == "1" if env is not None else config.getini("block_third_party")
+
+
+def enable_performance_log(chrome_options):
+    """Blocked requests are attributed to their page from the performance log."""
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def _pattern_host(pattern):
+    """Host part of a KNOWN_THIRD_PARTY pattern: "*facebook.com/tr*" -> "facebook.com"."""
+    return pattern.strip("*").split("/")[0].split("*")[0]
+
+
+class RequestBlocker:
+    """Answers the driver's paused requests from the allowlist and counts what it blocked."""
+
+    def __init__(self, driver, app_url, allowlist=()):
+        self.driver = driver
+        self.app_host = urlparse(app_url).hostname
+        self.allowlist = [h.lower() for h in allowlist]
+        self.cdp = None
+        self.enforced = False
+        self._lock = threading.Lock()
+        self._blocked_ids = set()   # Network requestIds failed by the blocker, not yet attributed to a page
+        self.urls = {}              # requestId -> (page path, url)
+        self.hosts = defaultdict(int)   # {host: blocked requests}
+        # {page path: {"requests": n, "urls": {url, ...}}}
+        self.blocked = defaultdict(lambda: {"requests": 0, "urls": set()})
+
+    def allowed(self, host):
+        host = (host or "").lower()
+        if not host or host == self.app_host:
+            return True
+        return any(host == a or host.endswith("." + a) for a in self.allowlist)
+
+    def patterns(self):
+        """Denylist for Network.setBlockedURLs, when the allowlist can't be enforced."""
+        return [p for p in KNOWN_THIRD_PARTY if not self.allowed(_pattern_host(p))]
+
+    def enable(self):
+        address = self.driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+        if websocket is not None and address:
+            try:
+                self.cdp = CdpSocket(address)
+                self.cdp.call("Fetch.enable", patterns=[{"urlPattern": "*", "requestStage": "Request"}])
+                threading.Thread(target=self._serve, name="request-blocker", daemon=True).start()
+                self.enforced = True
+                return
+            except Exception as e:
+                logger.warning("Could not enforce the third-party allowlist (%s); using the denylist only", e)
+                self.close()
+        else:
+            logger.warning("Third-party allowlist needs websocket-client (pip install websocket-client); "
+                           "using the denylist only")
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns()})
+
+    def _serve(self):
+        """Continue or fail every paused request until the browser goes away."""
+        ws = self.cdp.ws
+        pending = list(self.cdp.events)     # anything that arrived while Fetch.enable was answered
+        next_id = 1 << 20   # clear of CdpSocket.call's ids
+        while True:
+            if pending:
+                message = pending.pop(0)
+            else:
+                try:
+                    message = json.loads(ws.recv())
+                except websocket.WebSocketTimeoutException:
+                    continue
+                except Exception:
+                    return
+            if message.get("method") != "Fetch.requestPaused":
+                continue
+            params = message["params"]
+            url = params["request"]["url"]
+            host = urlparse(url).hostname if url.startswith("http") else None
+            next_id += 1
+            if self.allowed(host):
+                command = {"id": next_id, "method": "Fetch.continueRequest", "params": {"requestId": params["requestId"]}}
+            else:
+                command = {"id": next_id, "method": "Fetch.failRequest",
+                           "params": {"requestId": params["requestId"], "errorReason": "BlockedByClient"}}
+                with self._lock:
+                    if params.get("networkId"):
+                        self._blocked_ids.add(params["networkId"])
+            try:
+                ws.send(json.dumps(command))
+            except Exception:
+                return
+
+    def harvest(self):
+        """Attribute the requests blocked so far to their pages and hosts, from the performance log."""
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                page = urlparse(params.get("documentURL", "")).path or "/"
+                self.urls[params["requestId"]] = (page, params["request"]["url"])
+            elif method == "Network.loadingFailed":
+                with self._lock:
+                    failed_here = params["requestId"] in self._blocked_ids
+                    self._blocked_ids.discard(params["requestId"])
+                if failed_here or params.get("blockedReason") == "inspector":
+                    page, url = self.urls.get(params["requestId"], ("?", ""))
+                    self.blocked[page]["requests"] += 1
+                    self.blocked[page]["urls"].add(url)
+                    self.hosts[urlparse(url).hostname or "?"] += 1
+
+    def close(self):
+        if self.cdp is not None:
+            self.cdp.close()
+            self.cdp = None
+
+
+_blockers = []
+
+
+def start_blocking(driver, config, app_url):
+    """Called by the driver fixture right after the browser starts."""
+    if not enabled(config):
+        return None
+    blocker = RequestBlocker(driver, app_url, config.getini("third_party_allowlist"))
+    blocker.enable()
+    _blockers.append(blocker)
+    return blocker
+
+
+@pytest.fixture(autouse=True)
+def _harvest_blocked_requests():
+    yield
+    for blocker in _blockers:
+        try:
+            blocker.harvest()
+        except Exception:
+            # the driver may already be gone
+            pass
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _blockers:
+        return
+    terminalreporter.write_sep("-", "third-party requests blocked")
+    for blocker in _blockers:
+        blocker.close()
+        mode = "allowlist" if blocker.enforced else "denylist only"
+        total_requests = sum(blocker.hosts.values())
+        terminalreporter.write_line(
+            f"{total_requests} request(s) blocked ({mode}); hosts: "
+            f"{', '.join(f'{h} ({n})' for h, n in sorted(blocker.hosts.items(), key=lambda kv: -kv[1])) or '-'}"
+        )
+        for page, stats in sorted(blocker.blocked.items(), key=lambda kv: -kv[1]["requests"]):
+            terminalreporter.write_line(f"  {page:<40} {stats['requests']:>5} req")
@@ -0,0 +1,209 @@
+"""
+CPU / memory of each worker's browser process tree, for sizing -n (pytest plugin).
+
+A background thread samples the chromedriver process and everything under
+it (Chrome browser, renderers, GPU, utility processes) every
+RESOURCE_SAMPLE_S seconds (default 0.5):
+
+    cpu   % of one core, summed over the tree (200 = two cores busy)
+    rss   MiB, summed over the tree (overcounts shared pages a little)
+
+Summarised per test (peak RSS, mean / peak CPU) and per worker, appended to
+reports/perf/resources.jsonl, and turned into a worker-count suggestion:
+
+    memory: RAM available at session start * 0.85 / (peak tree RSS + pytest process)
+    cpu:    logical cores * 0.85 / p95 CPU of one worker's tree
+
+The smaller of the two is the suggested `-n`. Swap activity during the run
+is reported too, since that is what slows CI runners down before an OOM.
+"""
+import json
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+
+import perf_run
+
+try:
+    import psutil
+except ImportError:     # psutil not installed: no monitoring
+    psutil = None
+
+JSONL = "resources.jsonl"
+INTERVAL_S = float(os.getenv("RESOURCE_SAMPLE_S", "0.5"))
+HEADROOM = 0.85
+MIB = 1024 * 1024
+
+_monitors = []
+_test_start = {"at": None}
+_run_tests = []         # controller: per-test summaries of every worker
+_machine = {}           # controller: machine state at start / end
+
+
+class ResourceMonitor(threading.Thread):
+    """Samples the process tree under `pid` until stop()."""
+
+    def __init__(self, pid, interval=INTERVAL_S):
+        super().__init__(name=f"resource-monitor-{pid}", daemon=True)
+        self.root = psutil.Process(pid)
+        self.interval = interval
+        self.samples = []       # (monotonic time, cpu %, rss bytes, processes)
+        self._procs = {}
+        self._halt = threading.Event()
+
+    def _tree(self):
+        try:
+            procs = [self.root] + self.root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return []
+        # keep Process objects across samples: cpu_percent() is measured since the previous call
+        for proc in procs:
+            self._procs.setdefault(proc.pid, proc)
+        return [self._procs[p.pid] for p in procs]
+
+    def sample(self):
+        cpu, rss, count = 0.0, 0, 0
+        for proc in self._tree():
+            try:
+                cpu += proc.cpu_percent(None)
+                rss += proc.memory_info().rss
+                count += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self._procs.pop(proc.pid, None)
+        self.samples.append((time.monotonic(), cpu, rss, count))
+
+    def run(self):
+        while not self._halt.wait(self.interval):
+            self.sample()
+
+    def stop(self):
+        self._halt.set()
+
+    def window(self, since):
+        return [s for s in self.samples if s[0] >= since]
+
+
+def watch(driver):
+    """Called by the driver fixture: sample chromedriver and its Chrome processes."""
+    if psutil is None:
+        return driver
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is None:
+        return driver
+    monitor = ResourceMonitor(process.pid)
+    monitor.start()
+    _monitors.append(monitor)
+    return driver
+
+
+def summarise(samples):
+    if not samples:
+        return None
+    cpus = [s[1] for s in samples]
+    return {
+        "samples": len(samples),
+        "peak_rss_mb": max(s[2] for s in samples) / MIB,
+        "cpu_avg": sum(cpus) / len(cpus),
+        "cpu_p95": perf_run.percentile(cpus, 95),
+        "cpu_peak": max(cpus),
+        "processes": max(s[3] for s in samples),
+    }
+
+
+def suggest_workers(per_worker, available_bytes, cores):
+    """(suggested, memory limit, cpu limit) from per-worker peak RSS / p95 CPU."""
+    peak_rss = max(w["peak_rss_mb"] + w.get("pytest_rss_mb", 0) for w in per_worker) * MIB
+    cpu = max(w["cpu_p95"] for w in per_worker)
+    by_memory = max(1, math.floor(available_bytes * HEADROOM / peak_rss)) if peak_rss else None
+    by_cpu = max(1, math.floor(cores * 100 * HEADROOM / cpu)) if cpu else None
+    limits = [n for n in (by_memory, by_cpu) if n]
+    return (min(limits) if limits else None), by_memory, by_cpu
+
+
+def pytest_configure(config):
+    if psutil is not None and not os.getenv("PYTEST_XDIST_WORKER"):
+        vm, swap = psutil.virtual_memory(), psutil.swap_memory()
+        _machine.update(cores=psutil.cpu_count(), total=vm.total, available=vm.available,
+                        swap_in=swap.sin, swap_out=swap.sout)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    _test_start["at"] = time.monotonic()
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when != "teardown" or not _monitors or _test_start["at"] is None:
+        return
+    samples = [s for monitor in _monitors for s in monitor.window(_test_start["at"])]
+    summary = summarise(samples)
+    if summary:
+        summary.update(test=item.nodeid, worker=os.getenv("PYTEST_XDIST_WORKER", "main"),
+                       pytest_rss_mb=psutil.Process().memory_info().rss / MIB)
+        outcome.get_result().user_properties.append(("resources", json.dumps(summary)))
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown" or os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    for name, value in report.user_properties:
+        if name == "resources":
+            _run_tests.append(json.loads(value))
+
+
+def per_worker(tests):
+    grouped = defaultdict(list)
+    for t in tests:
+        grouped[t["worker"]].append(t)
+    return {
+        worker: {
+            "tests": len(items),
+            "peak_rss_mb": max(t["peak_rss_mb"] for t in items),
+            "cpu_avg": sum(t["cpu_avg"] * t["samples"] for t in items) / max(1, sum(t["samples"] for t in items)),
+            "cpu_p95": perf_run.percentile([t["cpu_p95"] for t in items], 95),
+            "pytest_rss_mb": max(t["pytest_rss_mb"] for t in items),
+        }
+        for worker, items in grouped.items()
+    }
+
+
+def pytest_sessionfinish(session):
+    for monitor in _monitors:
+        monitor.stop()
+    if os.getenv("PYTEST_XDIST_WORKER") or not _run_tests:
+        return
+    swap = psutil.swap_memory()
+    _machine.update(swap_in_mb=(swap.sin - _machine["swap_in"]) / MIB, swap_out_mb=(swap.sout - _machine["swap_out"]) / MIB)
+    perf_run.append_jsonl(JSONL, _run_tests)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _run_tests:
+        return
+    workers = per_worker(_run_tests)
+    terminalreporter.write_sep("-", "browser resources per worker")
+    terminalreporter.write_line(f"{'worker':<8} {'tests':>5} {'peak RSS MiB':>12} {'cpu avg %':>9} {'cpu p95 %':>9} {'pytest MiB':>10}")
+    for worker, w in sorted(workers.items()):
+        terminalreporter.write_line(
+            f"{worker:<8} {w['tests']:>5} {w['peak_rss_mb']:>12.0f} {w['cpu_avg']:>9.0f} {w['cpu_p95']:>9.0f} {w['pytest_rss_mb']:>10.0f}"
+        )
+    terminalreporter.write_line("heaviest tests:")
+    for t in sorted(_run_tests, key=lambda t: -t["peak_rss_mb"])[:5]:
+        terminalreporter.write_line(f"  {t['peak_rss_mb']:>6.0f} MiB  cpu peak {t['cpu_peak']:>4.0f}%  {t['test']}")
+    suggested, by_memory, by_cpu = suggest_workers(list(workers.values()), _machine["available"], _machine["cores"])
+    terminalreporter.write_line(
+        f"suggested workers: -n {suggested} (memory allows {by_memory}, cpu allows {by_cpu}; "
+        f"{_machine['cores']} cores, {_machine['available'] / MIB / 1024:.1f} GiB available at start)"
+    )
+    if _machine.get("swap_in_mb", 0) > 1 or _machine.get("swap_out_mb", 0) > 1:
+        terminalreporter.write_line(
+            f"swap used during the run: {_machine['swap_in_mb']:.0f} MiB in / {_machine['swap_out_mb']:.0f} MiB out - "
+            "fewer workers", yellow=True
+        )
@@ -0,0 +1,231 @@
+"""
+Fetch/XHR timing for the app's in-page API calls (pytest plugin).
+
+The booking calendar, time slots, status changes, stats refresh and
+/appointments/book all go through fetch(). A wrapper around fetch and
+XMLHttpRequest is injected at document start (CDP
+Page.addScriptToEvaluateOnNewDocument). For every call it records:
+
+    method, url, status, elapsed (as the page saw it), request_size, response_size
+    + duration, ttfb, transfer_size, encoded_body_size from PerformanceResourceTiming
+
+Calls are buffered in sessionStorage, so a click that navigates doesn't
+lose them. They are harvested before each navigation and at the end of
+each test, grouped per endpoint ("POST /appointments/:id/status") and:
+
+    - summarised with percentiles in the terminal,
+    - exported to reports/perf/api_timing.json (this run),
+    - appended to reports/perf/api_calls.jsonl (history).
+"""
+import json
+import os
+from collections import defaultdict
+from urllib.parse import urlparse
+
+import pytest
+
+import driver_hooks
+import nav_timing
+import perf_run
+
+JSONL = "api_calls.jsonl"
+EXPORT = "api_timing.json"
+
+INSTRUMENT_JS = r"""
+(() => {
+    if (window.__apiTimingInstalled) { return; }
+    window.__apiTimingInstalled = true;
+    const KEY = "__apiTiming";
+    const save = (call) => {
+        try {
+            const list = JSON.parse(sessionStorage.getItem(KEY) || "[]");
+            list.push(call);
+            sessionStorage.setItem(KEY, JSON.stringify(list));
+        } catch (e) { /* storage unavailable */ }
+    };
+    const abs = (u) => { try { return new URL(u, location.href).href; } catch (e) { return String(u); } };
+    const size = (b) => {
+        if (b == null) { return 0; }
+        if (typeof b === "string") { return new Blob([b]).size; }
+        if (b instanceof Blob) { return b.size; }
+        if (b instanceof ArrayBuffer || ArrayBuffer.isView(b)) { return b.byteLength; }
+        if (b instanceof URLSearchParams) { return new Blob([b.toString()]).size; }
+        return -1;  // FormData, streams: unknown
+    };
+    // resource timing entries are queued after the body is read
+    const finish = (call) => setTimeout(() => {
+        const entry = performance.getEntriesByName(call.url).find(e => e.startTime >= call.start - 1);
+        if (entry) {
+            call.duration = entry.duration;
+            call.ttfb = entry.responseStart > 0 ? entry.responseStart - entry.startTime : null;
+            call.transfer_size = entry.transferSize;
+            call.encoded_body_size = entry.encodedBodySize;
+        }
+        call.page = location.pathname;
+        save(call);
+    }, 0);
+
+    const originalFetch = window.fetch;
+    window.fetch = function (input, init) {
+        const isRequest = typeof Request !== "undefined" && input instanceof Request;
+        const call = {
+            kind: "fetch", url: abs(isRequest ? input.url : input), start: performance.now(),
+            method: ((init && init.method) || (isRequest && input.method) || "GET").toUpperCase(),
+            request_size: size(init && init.body),
+        };
+        const done = () => { call.elapsed = performance.now() - call.start; finish(call); };
+        return originalFetch.apply(this, arguments).then(response => {
+            call.status = response.status;
+            response.clone().arrayBuffer().then(b => { call.response_size = b.byteLength; done(); }, done);
+            return response;
+        }, error => { call.status = 0; call.error = String(error); done(); throw error; });
+    };
+
+    const open = XMLHttpRequest.prototype.open, send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.open = function (method, url) {
+        this.__apiCall = {kind: "xhr", method: String(method).toUpperCase(), url: abs(url)};
+        return open.apply(this, arguments);
+    };
+    XMLHttpRequest.prototype.send = function (body) {
+        const call = this.__apiCall;
+        if (call) {
+            call.start = performance.now();
+            call.request_size = size(body);
+            this.addEventListener("loadend", () => {
+                call.status = this.status;
+                call.elapsed = performance.now() - call.start;
+                const r = this.response;
+                call.response_size = typeof r === "string" ? new Blob([r]).size : size(r);
+                finish(call);
+            });
+        }
+        return send.apply(this, arguments);
+    };
+})();
+"""
+
+HARVEST_JS = """
+const value = sessionStorage.getItem("__apiTiming");
+sessionStorage.removeItem("__apiTiming");
+return value;
+"""
+
+_calls = []             # this process, current test
+_run_calls = []         # controller: whole run
+_listeners = []
+_drivers = []
+
+
+def add_listener(fn):
+    """fn(call) for every harvested API call."""
+    _listeners.append(fn)
+
+
+def endpoint_of(call):
+    return f"{call['method']} {nav_timing.route_of(call['url'])}"
+
+
+def instrument(driver):
+    """Called by the driver fixture: inject the wrapper into every new document."""
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": INSTRUMENT_JS})
+    driver_hooks.install(driver)
+    _drivers.append(driver)
+    return driver
+
+
+def harvest(driver):
+    raw = driver.execute_script(HARVEST_JS)
+    if not raw:
+        return []
+    test = perf_run.current_test()
+    calls = []
+    for call in json.loads(raw):
+        call.update(test=test, endpoint=endpoint_of(call), path=urlparse(call["url"]).path)
+        if call.get("duration") is None:
+            call["duration"] = call.get("elapsed")
+        calls.append(call)
+        for listener in _listeners:
+            listener(call)
+    _calls.extend(calls)
+    return calls
+
+
+def _before_command(driver, command, params):
+    if command in nav_timing.NAV_COMMANDS and driver in _drivers:
+        harvest(driver)
+
+
+driver_hooks.add_hook(before=_before_command)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    yield
+    for driver in _drivers:
+        try:
+            if not nav_timing.alert_open(driver):
+                with driver_hooks.suspended():
+                    harvest(driver)
+        except Exception:
+            pass
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when == "teardown":
+        outcome.get_result().user_properties.append(("api_calls", json.dumps(_calls)))
+        _calls.clear()
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown" or os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    for name, value in report.user_properties:
+        if name == "api_calls":
+            _run_calls.extend(json.loads(value))
+
+
+def endpoint_stats(calls):
+    """{endpoint: {count, errors, p50, p95, max, ttfb_p50, response_kib_avg}} (ms)"""
+    grouped = defaultdict(list)
+    for call in calls:
+        grouped[call["endpoint"]].append(call)
+    out = {}
+    for endpoint, items in grouped.items():
+        durations = [c["duration"] for c in items if c.get("duration") is not None]
+        ttfbs = [c["ttfb"] for c in items if c.get("ttfb") is not None]
+        sizes = [c["response_size"] for c in items if c.get("response_size") is not None and c["response_size"] >= 0]
+        out[endpoint] = {
+            "count": len(items),
+            "errors": sum(1 for c in items if not c.get("status") or c["status"] >= 400),
+            "p50": perf_run.percentile(durations, 50) if durations else None,
+            "p95": perf_run.percentile(durations, 95) if durations else None,
+            "max": max(durations) if durations else None,
+            "ttfb_p50": perf_run.percentile(ttfbs, 50) if ttfbs else None,
+            "response_kib_avg": sum(sizes) / len(sizes) / 1024 if sizes else None,
+        }
+    return out
+
+
+def pytest_sessionfinish(session):
+    if os.getenv("PYTEST_XDIST_WORKER") or not _run_calls:
+        return
+    perf_run.append_jsonl(JSONL, _run_calls)
+    os.makedirs(perf_run.PERF_DIR, exist_ok=True)
+    with open(perf_run.perf_path(EXPORT), "w", encoding="utf-8") as f:
+        json.dump({"run_id": perf_run.RUN_ID, "endpoints": endpoint_stats(_run_calls)}, f, indent=1)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _run_calls:
+        return
+    fmt = lambda v, spec=".0f": format(v, spec) if v is not None else "-"
+    terminalreporter.write_sep("-", "API calls per endpoint (ms)")
+    terminalreporter.write_line(f"{'endpoint':<50} {'n':>4} {'err':>4} {'p50':>7} {'p95':>7} {'max':>7} {'ttfb':>7} {'KiB':>7}")
+    stats = sorted(endpoint_stats(_run_calls).items(), key=lambda kv: -(kv[1]["p95"] or 0))
+    for endpoint, s in stats:
+        terminalreporter.write_line(
+            f"{endpoint:<50} {s['count']:>4} {s['errors']:>4} {fmt(s['p50']):>7} {fmt(s['p95']):>7} "
+            f"{fmt(s['max']):>7} {fmt(s['ttfb_p50']):>7} {fmt(s['response_kib_avg'], '.1f'):>7}"
+        )
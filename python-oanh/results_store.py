@@ -0,0 +1,284 @@
+"""
+Historical results store for the browser suites (pytest plugin + CLI).
+
+Every run appends to reports/perf/results.sqlite (RESULTS_DB to change):
+
+    runs          run_id, started_at, finished_at, base_url, git_sha, exit_status
+    tests         run_id, nodeid, outcome, duration_s
+    measurements  run_id, nodeid, kind, name, metric, value
+                  kind = test | step | route | api | vital | timer
+
+Questions are answered from the CLI:
+
+    python results_store.py runs
+    python results_store.py slowest --runs 20
+    python results_store.py p95 route /booking --metric load --runs 20
+    python results_store.py regressions --baseline-runs 5 --alpha 0.05
+
+`regressions` compares the latest run (or --candidate-runs N) against a
+baseline with a two-sided Mann-Whitney U test and lists the series whose
+median got slower by more than --min-change with p < alpha.
+"""
+import argparse
+import json
+import math
+import os
+import sqlite3
+import subprocess
+from collections import defaultdict
+from datetime import datetime
+
+import pytest
+
+import perf_run
+
+DB_PATH = os.getenv("RESULTS_DB", perf_run.perf_path("results.sqlite"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY, started_at TEXT, finished_at TEXT, base_url TEXT, git_sha TEXT, exit_status INTEGER
+);
+CREATE TABLE IF NOT EXISTS tests (
+    run_id TEXT, nodeid TEXT, outcome TEXT, duration_s REAL
+);
+CREATE TABLE IF NOT EXISTS measurements (
+    run_id TEXT, nodeid TEXT, kind TEXT, name TEXT, metric TEXT, value REAL
+);
+CREATE INDEX IF NOT EXISTS measurements_series ON measurements (kind, name, metric, run_id);
+CREATE INDEX IF NOT EXISTS tests_run ON tests (run_id);
+"""
+
+
+def connect(path=DB_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+# ---------------- Statistics ----------------
+
+def mann_whitney_u(a, b):
+    """
+    Two-sided Mann-Whitney U test (normal approximation, tie-corrected).
+    Returns (U of `a`, p-value).
+    """
+    n1, n2 = len(a), len(b)
+    combined = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(combined)
+    ties = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2.0 + 1
+        t = j - i + 1
+        ties += t ** 3 - t
+        i = j + 1
+    r1 = sum(r for r, (_, group) in zip(ranks, combined) if group == 0)
+    u1 = r1 - n1 * (n1 + 1) / 2.0
+    n = n1 + n2
+    sigma = math.sqrt(n1 * n2 / 12.0 * ((n + 1) - ties / (n * (n - 1)))) if n > 1 else 0
+    if sigma == 0:
+        return u1, 1.0
+    z = (abs(u1 - n1 * n2 / 2.0) - 0.5) / sigma
+    return u1, min(1.0, math.erfc(max(z, 0) / math.sqrt(2)))
+
+
+def median(values):
+    return perf_run.percentile(values, 50)
+
+
+# ---------------- Recording (plugin) ----------------
+
+_tests = {}         # nodeid -> [outcome, duration_s]
+_steps = []         # (nodeid, {"name", "duration_ms", ...}) - filled when steps.py is in use
+_started_at = datetime.now().isoformat(timespec="seconds")
+
+
+def pytest_runtest_logreport(report):
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    outcome, duration = _tests.get(report.nodeid, ["passed", 0.0])
+    if report.failed:
+        # a setup/teardown failure is an error, unless the test itself already failed
+        outcome = "failed" if report.when == "call" or outcome == "failed" else "error"
+    elif report.skipped and outcome == "passed":
+        outcome = "skipped"
+    _tests[report.nodeid] = [outcome, duration + report.duration]
+    if report.when == "teardown":
+        for name, value in report.user_properties:
+            if name == "steps":
+                _steps.extend((report.nodeid, s) for s in json.loads(value))
+
+
+def _git_sha():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(__file__), timeout=5)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _measurements():
+    """Everything the other perf plugins collected this run, as measurement rows."""
+    import nav_timing
+    import perf_budgets
+    import resource_timing
+    import web_vitals
+
+    rows = []
+    for nodeid, (outcome, duration) in _tests.items():
+        rows.append((nodeid, "test", nodeid, "duration", duration * 1000))
+    for nodeid, step in _steps:
+        rows.append((nodeid, "step", step["name"], "duration", step["duration_ms"]))
+    for s in nav_timing._run_samples:
+        rows += [(s["test"], "route", s["route"], m, s[m]) for m in ("ttfb", "dom_content_loaded", "load", "transfer_size")]
+    for c in resource_timing._run_calls:
+        rows += [(c["test"], "api", c["endpoint"], m, c[m]) for m in ("duration", "ttfb", "response_size")
+                 if c.get(m) is not None]
+    for s in web_vitals._run_samples:
+        rows += [(s["test"], "vital", s["route"], m, s[m]) for m in ("fcp", "lcp", "cls", "inp", "tbt")
+                 if s.get(m) is not None]
+    for kind, name, metric, value, test in perf_budgets._run_samples:
+        if kind == "timer":
+            rows.append((test, "timer", name, metric, value))
+    return rows
+
+
+def record_run(conn, run_id, exit_status, base_url):
+    conn.execute("INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?)",
+                 (run_id, _started_at, datetime.now().isoformat(timespec="seconds"), base_url, _git_sha(), int(exit_status)))
+    conn.executemany("INSERT INTO tests VALUES (?, ?, ?, ?)",
+                     [(run_id, nodeid, outcome, duration) for nodeid, (outcome, duration) in _tests.items()])
+    conn.executemany("INSERT INTO measurements VALUES (?, ?, ?, ?, ?, ?)",
+                     [(run_id,) + tuple(row) for row in _measurements()])
+    conn.commit()
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session, exitstatus):
+    if os.getenv("PYTEST_XDIST_WORKER") or not _tests or os.getenv("RESULTS_STORE") == "0":
+        return
+    import conftest
+
+    conn = connect()
+    try:
+        record_run(conn, perf_run.RUN_ID, exitstatus, getattr(conftest, "UPSTREAM_URL", None))
+    finally:
+        conn.close()
+
+
+# ---------------- Queries ----------------
+
+def last_runs(conn, count):
+    rows = conn.execute("SELECT run_id FROM runs ORDER BY started_at DESC LIMIT ?", (count,)).fetchall()
+    return [r[0] for r in reversed(rows)]
+
+
+def _in(ids):
+    return ",".join("?" * len(ids))
+
+
+def slowest_tests(conn, runs=20, limit=15):
+    ids = last_runs(conn, runs)
+    if not ids:
+        return []
+    rows = conn.execute(
+        f"SELECT nodeid, COUNT(*), AVG(duration_s), MAX(duration_s), SUM(outcome IN ('failed', 'error')) "
+        f"FROM tests WHERE run_id IN ({_in(ids)}) GROUP BY nodeid ORDER BY AVG(duration_s) DESC LIMIT ?",
+        ids + [limit],
+    ).fetchall()
+    return rows
+
+
+def p95_over_time(conn, kind, name, metric, runs=20):
+    ids = last_runs(conn, runs)
+    values = defaultdict(list)
+    for run_id, value in conn.execute(
+        f"SELECT run_id, value FROM measurements WHERE kind = ? AND name = ? AND metric = ? AND run_id IN ({_in(ids)})",
+        [kind, name, metric] + ids,
+    ):
+        values[run_id].append(value)
+    started = dict(conn.execute(f"SELECT run_id, started_at FROM runs WHERE run_id IN ({_in(ids)})", ids).fetchall())
+    return [(run_id, started[run_id], len(values[run_id]), perf_run.percentile(values[run_id], 95))
+            for run_id in ids if values[run_id]]
+
+
+def regressions(conn, candidate_runs=1, baseline_runs=5, baseline=None, alpha=0.05, min_change=0.10, min_samples=3):
+    """
+    Series (kind, name, metric) whose median got slower in the candidate runs vs the baseline.
+    Returns [(kind, name, metric, baseline median, candidate median, change, p)], most significant first.
+    """
+    ids = last_runs(conn, candidate_runs + (0 if baseline else baseline_runs))
+    candidate = ids[-candidate_runs:]
+    base = [baseline] if baseline else ids[:-candidate_runs]
+    if not candidate or not base:
+        return []
+
+    def series(run_ids):
+        out = defaultdict(list)
+        for kind, name, metric, value in conn.execute(
+            f"SELECT kind, name, metric, value FROM measurements WHERE run_id IN ({_in(run_ids)})", run_ids
+        ):
+            out[(kind, name, metric)].append(value)
+        return out
+
+    cand, ref = series(candidate), series(base)
+    found = []
+    for key, values in cand.items():
+        reference = ref.get(key, [])
+        if len(values) < min_samples or len(reference) < min_samples:
+            continue
+        before, after = median(reference), median(values)
+        change = (after - before) / before if before else 0
+        if change <= min_change:
+            continue
+        _, p = mann_whitney_u(values, reference)
+        if p < alpha:
+            found.append(key + (before, after, change, p))
+    return sorted(found, key=lambda r: r[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query the historical test/performance results")
+    parser.add_argument("--db", default=DB_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("runs", help="list recorded runs")
+    slow = sub.add_parser("slowest", help="slowest tests over the last N runs")
+    slow.add_argument("--runs", type=int, default=20)
+    slow.add_argument("--limit", type=int, default=15)
+    p95 = sub.add_parser("p95", help="p95 of one series per run")
+    p95.add_argument("kind", choices=["test", "step", "route", "api", "vital", "timer"])
+    p95.add_argument("name")
+    p95.add_argument("--metric", default="load")
+    p95.add_argument("--runs", type=int, default=20)
+    reg = sub.add_parser("regressions", help="what got slower vs the baseline (Mann-Whitney U)")
+    reg.add_argument("--candidate-runs", type=int, default=1)
+    reg.add_argument("--baseline-runs", type=int, default=5)
+    reg.add_argument("--baseline", help="a specific baseline run id instead of the previous runs")
+    reg.add_argument("--alpha", type=float, default=0.05)
+    reg.add_argument("--min-change", type=float, default=0.10)
+    args = parser.parse_args()
+
+    db = connect(args.db)
+    if args.command == "runs":
+        for row in db.execute("SELECT run_id, started_at, git_sha, exit_status, base_url FROM runs ORDER BY started_at"):
+            print("  ".join(str(c) for c in row))
+    elif args.command == "slowest":
+        print(f"{'test':<90} {'runs':>4} {'avg s':>7} {'max s':>7} {'fails':>5}")
+        for nodeid, count, avg, worst, fails in slowest_tests(db, args.runs, args.limit):
+            print(f"{nodeid:<90} {count:>4} {avg:>7.1f} {worst:>7.1f} {fails:>5}")
+    elif args.command == "p95":
+        for run_id, started, n, value in p95_over_time(db, args.kind, args.name, args.metric, args.runs):
+            print(f"{started}  {run_id}  n={n:<4} p95={value:.1f}")
+    elif args.command == "regressions":
+        rows = regressions(db, args.candidate_runs, args.baseline_runs, args.baseline, args.alpha, args.min_change)
+        if not rows:
+            print("No significant regressions")
+        for kind, name, metric, before, after, change, p in rows:
+            print(f"{kind:<6} {name:<50} {metric:<18} {before:>9.1f} -> {after:>9.1f}  +{change:.0%}  p={p:.4f}")
+    db.close()
@@ -0,0 +1,353 @@
+"""
+Direct test-data seeding for the appointment and carousel tests.
+
+Preconditions (an appointment to change, a slide to edit/delete, ...) are
+created without driving the UI, either:
+    - through the app's HTTP endpoints (default), in parallel, or
+    - through bulk Mongo inserts when SEED_MONGO_URI points at a LOCAL
+      database (never a shared one).
+
+Both seeders expose the same methods and return the created records, so the
+fixtures in conftest.py don't care which one is in use. Everything created is
+registered in data_registry.REGISTRY and removed at session end; MongoSeeder
+also removes its own run-tagged documents when it is closed.
+"""
+import html
+import itertools
+import os
+import re
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from urllib.parse import urlparse
+
+import requests
+
+from data_registry import REGISTRY, RUN_ID, RUN_TAG_FIELD
+
+# App endpoints used for seeding
+LOGIN_PATH = "/login"
+BOOKING_PAGE_PATH = "/booking"
+BOOK_APPOINTMENT_PATH = "/appointments/book"
+AVAILABLE_SLOTS_PATH = "/appointments/available-slots"
+AVAILABILITY_PATH = "/adminportal/appointments/availability"
+BLOCKED_DATES_PATH = "/adminportal/appointments/blocked-dates"
+CAROUSEL_PAGE_PATH = "/adminportal/carouselmanagement"
+CAROUSEL_CREATE_PATH = "/carousel/create"
+CAROUSEL_DELETE_PATH = "/carousel/{id}/delete"
+APPOINTMENTS_ADMIN_PATH = "/adminportal/appointments"
+ALL_APPOINTMENTS_PATH = "/appointments/all"
+APPOINTMENT_STATUS_PATH = "/appointments/{id}/status"
+
+# Collections used when seeding straight into a local database
+APPOINTMENTS_COLLECTION = "appointments"
+AVAILABILITY_COLLECTION = "availabilities"
+BLOCKED_DATES_COLLECTION = "blockeddates"
+CAROUSEL_COLLECTION = "carousels"
+
+SEED_WORKERS = int(os.getenv("SEED_WORKERS", "8"))
+SEED_IMAGE = os.path.join(os.path.dirname(__file__), "selenium-test.jpeg")
+
+TABLE_ROW = re.compile(r"<tr\b.*?</tr>", re.S | re.I)
+TABLE_CELL = re.compile(r"<td\b[^>]*>(.*?)</td>", re.S | re.I)
+SLIDE_ID = re.compile(r"/carousel/(\w+)/delete")
+CSRF_INPUT = re.compile(r'name=["\']_csrf["\'][^>]*value=["\']([^"\']+)["\']|value=["\']([^"\']+)["\'][^>]*name=["\']_csrf["\']')
+
+
+def extract_csrf(html):
+    """CSRF token from the first `<input name="_csrf">` in a page, or None."""
+    match = CSRF_INPUT.search(html)
+    if not match:
+        return None
+    return match.group(1) or match.group(2)
+
+
+# Keys free_slots() reads from /appointments/available-slots. Taken from the
+# stand-in server (standin_server.py); not verified against the real app.
+SLOTS_KEYS = ("availableDays", "timeSlots")
+
+
+class SeedingUnavailable(RuntimeError):
+    """The app can't be seeded the way the tests need (unexpected payload, no free slots)."""
+
+
+def check_slots(slots):
+    """Raise SeedingUnavailable unless `slots` has the available-slots shape free_slots() expects."""
+    missing = [k for k in SLOTS_KEYS if not isinstance(slots, dict) or k not in slots]
+    if missing:
+        got = sorted(slots)[:10] if isinstance(slots, dict) else type(slots).__name__
+        raise SeedingUnavailable(
+            f"{AVAILABLE_SLOTS_PATH} response has no {', '.join(missing)} (got {got}); "
+            "the seeder only knows the stand-in's payload shape"
+        )
+    return slots
+
+
+def free_slots(slots, count, days_ahead=1):
+    """Up to `count` (date, time) pairs that are open according to /appointments/available-slots.
+
+    Days are scanned from `days_ahead` to the end of the booking window, then
+    wrap around to the days before it.
+    """
+    booked = {d: set(times) for d, times in slots.get("booked", {}).items()}
+    blocked = set(slots.get("blockedDates", []))
+    days = set(slots.get("availableDays", []))
+    window = slots.get("windowDays", 60)
+    today = date.today()
+    out = []
+    for offset in list(range(days_ahead, window + 1)) + list(range(1, days_ahead)):
+        day = today + timedelta(days=offset)
+        key = day.isoformat()
+        if key in blocked or day.isoweekday() % 7 not in days:
+            continue
+        out += [(key, t) for t in slots.get("timeSlots", []) if t not in booked.get(key, ())]
+        if len(out) >= count:
+            return out[:count]
+    return out
+
+
+def run_days_ahead(window_days):
+    """First day this run seeds on: spread over the booking window so concurrent runs don't collide."""
+    return 1 + zlib.crc32(RUN_ID.encode()) % max(1, window_days)
+
+
+# Numbers the seeded records of this run, so repeated seeding never reuses a name
+_sequence = itertools.count(1)
+
+
+def appointment_payloads(slots, count, client_name="Selenium Test User"):
+    """`count` bookings on free slots of the /appointments/available-slots payload `slots`."""
+    check_slots(slots)
+    picked = free_slots(slots, count, days_ahead=run_days_ahead(slots.get("windowDays", 60)))
+    if len(picked) < count:
+        raise SeedingUnavailable(f"Only {len(picked)} open appointment slot(s), {count} needed for seeding")
+    payloads = []
+    for day, slot in picked:
+        payloads.append({
+            "date": day,
+            "time": slot,
+            "clientName": client_name,
+            "clientEmail": f"selenium+seed{next(_sequence)}.{RUN_ID}@test.com",
+            "clientPhone": "111-555-1234",
+        })
+    return payloads
+
+
+def slide_payloads(count, title="Selenium Test Slide"):
+    return [{
+        "title": f"{title} {RUN_ID} seed{next(_sequence)}",
+        "description": "This is for testing creating slide in the carousel",
+        "buttonText": "Take assessment quiz",
+        "buttonUrl": "https://coachshante.com/intro",
+    } for i in range(count)]
+
+
+class HttpSeeder:
+    """Seeds through the app's own endpoints, one logged-in session per worker thread."""
+
+    def __init__(self, base_url, username, password, workers=SEED_WORKERS):
+        self.base_url = base_url.rstrip("/")
+        self.username = username
+        self.password = password
+        self.workers = workers
+        self._local = threading.local()
+
+    # ---- sessions ----
+    def _session(self, admin=True):
+        key = "admin" if admin else "public"
+        session = getattr(self._local, key, None)
+        if session is None:
+            session = requests.Session()
+            if admin:
+                self._login(session)
+            setattr(self._local, key, session)
+        return session
+
+    def _login(self, session):
+        page = session.get(self.base_url + LOGIN_PATH, timeout=30)
+        page.raise_for_status()
+        response = session.post(
+            self.base_url + LOGIN_PATH,
+            data={"username": self.username, "password": self.password, "_csrf": extract_csrf(page.text)},
+            timeout=30,
+        )
+        response.raise_for_status()
+        if LOGIN_PATH in response.url:
+            raise RuntimeError(f"Seeding login failed for '{self.username}' at {self.base_url}")
+
+    def _csrf_for(self, session, path):
+        page = session.get(self.base_url + path, timeout=30)
+        page.raise_for_status()
+        return extract_csrf(page.text)
+
+    def _parallel(self, fn, items):
+        with ThreadPoolExecutor(max_workers=min(self.workers, max(len(items), 1))) as pool:
+            return list(pool.map(fn, items))
+
+    # ---- records ----
+    def appointments(self, count=3, **kwargs):
+        slots = self._session(admin=False).get(self.base_url + AVAILABLE_SLOTS_PATH, timeout=30)
+        slots.raise_for_status()
+        try:
+            payload = slots.json()
+        except ValueError:
+            raise SeedingUnavailable(f"{AVAILABLE_SLOTS_PATH} did not return JSON")
+
+        def book(payload):
+            session = self._session(admin=False)
+            body = dict(payload, _csrf=self._csrf_for(session, BOOKING_PAGE_PATH))
+            response = session.post(self.base_url + BOOK_APPOINTMENT_PATH, json=body, timeout=30)
+            response.raise_for_status()
+            data = response.json() if response.content else {}
+            REGISTRY.register(APPOINTMENTS_COLLECTION, {"clientEmail": payload["clientEmail"]}, source="seeding")
+            return dict(payload, _id=(data.get("appointment") or data).get("_id"))
+        return self._parallel(book, appointment_payloads(payload, count, **kwargs))
+
+    def availability(self, days, times):
+        session = self._session()
+        body = {"days": list(days), "times": list(times), "_csrf": self._csrf_for(session, APPOINTMENTS_ADMIN_PATH)}
+        session.post(self.base_url + AVAILABILITY_PATH, json=body, timeout=30).raise_for_status()
+        return [{"days": list(days), "times": list(times)}]
+
+    def blocked_dates(self, dates):
+        def block(day):
+            session = self._session()
+            body = {"date": day, "_csrf": self._csrf_for(session, APPOINTMENTS_ADMIN_PATH)}
+            session.post(self.base_url + BLOCKED_DATES_PATH, json=body, timeout=30).raise_for_status()
+            REGISTRY.register(
+                BLOCKED_DATES_COLLECTION, {"date": datetime.strptime(day, "%Y-%m-%d")}, source="seeding"
+            )
+            return {"date": day}
+        return self._parallel(block, list(dates))
+
+    def carousel_slides(self, count=1, **kwargs):
+        def create(payload):
+            session = self._session()
+            data = dict(payload, imageOption="upload", _csrf=self._csrf_for(session, CAROUSEL_PAGE_PATH))
+            with open(SEED_IMAGE, "rb") as image:
+                response = session.post(
+                    self.base_url + CAROUSEL_CREATE_PATH,
+                    data=data,
+                    files={"imageUpload": ("selenium-test.jpeg", image, "image/jpeg")},
+                    timeout=60,
+                )
+            response.raise_for_status()
+            REGISTRY.register(CAROUSEL_COLLECTION, {"title": payload["title"]}, source="seeding")
+            return payload
+        return self._parallel(create, slide_payloads(count, **kwargs))
+
+    # ---- cleanup without database access (data_registry.cleanup_over_http) ----
+    def remove(self, collection, predicate):
+        """Remove the records of `collection` matching `predicate` through the admin endpoints.
+
+        Slides are deleted; appointments can only be cancelled, which frees
+        their slot. Returns the count, or None for collections without an
+        admin endpoint.
+        """
+        if collection == CAROUSEL_COLLECTION:
+            return self._remove_slides(predicate)
+        if collection == APPOINTMENTS_COLLECTION:
+            return self._cancel_appointments(predicate)
+        return None
+
+    def _remove_slides(self, predicate):
+        session = self._session()
+        page = session.get(self.base_url + CAROUSEL_PAGE_PATH, timeout=30)
+        page.raise_for_status()
+        doomed = []
+        for row in TABLE_ROW.findall(page.text):
+            cells = [html.unescape(re.sub(r"<[^>]+>", "", c)).strip() for c in TABLE_CELL.findall(row)]
+            slide_id = SLIDE_ID.search(row)
+            if slide_id and len(cells) > 1 and predicate({"_id": slide_id.group(1), "title": cells[1]}):
+                doomed.append(slide_id.group(1))
+
+        def delete(slide_id):
+            session = self._session()
+            url = self.base_url + CAROUSEL_DELETE_PATH.format(id=slide_id)
+            body = {"_csrf": self._csrf_for(session, CAROUSEL_PAGE_PATH)}
+            session.post(url, data=body, timeout=30).raise_for_status()
+        self._parallel(delete, doomed)
+        return len(doomed)
+
+    def _cancel_appointments(self, predicate):
+        session = self._session()
+        response = session.get(self.base_url + ALL_APPOINTMENTS_PATH, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+        appointments = data.get("appointments", []) if isinstance(data, dict) else data
+        doomed = [a["_id"] for a in appointments if a.get("status") != "cancelled" and predicate(a)]
+
+        def cancel(appointment_id):
+            session = self._session()
+            url = self.base_url + APPOINTMENT_STATUS_PATH.format(id=appointment_id)
+            body = {"status": "cancelled", "_csrf": self._csrf_for(session, APPOINTMENTS_ADMIN_PATH)}
+            session.post(url, json=body, timeout=30).raise_for_status()
+        self._parallel(cancel, doomed)
+        return len(doomed)
+
+
+class MongoSeeder:
+    """Seeds with one bulk insert per collection. Local databases only."""
+
+    def __init__(self, uri, db_name):
+        from pymongo import MongoClient
+
+        host = urlparse(uri).hostname or ""
+        if host not in ("localhost", "127.0.0.1", "::1") and not os.getenv("SEED_MONGO_ALLOW_REMOTE"):
+            raise RuntimeError(f"Refusing to bulk-seed non-local Mongo host '{host}'")
+        self.client = MongoClient(uri)
+        self.db = self.client[db_name]
+        self.collections = set()
+
+    def _insert(self, collection, docs):
+        now = datetime.utcnow()
+        docs = [dict(d, createdAt=now, updatedAt=now, **{RUN_TAG_FIELD: RUN_ID}) for d in docs]
+        if docs:
+            REGISTRY.register_run_tag(collection, source="seeding")
+            self.collections.add(collection)
+            result = self.db[collection].insert_many(docs, ordered=False)
+            for doc, _id in zip(docs, result.inserted_ids):
+                doc["_id"] = _id
+        return docs
+
+    def _slots(self):
+        """An available-slots payload built from the database: weekday office hours minus what is booked."""
+        booked = {}
+        query = {"status": {"$ne": "cancelled"}, "date": {"$gte": datetime.combine(date.today(), datetime.min.time())}}
+        for a in self.db[APPOINTMENTS_COLLECTION].find(query, {"date": 1, "time": 1}):
+            booked.setdefault(a["date"].strftime("%Y-%m-%d"), []).append(a["time"])
+        blocked = [b["date"].strftime("%Y-%m-%d") for b in self.db[BLOCKED_DATES_COLLECTION].find({}, {"date": 1})]
+        return {"availableDays": [1, 2, 3, 4, 5], "timeSlots": [f"{h:02d}:00" for h in range(9, 17)],
+                "blockedDates": blocked, "booked": booked, "windowDays": 60}
+
+    def appointments(self, count=3, **kwargs):
+        docs = []
+        for p in appointment_payloads(self._slots(), count, **kwargs):
+            docs.append(dict(p, date=datetime.strptime(p["date"], "%Y-%m-%d"), status="pending"))
+        return self._insert(APPOINTMENTS_COLLECTION, docs)
+
+    def availability(self, days, times):
+        return self._insert(AVAILABILITY_COLLECTION, [{"days": list(days), "times": list(times)}])
+
+    def blocked_dates(self, dates):
+        return self._insert(BLOCKED_DATES_COLLECTION, [{"date": datetime.strptime(d, "%Y-%m-%d")} for d in dates])
+
+    def carousel_slides(self, count=1, **kwargs):
+        docs = [dict(p, imageUrl="/images/selenium-test.jpeg", isActive=True) for p in slide_payloads(count, **kwargs)]
+        return self._insert(CAROUSEL_COLLECTION, docs)
+
+    def close(self):
+        """Delete this run's seeded documents (KEEP_TEST_DATA=1 keeps them) and disconnect."""
+        if os.getenv("KEEP_TEST_DATA") != "1":
+            for collection in self.collections:
+                self.db[collection].delete_many({RUN_TAG_FIELD: RUN_ID})
+        self.client.close()
+
+
+def make_seeder(base_url, username, password):
+    """MongoSeeder when SEED_MONGO_URI is set, HttpSeeder otherwise."""
+    uri = os.getenv("SEED_MONGO_URI")
+    if uri:
+        return MongoSeeder(uri, os.getenv("SEED_MONGO_DB", "bitbybitdevelopment"))
+    return HttpSeeder(base_url, username, password)
@@ -0,0 +1,945 @@
+"""
+Hermetic local stand-in for the Graceful Living web app.
+
+A small stdlib HTTP server with in-memory state that serves the pages and
+endpoints the Selenium suites touch, with the same element ids / selectors:
+
+    /login (+ _csrf cookie and form token), /adminportal (+ stats dashboard),
+    /clientmanagement, /content-management (+ carousel iframe),
+    /adminportal/carouselmanagement, /carousel/*, /booking (+ slots JSON),
+    /appointments/*, /adminportal/appointments, /intro, /assessment,
+    /results, /contact, /resources, /
+
+Every response can be delayed (latency_ms, or per-path route_latency) to
+model a slow backend. Run it by hand:
+
+    python standin_server.py --port 8080 --latency-ms 50
+
+or let conftest.py start it with TEST_STANDIN=1.
+"""
+import argparse
+import email.parser
+import email.policy
+import html
+import json
+import os
+import re
+import secrets
+import threading
+import time
+import uuid
+from datetime import date, datetime
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ADMIN_USERNAME = os.getenv("TEST_ADMIN_USERNAME", "skumar")
+ADMIN_PASSWORD = os.getenv("TEST_ADMIN_PASSWORD", "changeyou")
+DAY_IDS = ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
+STATUSES = ["pending", "confirmed", "completed", "cancelled"]
+BOOKING_WINDOW_DAYS = 60
+
+
+# ---------------- State ----------------
+
+class StandInState:
+    """Everything the app would keep in Mongo, kept in memory."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.available_days = {1, 2, 3, 4, 5}
+        self.time_slots = ["09:00", "10:00", "11:00", "13:00", "14:00", "15:00", "16:00"]
+        self.blocked_dates = []
+        self.appointments = []
+        self.slides = [self._slide("Welcome to Graceful Living", "Find your balance", "Start", "/intro")]
+        self.assessments = []
+
+    @staticmethod
+    def _slide(title, description, button_text, button_url):
+        return {
+            "_id": uuid.uuid4().hex[:24], "title": title, "description": description,
+            "buttonText": button_text, "buttonUrl": button_url, "imageUrl": "/static/slide.jpg",
+        }
+
+    def add_slide(self, title, description, button_text, button_url):
+        with self.lock:
+            slide = self._slide(title, description, button_text, button_url)
+            self.slides.append(slide)
+            return slide
+
+    def find(self, items, _id):
+        return next((i for i in items if i["_id"] == _id), None)
+
+    def book(self, day, slot, name, email, phone, status="pending"):
+        """Atomic check-and-insert: a slot can only be booked once."""
+        with self.lock:
+            taken = any(a["date"] == day and a["time"] == slot and a["status"] != "cancelled" for a in self.appointments)
+            if taken:
+                return None
+            appointment = {
+                "_id": uuid.uuid4().hex[:24], "date": day, "time": slot, "clientName": name,
+                "clientEmail": email, "clientPhone": phone, "status": status,
+                "createdAt": datetime.utcnow().isoformat(),
+            }
+            self.appointments.append(appointment)
+            return appointment
+
+    def slots_json(self):
+        booked = {}
+        for a in self.appointments:
+            if a["status"] != "cancelled":
+                booked.setdefault(a["date"], []).append(a["time"])
+        return {
+            "availableDays": sorted(self.available_days),
+            "timeSlots": self.time_slots,
+            "blockedDates": self.blocked_dates,
+            "booked": booked,
+            "windowDays": BOOKING_WINDOW_DAYS,
+        }
+
+    def stats(self, month=None):
+        rows = [a for a in self.assessments if not month or a["createdAt"].startswith(month)]
+        focus, archetype = {}, {}
+        for a in rows:
+            focus[a["focusChakra"]] = focus.get(a["focusChakra"], 0) + 1
+            archetype[a["archetype"]] = archetype.get(a["archetype"], 0) + 1
+        return {"total": len(rows), "focusChakra": focus, "archetype": archetype}
+
+
+# ---------------- HTML ----------------
+
+def render(template, **values):
+    """Replace {{name}} placeholders (JS braces stay untouched)."""
+    return re.sub(r"\{\{(\w+)\}\}", lambda m: str(values.get(m.group(1), "")), template)
+
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{{title}} | Graceful Living</title>
+<style>
+body{font-family:sans-serif;margin:0;padding:16px}
+.tab-content{display:none}.tab-content.active{display:block}
+.step{display:none}.step.active{display:block}
+.date-cell{display:inline-block;width:90px;padding:6px;margin:2px;border:1px solid #ccc;cursor:pointer}
+.date-cell.disabled{color:#bbb;cursor:default}
+.time-slot{display:inline-block;padding:6px;margin:2px;border:1px solid #ccc;cursor:pointer}
+.modal{display:none;position:fixed;top:10%;left:10%;right:10%;background:#fff;border:1px solid #333;padding:16px;z-index:10}
+.modal.open{display:block}
+.chakra-section{display:none}.chakra-section.active{display:block}
+.panel{display:none}.panel.active{display:block}
+</style></head>
+<body>
+<nav><a href="/">Home</a> <a href="/booking">Book</a> <a href="/resources">Resources</a> <a href="/contact">Contact</a></nav>
+{{body}}
+</body></html>"""
+
+LOGIN_BODY = """
+<h1>Admin Login</h1>
+{{error}}
+<form method="post" action="/login">
+  <input type="hidden" name="_csrf" value="{{csrf}}">
+  <input name="username" placeholder="Username">
+  <input name="password" type="password" placeholder="Password">
+  <button class="login_button" type="submit">Login</button>
+</form>"""
+
+ADMINPORTAL_BODY = """
+<h1>Admin Portal</h1>
+<a href="/clientmanagement">Client Management</a>
+<a href="/content-management">Content Management</a>
+<section class="stats-dashboard-section">
+  <h2>Chakra Assessment Statistics</h2>
+  <input type="month" id="statsMonthPicker">
+  <button id="clearMonthBtn">Clear</button>
+  <button id="refreshStatsBtn">Refresh</button>
+  <span id="filterLabel">All time</span>
+  <span id="submissionCountBadge">0 submissions</span>
+  <div id="statsLoadingMessage" style="display:none">Loading statistics...</div>
+  <div id="focusChakraChart" class="stats-chart"></div>
+  <div id="archetypeChart" class="stats-chart"></div>
+</section>
+<script>
+var MONTHS=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"];
+var picker=document.getElementById("statsMonthPicker");
+function label(){
+  var v=picker.value;
+  if(!v){document.getElementById("filterLabel").textContent="All time";return;}
+  var p=v.split("-");document.getElementById("filterLabel").textContent=MONTHS[parseInt(p[1],10)-1]+" "+p[0];
+}
+function bars(el,counts){
+  el.innerHTML="";
+  Object.keys(counts).forEach(function(k){
+    var bar=document.createElement("div");bar.className="chart-bar";
+    bar.style.width=(counts[k]*10)+"px";bar.textContent=k+": "+counts[k];el.appendChild(bar);
+  });
+  el.setAttribute("data-rendered","true");
+}
+function refresh(){
+  var loading=document.getElementById("statsLoadingMessage");
+  loading.style.display="block";
+  document.querySelectorAll(".stats-chart").forEach(function(c){c.removeAttribute("data-rendered");});
+  fetch("/adminportal/stats"+(picker.value?"?month="+picker.value:"")).then(function(r){return r.json();}).then(function(s){
+    document.getElementById("submissionCountBadge").textContent=s.total+" submissions";
+    bars(document.getElementById("focusChakraChart"),s.focusChakra);
+    bars(document.getElementById("archetypeChart"),s.archetype);
+    loading.style.display="none";
+  });
+}
+picker.addEventListener("change",label);picker.addEventListener("input",label);
+document.getElementById("clearMonthBtn").onclick=function(){picker.value="";label();};
+document.getElementById("refreshStatsBtn").onclick=refresh;
+refresh();
+</script>"""
+
+CLIENT_MANAGEMENT_BODY = """
+<h1>Client Management</h1>
+<button onclick="location.href='/adminportal'">Back to Admin Portal</button>
+<a href="/adminportal/appointments">Admin Appointment Portal</a>
+<a href="/clientmanagement/prequiz-results">Application Results</a>
+<a href="/clientmanagement/chakraquiz-results">Energy Leak Results</a>"""
+
+CONTENT_MANAGEMENT_BODY = """
+<h1>Content Management</h1>
+<button onclick="location.href='/adminportal'">Back to Admin Portal</button>
+<div class="tabs">
+  <button class="tab active" data-target="panel-carousel">Carousel</button>
+  <button class="tab" data-target="panel-aboutus">About Us</button>
+  <button class="tab" data-target="panel-services">Services</button>
+</div>
+<div id="panel-carousel" class="panel active"></div>
+<div id="panel-aboutus" class="panel"></div>
+<div id="panel-services" class="panel"></div>
+<script>
+var FRAMES={"panel-carousel":["/adminportal/carouselmanagement","Carousel Manager"],
+            "panel-aboutus":["/adminportal/aboutus","About Us Manager"],
+            "panel-services":["/adminportal/services","Services Manager"]};
+function show(target){
+  document.querySelectorAll(".tab").forEach(function(t){t.classList.toggle("active",t.getAttribute("data-target")===target);});
+  document.querySelectorAll(".panel").forEach(function(p){
+    p.classList.toggle("active",p.id===target);
+    p.innerHTML="";
+  });
+  // like the real page: the iframe is re-created on every tab click
+  var f=document.createElement("iframe");f.src=FRAMES[target][0];f.title=FRAMES[target][1];
+  f.style.width="100%";f.style.height="600px";
+  document.getElementById(target).appendChild(f);
+}
+document.querySelectorAll(".tab").forEach(function(t){t.onclick=function(){show(t.getAttribute("data-target"));};});
+show("panel-carousel");
+</script>"""
+
+CAROUSEL_BODY = """
+<h1>Carousel Management</h1>
+<form method="post" action="/carousel/create" enctype="multipart/form-data">
+  <input type="hidden" name="_csrf" value="{{csrf}}">
+  <input id="title" name="title" placeholder="Title">
+  <textarea id="description" name="description"></textarea>
+  <input id="buttonText" name="buttonText">
+  <input id="buttonUrl" name="buttonUrl">
+  <label><input type="radio" name="imageOption" value="upload" checked> Upload Image</label>
+  <label><input type="radio" name="imageOption" value="url"> Image URL</label>
+  <input type="file" id="imageUpload" name="imageUpload">
+  <button type="submit">Add New Slide</button>
+</form>
+<table><thead><tr><th>Image</th><th>Title</th><th>Description</th><th>Actions</th></tr></thead>
+<tbody>{{rows}}</tbody></table>"""
+
+CAROUSEL_ROW = """<tr><td><img src="{{image}}" width="40"></td><td>{{title}}</td><td>{{description}}</td><td>
+<form method="get" action="/carousel/{{id}}/edit"><button type="submit">🖊️ Edit</button></form>
+<form method="post" action="/carousel/{{id}}/delete" onsubmit="return confirm('Delete this slide?')">
+<input type="hidden" name="_csrf" value="{{csrf}}"><button type="submit">🗑️ Delete</button></form>
+</td></tr>"""
+
+CAROUSEL_EDIT_BODY = """
+<h2>Edit Slide</h2>
+<form method="post" action="/carousel/{{id}}/update">
+  <input type="hidden" name="_csrf" value="{{csrf}}">
+  <input id="title" name="title" value="{{title}}">
+  <textarea id="description" name="description">{{description}}</textarea>
+  <input id="buttonText" name="buttonText" value="{{buttonText}}">
+  <input id="buttonUrl" name="buttonUrl" value="{{buttonUrl}}">
+  <button type="submit">Update Slide</button>
+</form>"""
+
+BOOKING_BODY = """
+<h1>Book an Appointment</h1>
+<div id="step1" class="step active">
+  <div id="loadingSlots">Loading available dates...</div>
+  <div id="calendarContainer" style="display:none"></div>
+  <button id="continueBtn" disabled>Next</button>
+</div>
+<div id="step2" class="step">
+  <div id="timeSlots"></div>
+  <button id="continueToDetailsBtn" disabled>Next</button>
+</div>
+<div id="step3" class="step">
+  <form id="bookingForm">
+    <input type="hidden" name="_csrf" value="{{csrf}}">
+    <input name="clientName" required>
+    <input name="clientEmail" type="email" required>
+    <input name="clientPhone" required>
+    <button type="submit">Book Appointment</button>
+  </form>
+</div>
+<div id="step4" class="step">
+  <h2>You're scheduled!</h2>
+  <p id="confirmDate"></p><p id="confirmTime"></p><p id="confirmName"></p>
+</div>
+<script>
+var selectedDate=null,selectedTime=null,slots=null;
+function showStep(n){for(var i=1;i<=4;i++){document.getElementById("step"+i).classList.toggle("active",i===n);}}
+function iso(d){return d.toISOString().slice(0,10);}
+function renderCalendar(){
+  var c=document.getElementById("calendarContainer");c.innerHTML="";
+  var today=new Date();today.setHours(12,0,0,0);
+  for(var i=1;i<=slots.windowDays;i++){
+    var d=new Date(today.getTime()+i*86400000),key=iso(d);
+    var free=slots.timeSlots.filter(function(t){return (slots.booked[key]||[]).indexOf(t)<0;});
+    var ok=slots.availableDays.indexOf(d.getDay())>=0&&slots.blockedDates.indexOf(key)<0&&free.length>0;
+    var cell=document.createElement("div");cell.className="date-cell"+(ok?"":" disabled");
+    cell.setAttribute("data-date",key);cell.textContent=d.toDateString();
+    if(ok){cell.onclick=(function(k){return function(){selectedDate=k;document.getElementById("continueBtn").disabled=false;};})(key);}
+    c.appendChild(cell);
+  }
+  document.getElementById("loadingSlots").style.display="none";c.style.display="block";
+}
+function renderTimes(){
+  var box=document.getElementById("timeSlots");box.innerHTML="";
+  slots.timeSlots.forEach(function(t){
+    var taken=(slots.booked[selectedDate]||[]).indexOf(t)>=0;
+    var el=document.createElement("div");el.className="time-slot"+(taken?" disabled":"");
+    el.setAttribute("data-time",t);el.textContent=t;
+    if(!taken){el.onclick=function(){selectedTime=t;document.getElementById("continueToDetailsBtn").disabled=false;};}
+    box.appendChild(el);
+  });
+}
+document.getElementById("continueBtn").onclick=function(){renderTimes();showStep(2);};
+document.getElementById("continueToDetailsBtn").onclick=function(){showStep(3);};
+document.getElementById("bookingForm").onsubmit=function(e){
+  e.preventDefault();var f=e.target;
+  fetch("/appointments/book",{method:"POST",headers:{"Content-Type":"application/json"},
+    body:JSON.stringify({date:selectedDate,time:selectedTime,clientName:f.clientName.value,
+      clientEmail:f.clientEmail.value,clientPhone:f.clientPhone.value,_csrf:f._csrf.value})})
+  .then(function(r){return r.json().then(function(j){return [r.ok,j];});})
+  .then(function(res){
+    if(!res[0]){alert(res[1].error||"Booking failed");return;}
+    document.getElementById("confirmDate").textContent=res[1].appointment.date;
+    document.getElementById("confirmTime").textContent=res[1].appointment.time;
+    document.getElementById("confirmName").textContent=res[1].appointment.clientName;
+    showStep(4);
+  });
+};
+fetch("/appointments/available-slots").then(function(r){return r.json();}).then(function(j){slots=j;renderCalendar();});
+</script>"""
+
+APPOINTMENTS_ADMIN_BODY = """
+<h1>Appointment Management Dashboard</h1>
+<input type="hidden" name="_csrf" value="{{csrf}}" id="pageCsrf">
+<div class="tabs">
+  <button class="tab-btn" data-tab="available-days">Available Days</button>
+  <button class="tab-btn" data-tab="time-slots">Time Slots</button>
+  <button class="tab-btn" data-tab="blocked-dates">Blocked Dates</button>
+  <button class="tab-btn" data-tab="all-appointments">All Appointments</button>
+  <button class="tab-btn" data-tab="create-appointment">Create Appointment</button>
+</div>
+<div id="available-days" class="tab-content active">{{days}}</div>
+<div id="time-slots" class="tab-content">
+  <div id="timeSlotsGrid" class="time-slots-grid"></div>
+  <input type="time" id="newTimeSlot"><button id="addTimeSlotBtn">Add</button>
+</div>
+<div id="blocked-dates" class="tab-content">
+  <input type="date" id="blockDate"><button id="blockDateBtn">Block Date</button>
+  <div id="blockedDatesList"></div>
+</div>
+<div id="all-appointments" class="tab-content">
+  <table><thead><tr><th>Client</th><th>Email</th><th>Date</th><th>Time</th><th>Status</th><th>Action</th></tr></thead>
+  <tbody id="allAppointmentsTableBody"><tr><td colspan="6">Loading appointments...</td></tr></tbody></table>
+</div>
+<div id="create-appointment" class="tab-content">
+  <form id="adminCreateAppointmentForm">
+    <input id="clientName" required><input id="clientEmail" type="email" required><input id="clientPhone">
+    <input id="appointmentDate" type="date" required><input id="appointmentTime" type="time" required>
+    <button type="submit" class="add-btn">Create Appointment</button>
+  </form>
+  <div id="createMessage" class="message"></div>
+</div>
+<button id="saveChangesBtn">Save Changes</button>
+<script>
+var csrf=document.getElementById("pageCsrf").value;
+var timeSlots={{timeSlots}},blocked={{blockedDates}};
+function post(url,body){body._csrf=csrf;return fetch(url,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify(body)});}
+function fmt(t){var p=t.split(":"),h=parseInt(p[0],10),m=p[1],ap=h>=12?"PM":"AM";h=h%12||12;return h+":"+m+" "+ap;}
+function plus30(t){var p=t.split(":"),m=parseInt(p[0],10)*60+parseInt(p[1],10)+30;return ("0"+Math.floor(m/60)).slice(-2)+":"+("0"+m%60).slice(-2);}
+function renderSlots(){
+  var g=document.getElementById("timeSlotsGrid");g.innerHTML="";
+  if(!timeSlots.length){g.innerHTML='<div class="loading">No time slots</div>';return;}
+  timeSlots.forEach(function(t,i){
+    var d=document.createElement("div");d.className="time-slot-item";
+    d.innerHTML="<span>"+fmt(t)+" - "+fmt(plus30(t))+"</span><button class='remove-btn'>×</button>";
+    d.querySelector(".remove-btn").onclick=function(){if(confirm("Remove this time slot?")){timeSlots.splice(i,1);renderSlots();}};
+    g.appendChild(d);
+  });
+}
+function renderBlocked(){
+  var l=document.getElementById("blockedDatesList");l.innerHTML="";
+  blocked.forEach(function(day,i){
+    var d=document.createElement("div");d.className="blocked-date-item";
+    d.innerHTML="<span>"+new Date(day+"T12:00:00").toLocaleDateString("en-US",{weekday:"long",year:"numeric",month:"long",day:"numeric"})+"</span><button class='remove-btn'>Remove</button>";
+    d.querySelector(".remove-btn").onclick=function(){if(confirm("Unblock this date?")){blocked.splice(i,1);renderBlocked();}};
+    l.appendChild(d);
+  });
+}
+function loadAppointments(){
+  fetch("/appointments/all").then(function(r){return r.json();}).then(function(rows){
+    var b=document.getElementById("allAppointmentsTableBody");b.innerHTML="";
+    rows.forEach(function(a){
+      var tr=document.createElement("tr"),opts='<option value="">Change status</option>';
+      ["pending","confirmed","completed","cancelled"].forEach(function(s){opts+='<option value="'+s+'">'+s+'</option>';});
+      tr.innerHTML="<td>"+a.clientName+"</td><td>"+a.clientEmail+"</td><td>"+a.date+"</td><td>"+a.time+"</td>"+
+        "<td><span class='status-badge "+a.status+"'>"+a.status+"</span></td>"+
+        "<td><select class='status-dropdown' data-id='"+a._id+"' data-current='"+a.status+"'>"+opts+"</select></td>";
+      tr.querySelector("select").onchange=function(e){
+        var s=e.target.value;if(!s||!confirm("Change status to "+s+"?")){return;}
+        post("/appointments/"+a._id+"/status",{status:s}).then(loadAppointments);
+      };
+      b.appendChild(tr);
+    });
+    if(!rows.length){b.innerHTML='<tr><td colspan="6">No appointments</td></tr>';}
+  });
+}
+document.querySelectorAll(".tab-btn").forEach(function(btn){btn.onclick=function(){
+  var tab=btn.getAttribute("data-tab");
+  document.querySelectorAll(".tab-content").forEach(function(c){c.classList.toggle("active",c.id===tab);});
+  if(tab==="all-appointments"){loadAppointments();}
+};});
+document.getElementById("addTimeSlotBtn").onclick=function(){
+  var v=document.getElementById("newTimeSlot").value;if(v&&timeSlots.indexOf(v)<0){timeSlots.push(v);timeSlots.sort();renderSlots();}
+};
+document.getElementById("blockDateBtn").onclick=function(){
+  var v=document.getElementById("blockDate").value;if(v&&blocked.indexOf(v)<0){blocked.push(v);blocked.sort();renderBlocked();}
+};
+document.getElementById("saveChangesBtn").onclick=function(){
+  var days=[];document.querySelectorAll("#available-days input[type=checkbox]").forEach(function(c){if(c.checked){days.push(parseInt(c.getAttribute("data-day"),10));}});
+  post("/adminportal/appointments/availability",{days:days,times:timeSlots,blockedDates:blocked})
+    .then(function(){alert("All changes saved successfully!");});
+};
+document.getElementById("adminCreateAppointmentForm").onsubmit=function(e){
+  e.preventDefault();
+  post("/appointments/admin-create",{clientName:clientName.value,clientEmail:clientEmail.value,clientPhone:clientPhone.value,
+    date:appointmentDate.value,time:appointmentTime.value}).then(function(r){
+    var m=document.getElementById("createMessage");
+    if(r.ok){m.textContent="Appointment created successfully";e.target.reset();}else{m.textContent="Could not create appointment";}
+  });
+};
+renderSlots();renderBlocked();
+</script>"""
+
+INTRO_BODY = """
+<h1>Welcome</h1>
+<button id="start-assessment-btn">Start Assessment</button>
+<div id="terms-modal" class="modal">
+  <div id="terms-scroll" style="height:120px;overflow:auto">
+    <p style="height:600px">Terms of service...</p>
+  </div>
+  <label><input type="checkbox" id="terms-checkbox" disabled> I agree</label>
+  <button id="continue-btn" disabled>Continue</button>
+</div>
+<script>
+var box=document.getElementById("terms-checkbox"),btn=document.getElementById("continue-btn"),sc=document.getElementById("terms-scroll");
+document.getElementById("start-assessment-btn").onclick=function(){document.getElementById("terms-modal").classList.add("open");};
+sc.addEventListener("scroll",function(){if(sc.scrollTop+sc.clientHeight>=sc.scrollHeight-2){box.disabled=false;}});
+box.onchange=function(){btn.disabled=!box.checked;};
+btn.onclick=function(){
+  fetch("/intro/accept-tos",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({_csrf:"{{csrf}}"})})
+    .then(function(){location.href="/assessment";});
+};
+</script>"""
+
+ASSESSMENT_BODY = """
+<h1 id="chakraHeader">Getting To Know You</h1>
+<p id="chakraDescription">General questions about you</p>
+{{autofill}}
+<form id="assessment-form" method="post" action="/assessment/submit">
+<input type="hidden" name="_csrf" value="{{csrf}}">
+<div class="chakra-section active" id="general" data-title="Getting To Know You" data-description="General questions about you">
+  <input id="fullName" name="fullName" required>
+  <input id="email" name="email" type="email" required>
+  <input id="contactNumber" name="contactNumber" type="tel" required>
+  <input id="jobTitle" name="jobTitle">
+  <label><input type="radio" name="ageBracket" value="20-30" required>20-30</label>
+  <label><input type="radio" name="ageBracket" value="30-40">30-40</label>
+  <label><input type="radio" name="healthcareWorker" value="yes" required>Yes</label>
+  <label><input type="radio" name="healthcareWorker" value="no">No</label>
+  <input name="healthcareYears" id="healthcareYears" type="number" disabled>
+  <label><input type="radio" name="experience" value="no" required>No</label>
+  <label><input type="radio" name="experience" value="other" id="experienceOther">Other</label>
+  <input id="experienceOtherText" name="experienceOtherText" disabled>
+  <fieldset id="familiarWithFieldset"><legend>Familiar with *</legend>
+    <label><input type="checkbox" name="familiarWith[]" value="kundalini">Kundalini</label>
+    <label><input type="checkbox" name="familiarWith[]" value="reiki">Reiki</label>
+    <label><input type="checkbox" name="familiarWith[]" value="none" id="noneCheckbox">None</label>
+  </fieldset>
+  <fieldset><legend>Challenges *</legend>
+    <label><input type="checkbox" name="challenges[]" value="physical">Physical</label>
+    <label><input type="checkbox" name="challenges[]" value="spiritual">Spiritual</label>
+    <label><input type="checkbox" name="challenges[]" value="other" id="challengesOther">Other</label>
+    <input id="challengeOtherText" name="challengeOtherText" disabled>
+  </fieldset>
+  <textarea id="goals" name="goals"></textarea>
+  <button type="button" class="next-btn">Next</button>
+</div>
+<div class="chakra-section" id="root" data-title="Root Chakra" data-description="Safety and grounding">
+  <label><input type="radio" name="root1" value="1" required>1</label><label><input type="radio" name="root1" value="5">5</label>
+  <button type="button" class="next-btn">Next</button>
+</div>
+<div class="chakra-section" id="crown" data-title="Crown Chakra" data-description="Connection and purpose">
+  <label><input type="radio" name="crown1" value="1" required>1</label><label><input type="radio" name="crown1" value="5">5</label>
+  <button type="submit" class="submit-btn">Submit</button>
+</div>
+</form>
+<div id="validationModal" class="modal"><p>Please answer all required questions.</p>
+  <button type="button" class="validation-modal-btn">OK</button><button type="button" class="validation-modal-close">×</button></div>
+<script>
+var modal=document.getElementById("validationModal");
+function closeModal(){modal.classList.remove("open");}
+modal.querySelector(".validation-modal-btn").onclick=closeModal;modal.querySelector(".validation-modal-close").onclick=closeModal;
+function valid(sec){
+  var ok=true;
+  sec.querySelectorAll("input[required]:not([type=radio]),textarea[required]").forEach(function(i){if(!i.disabled&&!i.value){ok=false;}});
+  var groups={};sec.querySelectorAll("input[type=radio][required]").forEach(function(r){groups[r.name]=true;});
+  Object.keys(groups).forEach(function(n){if(!sec.querySelector("input[name='"+n+"']:checked")){ok=false;}});
+  sec.querySelectorAll("fieldset").forEach(function(fs){
+    if(fs.querySelector("legend").textContent.indexOf("*")>=0&&!fs.querySelector("input[type=checkbox]:checked")){ok=false;}
+  });
+  return ok;
+}
+function go(sec,next){
+  sec.classList.remove("active");next.classList.add("active");
+  document.getElementById("chakraHeader").textContent=next.getAttribute("data-title");
+  document.getElementById("chakraDescription").textContent=next.getAttribute("data-description");
+}
+document.querySelectorAll(".next-btn").forEach(function(b){b.onclick=function(){
+  var sec=b.closest(".chakra-section");if(!valid(sec)){modal.classList.add("open");return;}
+  go(sec,sec.nextElementSibling);
+};});
+document.getElementById("assessment-form").onsubmit=function(e){
+  if(!valid(document.querySelector(".chakra-section.active"))){e.preventDefault();modal.classList.add("open");}
+};
+document.querySelectorAll("input[name=healthcareWorker]").forEach(function(r){r.onchange=function(){
+  document.getElementById("healthcareYears").disabled=!(r.value==="yes"&&r.checked);};});
+document.querySelectorAll("input[name=experience]").forEach(function(r){r.onchange=function(){
+  document.getElementById("experienceOtherText").disabled=!document.getElementById("experienceOther").checked;};});
+document.getElementById("challengesOther").onchange=function(e){document.getElementById("challengeOtherText").disabled=!e.target.checked;};
+document.getElementById("noneCheckbox").onchange=function(e){
+  document.querySelectorAll("#familiarWithFieldset input:not(#noneCheckbox)").forEach(function(c){c.disabled=e.target.checked;if(e.target.checked){c.checked=false;}});
+};
+var auto=document.getElementById("autoFillChakraBtn");
+if(auto){auto.onclick=function(){
+  fullName.value="Admin Autofill";email.value="test@example.com";contactNumber.value="555-555-1234";
+  document.querySelectorAll("input[type=radio][required]").forEach(function(r){r.checked=true;});
+  document.querySelectorAll("fieldset").forEach(function(fs){fs.querySelector("input[type=checkbox]").checked=true;});
+};}
+</script>"""
+
+RESULTS_BODY = """
+<h1>Your Chakra &amp; Archetype Insights</h1>
+<p>Focus chakra: {{focusChakra}}</p><p>Archetype: {{archetype}}</p>
+<div id="saveResultsModal" class="modal open">
+  <p>Save your results?</p>
+  <a href="/user-signup">Sign up</a> <a href="/user-login">Log in</a>
+  <button id="modalClose">×</button>
+</div>
+<script>document.getElementById("modalClose").onclick=function(){document.getElementById("saveResultsModal").classList.remove("open");};</script>"""
+
+HOME_BODY = """
+<div class="carousel">{{slides}}</div>
+<a href="/intro">Take the assessment</a>"""
+
+SIMPLE_BODIES = {
+    "/contact": "<h1>Contact</h1><a class='btn' href='/booking'>Book a call</a><a class='btn' href='mailto:hello@example.com'>Email us</a>",
+    "/resources": "<h1>Resources</h1><a class='btn' href='/intro'>Take the assessment</a><a class='btn' href='/booking'>Book</a>",
+    "/user-signup": "<h1>Sign up</h1>",
+    "/user-login": "<h1>Log in</h1>",
+    "/clientmanagement/prequiz-results": "<h1>Application Results</h1><a class='btn back-page-action' href='/clientmanagement'>Back</a>",
+    "/clientmanagement/chakraquiz-results": "<h1>Energy Leak Results</h1><a class='btn back-page-action' href='/clientmanagement'>Back</a>",
+    "/adminportal/aboutus": "<h1>About Us Manager</h1>",
+    "/adminportal/services": "<h1>Services Manager</h1>",
+}
+
+
+# ---------------- Request handling ----------------
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server_version = "GracefulLivingStandIn/1.0"
+    protocol_version = "HTTP/1.1"
+
+    # ---- plumbing ----
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _delay(self, path):
+        delay = self.server.latency_ms
+        # the most specific (longest) matching prefix wins
+        matching = [prefix for prefix in self.server.route_latency if path.startswith(prefix)]
+        if matching:
+            delay = self.server.route_latency[max(matching, key=len)]
+        if delay:
+            time.sleep(delay / 1000.0)
+
+    def _session(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        sid = cookie["sid"].value if "sid" in cookie else None
+        with self.state.lock:
+            session = self.state.sessions.get(sid)
+            if session is None:
+                sid = secrets.token_hex(16)
+                session = {"sid": sid, "csrf": secrets.token_hex(16), "admin": False, "acceptedTOS": False, "new": True}
+                self.state.sessions[sid] = session
+        return session
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        ctype = self.headers.get("Content-Type", "")
+        if ctype.startswith("application/json"):
+            data = json.loads(raw or b"{}")
+            if not isinstance(data, dict):
+                raise ValueError("JSON body is not an object")
+            return data
+        if ctype.startswith("multipart/form-data"):
+            message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+                b"Content-Type: " + ctype.encode() + b"\r\n\r\n" + raw
+            )
+            fields = {}
+            for part in message.iter_parts():
+                name = part.get_param("name", header="content-disposition")
+                if part.get_filename() is None:
+                    fields[name] = part.get_content().strip() if isinstance(part.get_content(), str) else ""
+            return fields
+        return {k: v[0] for k, v in parse_qs(raw.decode()).items()}
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None, session=None):
+        if isinstance(body, str):
+            body = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if session is not None and session.pop("new", False):
+            self.send_header("Set-Cookie", f"sid={session['sid']}; Path=/; HttpOnly; SameSite=Lax")
+            self.send_header("Set-Cookie", f"_csrf={session['csrf']}; Path=/; SameSite=Lax")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _page(self, title, body, session, status=200):
+        self._send(status, render(PAGE, title=title, body=body), session=session)
+
+    def _json(self, data, session, status=200):
+        self._send(status, json.dumps(data), "application/json", session=session)
+
+    def _redirect(self, location, session, status=302):
+        self._send(status, b"", headers={"Location": location}, session=session)
+
+    def _csrf_ok(self, session, body):
+        token = body.get("_csrf") or self.headers.get("CSRF-Token") or self.headers.get("X-CSRF-Token")
+        return token == session["csrf"]
+
+    # ---- dispatch ----
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method):
+        url = urlparse(self.path)
+        self._delay(url.path)
+        session = self._session()
+        try:
+            body = self._body() if method == "POST" else {}
+        except ValueError:
+            return self._json({"error": "Malformed request body"}, session, 400)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        for route_method, pattern, handler, admin_only in ROUTES:
+            match = re.fullmatch(pattern, url.path)
+            if route_method != method or not match:
+                continue
+            if admin_only and not session["admin"]:
+                if url.path.startswith(("/appointments/", "/adminportal/stats")):
+                    return self._json({"error": "Unauthorized"}, session, 401)
+                return self._redirect("/login", session)
+            if method == "POST" and not self._csrf_ok(session, body):
+                return self._page("Forbidden", "<p class='error'>invalid csrf token</p>", session, 403)
+            return handler(self, session, body, query, *match.groups())
+        if method == "GET" and url.path in SIMPLE_BODIES:
+            return self._page(url.path.strip("/"), SIMPLE_BODIES[url.path], session)
+        if url.path.startswith("/static/"):
+            return self._send(200, b"", "image/jpeg", session=session)
+        self._page("Not found", "<h1>404 - Not found</h1>", session, 404)
+
+    # ---- pages ----
+    def home(self, session, body, query):
+        slides = "".join(
+            f"<div class='carousel-slide'><h2>{html.escape(s['title'])}</h2><p>{html.escape(s['description'])}</p>"
+            f"<a class='btn' href='{html.escape(s['buttonUrl'])}'>{html.escape(s['buttonText'])}</a></div>"
+            for s in self.state.slides
+        )
+        self._page("Home", render(HOME_BODY, slides=slides), session)
+
+    def login_page(self, session, body, query, error=""):
+        self._page("Login", render(LOGIN_BODY, csrf=session["csrf"], error=error), session)
+
+    def login(self, session, body, query):
+        if body.get("username") == ADMIN_USERNAME and body.get("password") == ADMIN_PASSWORD:
+            session["admin"] = True
+            return self._redirect("/adminportal", session)
+        self.login_page(session, body, query, error="<p class='error'>Invalid username or password</p>")
+
+    def adminportal(self, session, body, query):
+        self._page("Admin Portal", ADMINPORTAL_BODY, session)
+
+    def stats(self, session, body, query):
+        self._json(self.state.stats(query.get("month")), session)
+
+    def client_management(self, session, body, query):
+        self._page("Client Management", CLIENT_MANAGEMENT_BODY, session)
+
+    def content_management(self, session, body, query):
+        self._page("Content Management", CONTENT_MANAGEMENT_BODY, session)
+
+    def carousel(self, session, body, query):
+        rows = "".join(
+            render(CAROUSEL_ROW, id=s["_id"], image=s["imageUrl"], title=html.escape(s["title"]),
+                   description=html.escape(s["description"]), csrf=session["csrf"])
+            for s in self.state.slides
+        )
+        self._page("Carousel Management", render(CAROUSEL_BODY, csrf=session["csrf"], rows=rows), session)
+
+    def carousel_create(self, session, body, query):
+        self.state.add_slide(body.get("title", ""), body.get("description", ""),
+                             body.get("buttonText", ""), body.get("buttonUrl", ""))
+        self._redirect("/adminportal/carouselmanagement", session)
+
+    def carousel_edit(self, session, body, query, slide_id):
+        slide = self.state.find(self.state.slides, slide_id)
+        if slide is None:
+            return self._page("Not found", "<h1>Slide not found</h1>", session, 404)
+        values = {k: html.escape(v) for k, v in slide.items()}
+        self._page("Edit Slide", render(CAROUSEL_EDIT_BODY, csrf=session["csrf"], id=slide_id, **{
+            k: v for k, v in values.items() if k != "_id"
+        }), session)
+
+    def carousel_update(self, session, body, query, slide_id):
+        with self.state.lock:
+            slide = self.state.find(self.state.slides, slide_id)
+            if slide is not None:
+                for key in ("title", "description", "buttonText", "buttonUrl"):
+                    if key in body:
+                        slide[key] = body[key]
+        self._redirect("/adminportal/carouselmanagement", session)
+
+    def carousel_delete(self, session, body, query, slide_id):
+        with self.state.lock:
+            self.state.slides = [s for s in self.state.slides if s["_id"] != slide_id]
+        self._redirect("/adminportal/carouselmanagement", session)
+
+    def booking(self, session, body, query):
+        self._page("Booking", render(BOOKING_BODY, csrf=session["csrf"]), session)
+
+    def available_slots(self, session, body, query):
+        self._json(self.state.slots_json(), session)
+
+    def book(self, session, body, query):
+        day, slot = body.get("date"), body.get("time")
+        if not day or not slot or not body.get("clientName") or not body.get("clientEmail"):
+            return self._json({"error": "Missing required fields"}, session, 400)
+        try:
+            weekday = date.fromisoformat(day).isoweekday() % 7
+        except (TypeError, ValueError):
+            return self._json({"error": "Invalid date"}, session, 400)
+        blocked = day in self.state.blocked_dates
+        if blocked or weekday not in self.state.available_days or slot not in self.state.time_slots:
+            return self._json({"error": "This time slot is not available"}, session, 409)
+        appointment = self.state.book(day, slot, body["clientName"], body["clientEmail"], body.get("clientPhone", ""))
+        if appointment is None:
+            return self._json({"error": "This time slot has already been booked"}, session, 409)
+        self._json({"success": True, "appointment": appointment}, session, 201)
+
+    def appointments_admin(self, session, body, query):
+        days = "".join(
+            f"<label><input type='checkbox' id='{name}' data-day='{i}'{' checked' if i in self.state.available_days else ''}>"
+            f"{name.title()}</label>"
+            for i, name in enumerate(DAY_IDS)
+        )
+        self._page("Appointments", render(
+            APPOINTMENTS_ADMIN_BODY, csrf=session["csrf"], days=days,
+            timeSlots=json.dumps(self.state.time_slots), blockedDates=json.dumps(self.state.blocked_dates),
+        ), session)
+
+    def appointments_all(self, session, body, query):
+        self._json(sorted(self.state.appointments, key=lambda a: a["createdAt"], reverse=True), session)
+
+    def appointment_status(self, session, body, query, appointment_id):
+        if body.get("status") not in STATUSES:
+            return self._json({"error": "Invalid status"}, session, 400)
+        with self.state.lock:
+            appointment = self.state.find(self.state.appointments, appointment_id)
+            if appointment is None:
+                return self._json({"error": "Not found"}, session, 404)
+            appointment["status"] = body["status"]
+        self._json({"success": True, "appointment": appointment}, session)
+
+    def appointment_admin_create(self, session, body, query):
+        day, slot = body.get("date"), body.get("time")
+        if not day or not slot:
+            return self._json({"error": "Missing required fields"}, session, 400)
+        try:
+            date.fromisoformat(day)
+            datetime.strptime(slot, "%H:%M")
+        except (TypeError, ValueError):
+            return self._json({"error": "Invalid date or time"}, session, 400)
+        appointment = self.state.book(body.get("date"), body.get("time"), body.get("clientName"),
+                                      body.get("clientEmail"), body.get("clientPhone", ""), status="confirmed")
+        if appointment is None:
+            return self._json({"error": "This time slot has already been booked"}, session, 409)
+        self._json({"success": True, "appointment": appointment}, session, 201)
+
+    def availability(self, session, body, query):
+        with self.state.lock:
+            if "days" in body:
+                self.state.available_days = {int(d) for d in body["days"]}
+            if "times" in body:
+                self.state.time_slots = sorted(body["times"])
+            if "blockedDates" in body:
+                self.state.blocked_dates = sorted(body["blockedDates"])
+        self._json({"success": True}, session)
+
+    def blocked_date(self, session, body, query):
+        with self.state.lock:
+            if body.get("date") and body["date"] not in self.state.blocked_dates:
+                self.state.blocked_dates = sorted(self.state.blocked_dates + [body["date"]])
+        self._json({"success": True}, session)
+
+    def intro(self, session, body, query):
+        self._page("Intro", render(INTRO_BODY, csrf=session["csrf"]), session)
+
+    def accept_tos(self, session, body, query):
+        session["acceptedTOS"] = True
+        self._json({"success": True}, session)
+
+    def assessment(self, session, body, query):
+        if not session["acceptedTOS"]:
+            return self._redirect("/intro", session)
+        autofill = "<button type='button' id='autoFillChakraBtn'>Auto fill</button>" if session["admin"] else ""
+        self._page("Assessment", render(ASSESSMENT_BODY, csrf=session["csrf"], autofill=autofill), session)
+
+    def assessment_submit(self, session, body, query):
+        record = {
+            "_id": uuid.uuid4().hex[:24], "fullName": body.get("fullName", ""), "email": body.get("email", ""),
+            "focusChakra": "rootChakra" if body.get("root1") == "1" else "crownChakra",
+            "archetype": "workerBee", "createdAt": datetime.utcnow().isoformat(),
+        }
+        with self.state.lock:
+            self.state.assessments.append(record)
+        self._redirect(f"/results?id={record['_id']}", session, 303)
+
+    def results(self, session, body, query):
+        record = self.state.find(self.state.assessments, query.get("id", "")) or {}
+        self._page("Results", render(
+            RESULTS_BODY, focusChakra=record.get("focusChakra", "-"), archetype=record.get("archetype", "-")
+        ), session)
+
+
+# (method, path regex, handler, admin only)
+ROUTES = [
+    ("GET", r"/", StandInHandler.home, False),
+    ("GET", r"/login", StandInHandler.login_page, False),
+    ("POST", r"/login", StandInHandler.login, False),
+    ("GET", r"/adminportal", StandInHandler.adminportal, True),
+    ("GET", r"/adminportal/stats", StandInHandler.stats, True),
+    ("GET", r"/clientmanagement", StandInHandler.client_management, True),
+    ("GET", r"/content-management", StandInHandler.content_management, True),
+    ("GET", r"/adminportal/carouselmanagement", StandInHandler.carousel, True),
+    ("POST", r"/carousel/create", StandInHandler.carousel_create, True),
+    ("GET", r"/carousel/(\w+)/edit", StandInHandler.carousel_edit, True),
+    ("POST", r"/carousel/(\w+)/update", StandInHandler.carousel_update, True),
+    ("POST", r"/carousel/(\w+)/delete", StandInHandler.carousel_delete, True),
+    ("GET", r"/booking", StandInHandler.booking, False),
+    ("GET", r"/appointments/available-slots", StandInHandler.available_slots, False),
+    ("POST", r"/appointments/book", StandInHandler.book, False),
+    ("GET", r"/adminportal/appointments", StandInHandler.appointments_admin, True),
+    ("GET", r"/appointments/all", StandInHandler.appointments_all, True),
+    ("POST", r"/appointments/(\w+)/status", StandInHandler.appointment_status, True),
+    ("POST", r"/appointments/admin-create", StandInHandler.appointment_admin_create, True),
+    ("POST", r"/adminportal/appointments/availability", StandInHandler.availability, True),
+    ("POST", r"/adminportal/appointments/blocked-dates", StandInHandler.blocked_date, True),
+    ("GET", r"/intro", StandInHandler.intro, False),
+    ("POST", r"/intro/accept-tos", StandInHandler.accept_tos, False),
+    ("GET", r"/assessment", StandInHandler.assessment, False),
+    ("POST", r"/assessment/submit", StandInHandler.assessment_submit, False),
+    ("GET", r"/results", StandInHandler.results, False),
+]
+
+
+class StandInServer(ThreadingHTTPServer):
+    """The stand-in app. start() serves it from a daemon thread."""
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, route_latency=None, verbose=False):
+        super().__init__((host, port), StandInHandler)
+        self.state = StandInState()
+        self.latency_ms = latency_ms
+        self.route_latency = route_latency or {}
+        self.verbose = verbose
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="standin-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def parse_route_latency(spec):
+    """'/booking=300,/appointments=150' -> {'/booking': 300, '/appointments': 150}"""
+    out = {}
+    for item in filter(None, (spec or "").split(",")):
+        path, ms = item.split("=")
+        out[path.strip()] = float(ms)
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the Graceful Living web app")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay added to every response")
+    parser.add_argument("--route-latency", default="", help="per-path delays, e.g. /booking=300,/appointments=150")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    server = StandInServer(args.host, args.port, args.latency_ms, parse_route_latency(args.route_latency), args.verbose)
+    print(f"Stand-in app serving on {server.url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -0,0 +1,258 @@
+"""
+Step-level timing inside a test, rendered as a waterfall in the HTML report (pytest plugin).
+
+The long tests are written as numbered steps. Wrapping them:
+
+    from steps import step
+
+    with step("Refresh CSRF token"):
+        driver.get(f"{BASE_URL}/adminportal/carouselmanagement")
+        ...
+
+records per step:
+
+    start_ms / duration_ms   offset from the start of the test, wall time
+    commands / command_ms    WebDriver commands issued (outside waits), by command name
+    waits / wait_ms          WebDriverWait.until / until_not calls: condition, time, timed out
+    sleep_ms                 time.sleep() calls
+
+The WebDriverWait and time.sleep wrappers are installed only while a step
+is active (in any thread); the originals are put back when the last one
+exits. Steps can be nested (depth). The waterfall is attached to the test
+in the pytest-html report; the steps also travel in the "steps" user
+property, which results_store.py keeps per run.
+"""
+import functools
+import html
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import pytest
+from selenium.webdriver.support.ui import WebDriverWait
+
+import driver_hooks
+
+try:
+    from pytest_html import extras as html_extras
+except ImportError:     # HTML report not installed: steps are still recorded
+    html_extras = None
+
+_steps = []             # finished steps of the current test
+_local = threading.local()
+_test_start = {"at": None}
+_patched = {"active": 0, "originals": None}
+_patch_lock = threading.Lock()
+
+
+class _Step:
+    def __init__(self, name, depth):
+        self.name = name
+        self.depth = depth
+        self.started = time.perf_counter()
+        self.commands = defaultdict(lambda: [0, 0.0])   # command -> [count, ms]
+        self.waits = []
+        self.sleep_ms = 0.0
+
+    def as_dict(self, error):
+        origin = _test_start["at"] or self.started
+        return {
+            "name": self.name,
+            "depth": self.depth,
+            "start_ms": (self.started - origin) * 1000,
+            "duration_ms": (time.perf_counter() - self.started) * 1000,
+            "commands": sum(n for n, _ in self.commands.values()),
+            "command_ms": sum(ms for _, ms in self.commands.values()),
+            "by_command": {command: {"count": n, "ms": ms} for command, (n, ms) in self.commands.items()},
+            "waits": self.waits,
+            "wait_ms": sum(w["duration_ms"] for w in self.waits),
+            "sleep_ms": self.sleep_ms,
+            "error": error,
+        }
+
+
+def _stack():
+    if not hasattr(_local, "stack"):
+        _local.stack = []
+    return _local.stack
+
+
+def _current():
+    stack = _stack()
+    return stack[-1] if stack else None
+
+
+@contextmanager
+def step(name):
+    """Time the block as a step of the running test (recorded even if the block raises)."""
+    current = _Step(name, len(_stack()))
+    _stack().append(current)
+    _install()
+    error = None
+    try:
+        yield current
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"[:200]
+        raise
+    finally:
+        _uninstall()
+        _stack().pop()
+        parent = _current()
+        if parent is not None:
+            # a parent step's breakdown includes its children
+            for command, (n, ms) in current.commands.items():
+                parent.commands[command][0] += n
+                parent.commands[command][1] += ms
+            parent.waits.extend(current.waits)
+            parent.sleep_ms += current.sleep_ms
+        _steps.append(current.as_dict(error))
+
+
+# ---------------- Commands, waits and sleeps ----------------
+
+def _before_command(driver, command, params):
+    _local.command_start = time.perf_counter()
+
+
+def _after_command(driver, command, params, response):
+    current = _current()
+    started = getattr(_local, "command_start", None)
+    if current is None or started is None or getattr(_local, "waiting", False):
+        return
+    entry = current.commands[command]
+    entry[0] += 1
+    entry[1] += (time.perf_counter() - started) * 1000
+
+
+# innermost: the command window must not include other plugins' hooks (nav_timing's probe polls and sleeps)
+driver_hooks.add_hook(before=_before_command, after=_after_command, innermost=True)
+
+
+def _describe(method):
+    name = getattr(method, "__qualname__", None) or type(method).__name__
+    locator = getattr(method, "locator", None)
+    if locator is None:
+        # expected_conditions are closures over the locator
+        cells = getattr(method, "__closure__", None) or ()
+        locator = next((c.cell_contents for c in cells if isinstance(c.cell_contents, tuple)), None)
+    name = "lambda" if "<lambda>" in name else name.split(".<locals>")[0]
+    return f"{name}{locator}" if locator else name
+
+
+def _timed_wait(original):
+    @functools.wraps(original)
+    def wait(self, method, message=""):
+        current = _current()
+        if current is None or getattr(_local, "waiting", False):
+            return original(self, method, message)
+        _local.waiting = True
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return original(self, method, message)
+        except Exception:
+            timed_out = True
+            raise
+        finally:
+            _local.waiting = False
+            current.waits.append({
+                "kind": original.__name__,
+                "condition": _describe(method),
+                "duration_ms": (time.perf_counter() - started) * 1000,
+                "timed_out": timed_out,
+            })
+    return wait
+
+
+def _timed_sleep(original):
+    @functools.wraps(original)
+    def sleep(seconds):
+        current = _current()
+        original(seconds)
+        # only the test's own thread has a step stack, so server/proxy threads don't count;
+        # sleeps inside driver hooks are instrumentation, not the test's
+        in_hook = getattr(driver_hooks._state, "busy", False)
+        if current is not None and not in_hook and not getattr(_local, "waiting", False):
+            current.sleep_ms += seconds * 1000
+    return sleep
+
+
+def _install():
+    """Wrap WebDriverWait.until/until_not and time.sleep while the first step is active."""
+    with _patch_lock:
+        _patched["active"] += 1
+        if _patched["active"] > 1:
+            return
+        originals = (WebDriverWait.until, WebDriverWait.until_not, time.sleep)
+        _patched["originals"] = originals
+        WebDriverWait.until = _timed_wait(originals[0])
+        WebDriverWait.until_not = _timed_wait(originals[1])
+        time.sleep = _timed_sleep(originals[2])
+
+
+def _uninstall():
+    """Put the originals back once the last active step exits."""
+    with _patch_lock:
+        _patched["active"] -= 1
+        if _patched["active"] > 0:
+            return
+        WebDriverWait.until, WebDriverWait.until_not, time.sleep = _patched["originals"]
+        _patched["originals"] = None
+
+
+# ---------------- Reporting ----------------
+
+COLOURS = {"command_ms": "#4a90d9", "wait_ms": "#f5a623", "sleep_ms": "#d0021b"}
+
+
+def waterfall(steps, total_ms):
+    """HTML waterfall: one bar per step, split into commands / waits / sleeps."""
+    total_ms = max(total_ms, max((s["start_ms"] + s["duration_ms"] for s in steps), default=0), 1)
+    rows = []
+    for s in sorted(steps, key=lambda s: (s["start_ms"], s["depth"])):
+        segments = "".join(
+            f'<div title="{part} {s[part]:.0f} ms" style="float:left;height:100%;background:{colour};'
+            f'width:{min(100, s[part] / max(s["duration_ms"], 1) * 100):.1f}%"></div>'
+            for part, colour in COLOURS.items() if s[part] > 0
+        )
+        bar = (f'<div style="position:absolute;left:{s["start_ms"] / total_ms * 100:.1f}%;'
+               f'width:{max(s["duration_ms"] / total_ms * 100, 0.3):.1f}%;height:12px;top:3px;background:#ddd;'
+               f'overflow:hidden{";outline:1px solid #d0021b" if s["error"] else ""}">{segments}</div>')
+        slowest_wait = max(s["waits"], key=lambda w: w["duration_ms"], default=None)
+        rows.append(
+            f'<tr><td style="padding-left:{s["depth"] * 16}px;white-space:nowrap">{html.escape(s["name"])}</td>'
+            f'<td style="text-align:right">{s["duration_ms"] / 1000:.1f} s</td>'
+            f'<td style="width:480px"><div style="position:relative;height:18px">{bar}</div></td>'
+            f'<td style="text-align:right">{s["commands"]}</td><td style="text-align:right">{len(s["waits"])}</td>'
+            f'<td style="text-align:right">{s["sleep_ms"] / 1000:.1f} s</td>'
+            f'<td>{html.escape(slowest_wait["condition"]) + " " + format(slowest_wait["duration_ms"], ".0f") + " ms" if slowest_wait else ""}</td></tr>'
+        )
+    legend = " ".join(f'<span style="color:{c}">&#9632;</span> {p[:-3]}' for p, c in COLOURS.items())
+    in_steps = sum(s["duration_ms"] for s in steps if s["depth"] == 0)
+    return (
+        f"<h4>Steps ({in_steps / 1000:.1f} of {total_ms / 1000:.1f} s) &nbsp; {legend}</h4>"
+        "<table><tr><th>Step</th><th>Time</th><th>Waterfall</th><th>Cmds</th><th>Waits</th><th>Sleep</th>"
+        f"<th>Slowest wait</th></tr>{''.join(rows)}</table>"
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    _test_start["at"] = time.perf_counter()
+    yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    if call.when == "call" and _steps and html_extras is not None:
+        extras = getattr(report, "extras", [])
+        extras.append(html_extras.html(waterfall(_steps, call.duration * 1000)))
+        report.extras = extras
+    if call.when == "teardown":
+        report.user_properties.append(("steps", json.dumps(_steps)))
+        _steps.clear()
+        _test_start["at"] = None
@@ -29,9 +29,15 @@ from helpers import (
     wait_for_url_change
 )
 from conftest import BASE_URL
+from data_registry import REGISTRY, RUN_ID
+from perf_budgets import budget_timer
 import time
 from datetime import datetime, timedelta
 
+# Run-tagged client emails, so session cleanup only ever touches this run's appointments
+BOOKING_EMAIL = f"selenium+book.{RUN_ID}@test.com"
+ADMIN_CREATED_EMAIL = f"testclient.admin+{RUN_ID}@example.com"
+
 
 class TestAppointmentBooking:
     """Test suite for public appointment booking features."""
@@ -66,25 +72,28 @@ class TestAppointmentBooking:
         2. Select a time slot (sets selectedTime JavaScript variable)
         3. Fill in contact details and submit (uses fetch() with CSRF token)
         """
+        REGISTRY.register("appointments", {"clientEmail": BOOKING_EMAIL}, source="test_book_appointment")
         driver.get(f"{BASE_URL}/booking")
         
         wait_for_page_load(driver)
         
         # Wait for calendar to load (wait for loading message to disappear)
-        try:
-            WebDriverWait(driver, 15).until(
-                EC.invisibility_of_element_located((By.ID, "loadingSlots"))
-            )
-        except TimeoutException:
-            pytest.skip("Calendar failed to load available slots")
-        
-        # Wait for calendar container to be visible
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.visibility_of_element_located((By.ID, "calendarContainer"))
-            )
-        except TimeoutException:
-            pytest.skip("Calendar container not found")
+        # Timed against the "booking calendar ready" budget (perf_budgets.json)
+        with budget_timer("booking calendar ready"):
+            try:
+                WebDriverWait(driver, 15).until(
+                    EC.invisibility_of_element_located((By.ID, "loadingSlots"))
+                )
+            except TimeoutException:
+                pytest.skip("Calendar failed to load available slots")
+            
+            # Wait for calendar container to be visible
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.visibility_of_element_located((By.ID, "calendarContainer"))
+                )
+            except TimeoutException:
+                pytest.skip("Calendar container not found")
         
         # STEP 1: Select a date
         # Find an available date cell (not disabled)
@@ -185,7 +194,7 @@ class TestAppointmentBooking:
         
         # Fill in form fields
         safe_send_keys(driver, By.NAME, "clientName", "Selenium Test User")
-        safe_send_keys(driver, By.NAME, "clientEmail", "selenium@test.com")
+        safe_send_keys(driver, By.NAME, "clientEmail", BOOKING_EMAIL)
         safe_send_keys(driver, By.NAME, "clientPhone", "111-555-1234")
         
         # Set up JavaScript to ensure CSRF token is included in fetch request
@@ -1025,7 +1034,7 @@ class TestAppointmentManagement:
         
         print("✓ Blocked dates modification test completed")
     
-    def test_change_appointment_status(self, logged_in_driver):
+    def test_change_appointment_status(self, logged_in_driver, seeded_appointments):
         """Test 6: Test if admin can change status of any appointment.
         
         Steps:
@@ -1051,38 +1060,47 @@ class TestAppointmentManagement:
             "button[data-tab='all-appointments']"
         )
         assert all_appointments_tab is not None, "All Appointments tab not found"
-        all_appointments_tab.click()
-        time.sleep(2)  # Wait for tab content to load
-        
-        # Wait for all appointments tab content to be visible
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "all-appointments"))
-            )
-        except TimeoutException:
-            pytest.fail("All Appointments tab content did not appear")
-        
-        # Step 3: Wait for appointments table to load
-        try:
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.ID, "allAppointmentsTableBody"))
+        # From the tab click until the table is populated is timed against the
+        # "appointments table ready" budget (perf_budgets.json), so no fixed sleep here
+        with budget_timer("appointments table ready"):
+            all_appointments_tab.click()
+            
+            # Wait for all appointments tab content to be visible
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.ID, "all-appointments"))
+                )
+            except TimeoutException:
+                pytest.fail("All Appointments tab content did not appear")
+            
+            # Step 3: Wait for appointments table to load
+            try:
+                WebDriverWait(driver, 15).until(
+                    EC.presence_of_element_located((By.ID, "allAppointmentsTableBody"))
+                )
+                # Wait for loading message to disappear
+                WebDriverWait(driver, 10).until(
+                    lambda d: "Loading appointments" not in d.find_element(By.ID, "allAppointmentsTableBody").text
+                )
+            except TimeoutException:
+                pytest.skip("Appointments table failed to load")
+        
+        # Step 4: Find the seeded appointment's status dropdown in the Action column
+        # (only ever change the appointment this test seeded, never real ones)
+        seeded = seeded_appointments[0]
+        if seeded.get("_id"):
+            status_dropdowns = driver.find_elements(
+                By.CSS_SELECTOR, f".status-dropdown[data-id='{seeded['_id']}']"
             )
-            # Wait for loading message to disappear
-            WebDriverWait(driver, 10).until(
-                lambda d: "Loading appointments" not in d.find_element(By.ID, "allAppointmentsTableBody").text
+        else:
+            status_dropdowns = driver.find_elements(
+                By.XPATH,
+                f"//tr[contains(., '{seeded['clientEmail']}')]//select[contains(@class, 'status-dropdown')]"
             )
-        except TimeoutException:
-            pytest.skip("Appointments table failed to load")
-        
-        time.sleep(2)  # Additional wait for table to populate
-        
-        # Step 4: Find a status dropdown in the Action column
-        status_dropdowns = driver.find_elements(By.CSS_SELECTOR, ".status-dropdown")
         
         if not status_dropdowns:
-            pytest.skip("No appointments found or status dropdowns not available")
+            pytest.fail(f"Seeded appointment {seeded['clientEmail']} not found in the appointments table")
         
-        # Get the first appointment's status dropdown
         first_dropdown = status_dropdowns[0]
         appointment_id = first_dropdown.get_attribute("data-id")
         current_status = first_dropdown.get_attribute("data-current")
@@ -1221,6 +1239,7 @@ class TestAppointmentManagement:
         9. Verify appointment was created successfully
         """
         driver = logged_in_driver
+        REGISTRY.register("appointments", {"clientEmail": ADMIN_CREATED_EMAIL}, source="test_create_appointment")
         
         # Step 1: Navigate to Appointment Management Dashboard
         driver.get(f"{BASE_URL}/adminportal/appointments")
@@ -1278,7 +1297,7 @@ class TestAppointmentManagement:
         client_email_input = wait_for_element(driver, By.ID, "clientEmail")
         assert client_email_input is not None, "Client Email input not found"
         client_email_input.clear()
-        client_email_input.send_keys("testclient.admin@example.com")
+        client_email_input.send_keys(ADMIN_CREATED_EMAIL)
         time.sleep(0.5)
         
         # Step 5: Fill out Client Phone
@@ -1470,7 +1489,7 @@ class TestAppointmentManagement:
                 table_body = driver.find_element(By.ID, "allAppointmentsTableBody")
                 table_text = table_body.text
                 
-                if "Test Client Admin Created" in table_text or "testclient.admin@example.com" in table_text:
+                if "Test Client Admin Created" in table_text or ADMIN_CREATED_EMAIL in table_text:
                     print("✓ Created appointment found in All Appointments table")
                 else:
                     print("⚠ Created appointment not immediately visible in table (may need refresh)")
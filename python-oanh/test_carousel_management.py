@@ -23,8 +23,23 @@ from helpers import (
     wait_for_page_load,
 )
 from conftest import BASE_URL
+from data_registry import REGISTRY, RUN_ID
+from steps import step
 import time
 
+# Titles carry the run id so cleanup never touches other runs' slides
+NEW_SLIDE_TITLE = f"Selenium Test Slide {RUN_ID}"
+EDITED_SLIDE_TITLE = f"Selenium test edit slide {RUN_ID}"
+
+
+def seeded_slide_row(driver, slide):
+    """Table row of a seeded slide: by _id when the seeder returned one, otherwise by its title."""
+    if slide.get("_id"):
+        rows = driver.find_elements(By.XPATH, f"//table//tr[.//form[contains(@action, '/{slide['_id']}/')]]")
+    else:
+        rows = driver.find_elements(By.XPATH, f"//table//tr[td[normalize-space()='{slide['title']}']]")
+    return rows[0] if rows else None
+
 
 class TestCarouselManagement:
     """Test suite for carousel management features."""
@@ -38,7 +53,7 @@ class TestCarouselManagement:
         3. Click on "Carousel" tab (should be active by default)
         4. Switch to iframe containing carousel management
         5. Fill in form fields:
-           - Title: "Selenium Test Slide"
+           - Title: "Selenium Test Slide <run id>"
            - Description: "This is for testing creating slide in the carousel"
            - Button Text: "Take assessment quiz"
            - Button URL: https://coachshante.com/intro
@@ -48,6 +63,7 @@ class TestCarouselManagement:
         9. Verify the new slide appears in the review area (table)
         """
         driver = logged_in_driver
+        REGISTRY.register("carousels", {"title": NEW_SLIDE_TITLE}, source="test_create_new_slide")
         
         # Step 1: Navigate to adminportal
         driver.get(f"{BASE_URL}/adminportal")
@@ -150,7 +166,7 @@ class TestCarouselManagement:
         title_input = wait_for_element(driver, By.ID, "title")
         assert title_input is not None, "Title input not found"
         title_input.clear()
-        title_input.send_keys("Selenium Test Slide")
+        title_input.send_keys(NEW_SLIDE_TITLE)
         time.sleep(0.5)
         
         # Description
@@ -235,221 +251,234 @@ class TestCarouselManagement:
         table = driver.find_element(By.TAG_NAME, "table")
         table_text = table.text
         
-        assert "Selenium Test Slide" in table_text, (
-            f"New slide 'Selenium Test Slide' not found in table. Table content: {table_text[:200]}"
+        assert NEW_SLIDE_TITLE in table_text, (
+            f"New slide '{NEW_SLIDE_TITLE}' not found in table. Table content: {table_text[:200]}"
         )
         
-        print("✓ New slide 'Selenium Test Slide' found in the table")
+        print(f"✓ New slide '{NEW_SLIDE_TITLE}' found in the table")
         
         # Switch back to default content
         driver.switch_to.default_content()
         print("✓ Test completed: New slide created successfully")
     
-    def test_edit_slide(self, logged_in_driver):
+    def test_edit_slide(self, logged_in_driver, seeded_slide):
         """Test 2: Test if admin can edit a carousel slide.
         
         Steps:
         1. Navigate to Content Management -> Carousel tab
         2. Switch to iframe
-        3. In the preview area (table), find the first slide
+        3. In the preview area (table), find the seeded slide
         4. Click on "Edit" button in Actions column
-        5. In Edit Slide window, delete current title and change it to "Selenium test edit slide"
+        5. In Edit Slide window, delete current title and change it to "Selenium test edit slide <run id>"
         6. Click on "Update Slide" button
         7. Verify the slide was updated
         """
         driver = logged_in_driver
-        
-        # Step 1: Navigate directly to carousel management first to ensure fresh CSRF token
-        driver.get(f"{BASE_URL}/adminportal/carouselmanagement")
-        wait_for_page_load(driver)
-        time.sleep(2)
-        
-        # Verify CSRF token is present
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "_csrf"))
-            )
-            csrf_input = driver.find_element(By.NAME, "_csrf")
-            csrf_value = csrf_input.get_attribute("value")
-            assert csrf_value, "CSRF token is empty"
-            print(f"✓ CSRF token found: {csrf_value[:20]}...")
-        except TimeoutException:
-            pytest.fail("CSRF token not found on carousel management page")
-        
-        # Now navigate to Content Management -> Carousel
-        driver.get(f"{BASE_URL}/content-management")
-        wait_for_page_load(driver)
-        time.sleep(2)
-        
-        # Click on Carousel tab
-        carousel_tab = wait_for_clickable(
-            driver,
-            By.CSS_SELECTOR,
-            "button.tab[data-target='panel-carousel']"
-        )
-        assert carousel_tab is not None, "Carousel tab not found"
-        carousel_tab.click()
-        time.sleep(3)  # Wait for tab to activate and iframe to load
-        
-        # Step 2: Switch to iframe
-        try:
-            iframe = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "iframe[title='Carousel Manager']"))
-            )
-            driver.switch_to.frame(iframe)
-            print("✓ Switched to carousel management iframe")
-        except TimeoutException:
-            pytest.fail("Carousel management iframe not found")
-        
-        # Wait for table to be visible and verify CSRF tokens
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "table"))
-            )
-            # Wait for CSRF tokens in edit/delete forms to be present
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "_csrf"))
-            )
-            # Verify CSRF token has a value
-            csrf_inputs = driver.find_elements(By.NAME, "_csrf")
-            assert len(csrf_inputs) > 0, "No CSRF tokens found in forms"
-            for csrf_input in csrf_inputs:
+        # Renamed below, so the seeded title no longer identifies it for cleanup
+        REGISTRY.register("carousels", {"title": EDITED_SLIDE_TITLE}, source="test_edit_slide")
+        
+        with step("Refresh CSRF token on carousel management"):
+            # Step 1: Navigate directly to carousel management first to ensure fresh CSRF token
+            driver.get(f"{BASE_URL}/adminportal/carouselmanagement")
+            wait_for_page_load(driver)
+            time.sleep(2)
+        
+            # Verify CSRF token is present
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.NAME, "_csrf"))
+                )
+                csrf_input = driver.find_element(By.NAME, "_csrf")
                 csrf_value = csrf_input.get_attribute("value")
-                assert csrf_value, "CSRF token in form is empty"
-            print(f"✓ Found {len(csrf_inputs)} CSRF token(s) in iframe forms")
-            time.sleep(1)  # Additional wait to ensure CSRF tokens are loaded
-        except TimeoutException:
-            pytest.fail("Slides table or CSRF tokens not found")
-        
-        # Step 3: Find the first slide's Edit button
-        # The Edit button is in a form within the Actions column
-        edit_buttons = driver.find_elements(
-            By.XPATH,
-            "//form[contains(@action, '/edit')]//button[contains(text(), 'Edit') or contains(text(), '🖊️')]"
-        )
-        
-        if not edit_buttons:
-            # Try alternative selector
-            edit_buttons = driver.find_elements(
+                assert csrf_value, "CSRF token is empty"
+                print(f"✓ CSRF token found: {csrf_value[:20]}...")
+            except TimeoutException:
+                pytest.fail("CSRF token not found on carousel management page")
+        
+        with step("Open Content Management carousel tab"):
+            # Now navigate to Content Management -> Carousel
+            driver.get(f"{BASE_URL}/content-management")
+            wait_for_page_load(driver)
+            time.sleep(2)
+        
+            # Click on Carousel tab
+            carousel_tab = wait_for_clickable(
+                driver,
                 By.CSS_SELECTOR,
-                "form[action*='/edit'] button[type='submit']"
+                "button.tab[data-target='panel-carousel']"
             )
-        
-        if not edit_buttons:
-            pytest.skip("No slides found to edit")
-        
-        # Get the first slide's title before editing (for verification)
-        first_row = edit_buttons[0].find_element(By.XPATH, "./ancestor::tr")
-        original_title_cell = first_row.find_elements(By.TAG_NAME, "td")[1]  # Title is in second column
-        original_title = original_title_cell.text.strip()
-        print(f"Original slide title: {original_title}")
-        
-        # Step 4: Click on Edit button
-        edit_button = edit_buttons[0]
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", edit_button)
-        time.sleep(0.5)
-        
-        print("Clicking Edit button...")
-        edit_button.click()
-        time.sleep(3)  # Wait for edit page to load
-        
-        # Switch back to default content (edit page is not in iframe)
-        driver.switch_to.default_content()
-        
-        # Wait for page to load after switching contexts
-        wait_for_page_load(driver)
-        time.sleep(2)  # Additional wait for edit page to load
-        
-        # Wait for edit form to be visible
-        try:
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.ID, "title"))
-            )
-            # Also wait for the form to be fully loaded
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "_csrf"))
+            assert carousel_tab is not None, "Carousel tab not found"
+            carousel_tab.click()
+            time.sleep(3)  # Wait for tab to activate and iframe to load
+        
+        with step("Switch to iframe and check CSRF tokens"):
+            # Step 2: Switch to iframe
+            try:
+                iframe = WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "iframe[title='Carousel Manager']"))
+                )
+                driver.switch_to.frame(iframe)
+                print("✓ Switched to carousel management iframe")
+            except TimeoutException:
+                pytest.fail("Carousel management iframe not found")
+        
+            # Wait for table to be visible and verify CSRF tokens
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, "table"))
+                )
+                # Wait for CSRF tokens in edit/delete forms to be present
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.NAME, "_csrf"))
+                )
+                # Verify CSRF token has a value
+                csrf_inputs = driver.find_elements(By.NAME, "_csrf")
+                assert len(csrf_inputs) > 0, "No CSRF tokens found in forms"
+                for csrf_input in csrf_inputs:
+                    csrf_value = csrf_input.get_attribute("value")
+                    assert csrf_value, "CSRF token in form is empty"
+                print(f"✓ Found {len(csrf_inputs)} CSRF token(s) in iframe forms")
+                time.sleep(1)  # Additional wait to ensure CSRF tokens are loaded
+            except TimeoutException:
+                pytest.fail("Slides table or CSRF tokens not found")
+        
+        with step("Find the seeded slide"):
+            # Step 3: Find the seeded slide's Edit button (never edit real slides)
+            # The Edit button is in a form within the Actions column
+            first_row = seeded_slide_row(driver, seeded_slide)
+            if first_row is None:
+                pytest.fail(f"Seeded slide '{seeded_slide['title']}' not found in the slides table")
+        
+            edit_buttons = first_row.find_elements(
+                By.XPATH,
+                ".//form[contains(@action, '/edit')]//button[contains(text(), 'Edit') or contains(text(), '🖊️')]"
             )
-        except TimeoutException:
-            pytest.fail("Edit slide form not found")
         
-        # Step 5: Delete current title and change it
-        title_input = wait_for_element(driver, By.ID, "title")
-        assert title_input is not None, "Title input not found in edit form"
+            if not edit_buttons:
+                # Try alternative selector
+                edit_buttons = first_row.find_elements(
+                    By.CSS_SELECTOR,
+                    "form[action*='/edit'] button[type='submit']"
+                )
+        
+            if not edit_buttons:
+                pytest.fail("Edit button not found for the seeded slide")
+        
+            # Get the slide's title before editing (for verification)
+            original_title_cell = first_row.find_elements(By.TAG_NAME, "td")[1]  # Title is in second column
+            original_title = original_title_cell.text.strip()
+            print(f"Original slide title: {original_title}")
+        
+        with step("Open the edit form"):
+            # Step 4: Click on Edit button
+            edit_button = edit_buttons[0]
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", edit_button)
+            time.sleep(0.5)
         
-        # Clear and set new title
-        title_input.clear()
-        time.sleep(0.3)
-        title_input.send_keys("Selenium test edit slide")
-        print("✓ Updated title to 'Selenium test edit slide'")
-        time.sleep(0.5)
+            print("Clicking Edit button...")
+            edit_button.click()
+            time.sleep(3)  # Wait for edit page to load
+        
+            # Switch back to default content (edit page is not in iframe)
+            driver.switch_to.default_content()
+        
+            # Wait for page to load after switching contexts
+            wait_for_page_load(driver)
+            time.sleep(2)  # Additional wait for edit page to load
+        
+            # Wait for edit form to be visible
+            try:
+                WebDriverWait(driver, 15).until(
+                    EC.presence_of_element_located((By.ID, "title"))
+                )
+                # Also wait for the form to be fully loaded
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.NAME, "_csrf"))
+                )
+            except TimeoutException:
+                pytest.fail("Edit slide form not found")
+        
+        with step("Change the title"):
+            # Step 5: Delete current title and change it
+            title_input = wait_for_element(driver, By.ID, "title")
+            assert title_input is not None, "Title input not found in edit form"
+        
+            # Clear and set new title
+            title_input.clear()
+            time.sleep(0.3)
+            title_input.send_keys(EDITED_SLIDE_TITLE)
+            print(f"✓ Updated title to '{EDITED_SLIDE_TITLE}'")
+            time.sleep(0.5)
         
-        # Step 6: Click on "Update Slide" button
-        update_button = wait_for_clickable(
-            driver,
-            By.CSS_SELECTOR,
-            "form[action*='/update'] button[type='submit']"
-        )
-        if not update_button:
-            # Try alternative selector
+        with step("Click Update Slide"):
+            # Step 6: Click on "Update Slide" button
             update_button = wait_for_clickable(
                 driver,
-                By.XPATH,
-                "//button[contains(text(), 'Update Slide')]"
+                By.CSS_SELECTOR,
+                "form[action*='/update'] button[type='submit']"
             )
+            if not update_button:
+                # Try alternative selector
+                update_button = wait_for_clickable(
+                    driver,
+                    By.XPATH,
+                    "//button[contains(text(), 'Update Slide')]"
+                )
         
-        assert update_button is not None, "Update Slide button not found"
+            assert update_button is not None, "Update Slide button not found"
         
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", update_button)
-        time.sleep(0.5)
+            driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", update_button)
+            time.sleep(0.5)
         
-        print("Clicking Update Slide button...")
-        update_button.click()
-        time.sleep(3)  # Wait for update to process and redirect
+            print("Clicking Update Slide button...")
+            update_button.click()
+            time.sleep(3)  # Wait for update to process and redirect
         
-        # Step 7: Verify the slide was updated
-        # Should redirect back to carousel management page
-        # Navigate back to carousel management to verify
-        driver.get(f"{BASE_URL}/content-management")
-        wait_for_page_load(driver)
-        time.sleep(2)
+        with step("Verify the updated title"):
+            # Step 7: Verify the slide was updated
+            # Should redirect back to carousel management page
+            # Navigate back to carousel management to verify
+            driver.get(f"{BASE_URL}/content-management")
+            wait_for_page_load(driver)
+            time.sleep(2)
         
-        carousel_tab = wait_for_clickable(
-            driver,
-            By.CSS_SELECTOR,
-            "button.tab[data-target='panel-carousel']"
-        )
-        carousel_tab.click()
-        time.sleep(2)
+            carousel_tab = wait_for_clickable(
+                driver,
+                By.CSS_SELECTOR,
+                "button.tab[data-target='panel-carousel']"
+            )
+            carousel_tab.click()
+            time.sleep(2)
         
-        # Switch to iframe again
-        iframe = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "iframe[title='Carousel Manager']"))
-        )
-        driver.switch_to.frame(iframe)
-        time.sleep(2)
+            # Switch to iframe again
+            iframe = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "iframe[title='Carousel Manager']"))
+            )
+            driver.switch_to.frame(iframe)
+            time.sleep(2)
         
-        # Check if updated title appears in table
-        table = driver.find_element(By.TAG_NAME, "table")
-        table_text = table.text
+            # Check if updated title appears in table
+            table = driver.find_element(By.TAG_NAME, "table")
+            table_text = table.text
         
-        assert "Selenium test edit slide" in table_text, (
-            f"Updated slide title 'Selenium test edit slide' not found in table. Table content: {table_text[:200]}"
-        )
+            assert EDITED_SLIDE_TITLE in table_text, (
+                f"Updated slide title '{EDITED_SLIDE_TITLE}' not found in table. Table content: {table_text[:200]}"
+            )
         
-        print("✓ Slide title updated successfully")
+            print("✓ Slide title updated successfully")
         
-        # Switch back to default content
-        driver.switch_to.default_content()
-        print("✓ Test completed: Slide edited successfully")
+            # Switch back to default content
+            driver.switch_to.default_content()
+            print("✓ Test completed: Slide edited successfully")
     
-    def test_delete_slide(self, logged_in_driver):
+    def test_delete_slide(self, logged_in_driver, seeded_slide):
         """Test 3: Test if admin can delete a carousel slide.
         
         Steps:
         1. Navigate to Content Management -> Carousel tab
         2. Switch to iframe
         3. In Carousel Management window, under preview area (table)
-        4. Find the first slide's Delete button in Actions column
+        4. Find the seeded slide's Delete button in Actions column
         5. Click on Delete button
         6. Confirm deletion (handle confirmation dialog)
         7. Verify the slide was deleted
@@ -527,21 +556,23 @@ class TestCarouselManagement:
         
         print(f"Found {slides_count_before} slide(s) before deletion")
         
-        # Get the first slide's title for verification
-        first_row = table_rows[0]
+        # Get the seeded slide's row and title for verification (never delete real slides)
+        first_row = seeded_slide_row(driver, seeded_slide)
+        if first_row is None:
+            pytest.fail(f"Seeded slide '{seeded_slide['title']}' not found in the slides table")
         title_cell = first_row.find_elements(By.TAG_NAME, "td")[1]
         slide_title = title_cell.text.strip()
         print(f"Deleting slide: {slide_title}")
         
         # Step 3 & 4: Find and click Delete button
-        delete_buttons = driver.find_elements(
+        delete_buttons = first_row.find_elements(
             By.XPATH,
-            "//form[contains(@action, '/delete')]//button[contains(text(), 'Delete') or contains(text(), '🗑️')]"
+            ".//form[contains(@action, '/delete')]//button[contains(text(), 'Delete') or contains(text(), '🗑️')]"
         )
         
         if not delete_buttons:
             # Try alternative selector
-            delete_buttons = driver.find_elements(
+            delete_buttons = first_row.find_elements(
                 By.CSS_SELECTOR,
                 "form[action*='/delete'] button[type='submit']"
             )
@@ -0,0 +1,65 @@
+"""
+Selenium leak checks for the admin pages (run with --leak-check[=N]).
+
+Tests cover:
+- Content Management tab switches (each click re-creates the manager iframe)
+- Appointment Management tab switches
+
+Each iteration switches through every tab; JS heap, DOM nodes, event
+listeners, documents and frames are sampled after each one (see leak_check.py).
+"""
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from helpers import wait_for_page_load
+from conftest import BASE_URL
+from leak_check import LeakCheck
+
+CONTENT_TABS = ["panel-carousel", "panel-aboutus", "panel-services"]
+APPOINTMENT_TABS = ["available-days", "time-slots", "blocked-dates", "all-appointments"]
+
+
+@pytest.mark.leak
+@pytest.mark.slow
+@pytest.mark.admin
+class TestLeakCheck:
+    """Repeated admin navigation must not grow memory, DOM or listeners."""
+
+    def test_content_management_tab_switches(self, logged_in_driver, leak_iterations):
+        """Switch through the Content Management tabs N times."""
+        driver = logged_in_driver
+        driver.get(f"{BASE_URL}/content-management")
+        wait_for_page_load(driver)
+        wait = WebDriverWait(driver, 15)
+
+        check = LeakCheck(driver, "content-management tab switches")
+        for _ in range(leak_iterations):
+            for panel in CONTENT_TABS:
+                wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f"button.tab[data-target='{panel}']"))).click()
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, f"#{panel} iframe")))
+            check.sample()
+
+        check.assert_no_leak()
+
+    def test_appointment_tab_switches(self, logged_in_driver, leak_iterations):
+        """Switch through the Appointment Management tabs N times."""
+        driver = logged_in_driver
+        driver.get(f"{BASE_URL}/adminportal/appointments")
+        wait_for_page_load(driver)
+        wait = WebDriverWait(driver, 15)
+
+        check = LeakCheck(driver, "appointment tab switches")
+        for _ in range(leak_iterations):
+            for tab in APPOINTMENT_TABS:
+                wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f"button[data-tab='{tab}']"))).click()
+                wait.until(EC.visibility_of_element_located((By.ID, tab)))
+            # the table is filled by fetch(); sample once it has settled
+            wait.until(lambda d: "Loading appointments" not in d.find_element(By.ID, "allAppointmentsTableBody").text)
+            check.sample()
+
+        check.assert_no_leak()
@@ -0,0 +1,74 @@
+"""
+Selenium tests for the public pages users land on.
+
+Tests cover:
+- Homepage carousel rendering
+- Intro page terms modal routing to the assessment
+- Contact and resources pages
+
+These flows also feed the Web Vitals report (see web_vitals.py).
+"""
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from helpers import wait_for_page_load
+from conftest import BASE_URL
+
+
+@pytest.mark.public
+class TestPublicPages:
+    """Test suite for public, non-authenticated pages."""
+
+    def test_homepage_carousel(self, driver):
+        """Test that the homepage renders its carousel."""
+        driver.get(f"{BASE_URL}/")
+        wait_for_page_load(driver)
+
+        try:
+            carousel = WebDriverWait(driver, 15).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".carousel, [class*='carousel']"))
+            )
+        except TimeoutException:
+            pytest.fail("Carousel not found on the homepage")
+
+        assert carousel.is_displayed(), "Carousel is not visible"
+
+    def test_intro_terms_modal_routes_to_assessment(self, driver):
+        """Test accepting the terms on /intro leads to the assessment."""
+        driver.get(f"{BASE_URL}/intro")
+        wait_for_page_load(driver)
+        wait = WebDriverWait(driver, 15)
+
+        wait.until(EC.element_to_be_clickable((By.ID, "start-assessment-btn"))).click()
+        wait.until(EC.visibility_of_element_located((By.ID, "terms-modal")))
+
+        # The checkbox only enables once the terms are scrolled to the bottom
+        terms_scroll = driver.find_element(By.ID, "terms-scroll")
+        driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", terms_scroll)
+        checkbox = driver.find_element(By.ID, "terms-checkbox")
+        wait.until(lambda d: not checkbox.get_attribute("disabled"))
+        checkbox.click()
+
+        continue_btn = driver.find_element(By.ID, "continue-btn")
+        wait.until(lambda d: continue_btn.is_enabled())
+        continue_btn.click()
+
+        wait.until(EC.url_contains("/assessment"))
+        wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, ".chakra-section.active")))
+        assert "/assessment" in driver.current_url
+
+    @pytest.mark.parametrize("path", ["/contact", "/resources"])
+    def test_public_page_loads(self, driver, path):
+        """Test that the contact and resources pages load."""
+        driver.get(f"{BASE_URL}{path}")
+        wait_for_page_load(driver)
+
+        body_text = driver.find_element(By.TAG_NAME, "body").text
+        assert body_text.strip(), f"{path} rendered an empty page"
+        assert "404" not in driver.title, f"{path} returned a not-found page"
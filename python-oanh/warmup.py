@@ -0,0 +1,128 @@
+"""
+Cold-start warmup and readiness gate for the deployed app.
+
+The render.com deployment sleeps when idle and the first test of a run used
+to absorb the 30+ second cold start. Before any browser starts, this:
+
+    1. extracts every route the tests navigate to, straight from the sources
+       (driver.get(f"{BASE_URL}/...")),
+    2. requests all of them concurrently, round after round, until every one
+       answers without a 5xx within WARMUP_THRESHOLD_MS (or WARMUP_TIMEOUT
+       runs out; a single request gives up after WARMUP_REQUEST_TIMEOUT),
+    3. records how long the cold start took in reports/warmup.jsonl.
+
+Run by hand:
+    python warmup.py https://graceful-living-web-application.onrender.com
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+
+import requests
+
+SUITE_DIR = os.path.dirname(os.path.abspath(__file__))
+WARMUP_LOG = os.path.join(SUITE_DIR, "reports", "warmup.jsonl")
+THRESHOLD_MS = float(os.getenv("WARMUP_THRESHOLD_MS", "2000"))
+TIMEOUT_S = float(os.getenv("WARMUP_TIMEOUT", "180"))
+# One request may hang while the proxy wakes the instance; give up on it and try again next round
+REQUEST_TIMEOUT_S = float(os.getenv("WARMUP_REQUEST_TIMEOUT", "30"))
+
+# driver.get(f"{BASE_URL}/path") / driver.get(BASE_URL + "/path") / driver.get(f"{base_url}/path")
+ROUTE = re.compile(r"""driver\.get\(\s*(?:f["']\{(?:BASE_URL|base_url)\}|(?:BASE_URL|base_url)\s*\+\s*["'])(/[^"'{?#]*)""")
+
+
+def extract_routes(paths=None):
+    """Sorted unique routes navigated to in the given files (default: this suite's tests)."""
+    paths = paths or glob.glob(os.path.join(SUITE_DIR, "test_*.py")) + [os.path.join(SUITE_DIR, "conftest.py")]
+    routes = {"/"}
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            routes.update(ROUTE.findall(f.read()))
+    return sorted(routes)
+
+
+@dataclass
+class WarmupReport:
+    base_url: str
+    routes: list
+    warm: bool = False
+    cold_start_s: float = None       # until the first route answered without a server error
+    ready_s: float = None            # until every route answered under the threshold
+    rounds: int = 0
+    last_ms: dict = field(default_factory=dict)     # {route: ms of the last round}
+
+    def lines(self):
+        if not self.warm:
+            slow = {r: ms for r, ms in self.last_ms.items() if ms is None or ms > THRESHOLD_MS}
+            return [f"Backend NOT warm after {self.rounds} round(s); still slow: {slow}"]
+        return [
+            f"Backend warm after {self.ready_s:.1f}s ({self.rounds} round(s), {len(self.routes)} routes); "
+            f"cold start {self.cold_start_s:.1f}s",
+        ]
+
+
+def _probe(session, url, timeout_s=REQUEST_TIMEOUT_S):
+    """ms until `url` answered without a server error, None otherwise (a cold proxy answers 502/503)."""
+    t0 = time.perf_counter()
+    try:
+        response = session.get(url, timeout=timeout_s, allow_redirects=True)
+    except requests.RequestException:
+        return None
+    if response.status_code >= 500:
+        return None
+    return (time.perf_counter() - t0) * 1000
+
+
+def warm_up(base_url, routes=None, threshold_ms=THRESHOLD_MS, timeout_s=TIMEOUT_S, workers=8,
+            request_timeout_s=REQUEST_TIMEOUT_S):
+    """Hit every route concurrently until all answer within threshold_ms."""
+    routes = routes or extract_routes()
+    report = WarmupReport(base_url.rstrip("/"), routes)
+    start = time.perf_counter()
+    sessions = [requests.Session() for _ in routes]
+    with ThreadPoolExecutor(max_workers=min(workers, len(routes))) as pool:
+        while time.perf_counter() - start < timeout_s:
+            report.rounds += 1
+            urls = [report.base_url + r for r in routes]
+            timings = list(pool.map(_probe, sessions, urls, [min(request_timeout_s, timeout_s)] * len(urls)))
+            report.last_ms = {r: (round(ms, 1) if ms is not None else None) for r, ms in zip(routes, timings)}
+            if report.cold_start_s is None and any(ms is not None for ms in timings):
+                report.cold_start_s = round(time.perf_counter() - start, 2)
+            if all(ms is not None and ms <= threshold_ms for ms in timings):
+                report.warm = True
+                report.ready_s = round(time.perf_counter() - start, 2)
+                break
+            if None in timings:
+                time.sleep(1)
+    for session in sessions:
+        session.close()
+    return report
+
+
+def record(report, path=WARMUP_LOG):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(dict(asdict(report), at=datetime.now().isoformat(timespec="seconds"))) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Wake the app up before a test run")
+    parser.add_argument("base_url")
+    parser.add_argument("--threshold-ms", type=float, default=THRESHOLD_MS)
+    parser.add_argument("--timeout", type=float, default=TIMEOUT_S)
+    parser.add_argument("--request-timeout", type=float, default=REQUEST_TIMEOUT_S)
+    args = parser.parse_args()
+
+    result = warm_up(args.base_url, threshold_ms=args.threshold_ms, timeout_s=args.timeout,
+                     request_timeout_s=args.request_timeout)
+    record(result)
+    for line in result.lines():
+        print(line)
+    for route, ms in result.last_ms.items():
+        print(f"  {route:<45} {ms if ms is not None else 'error':>10}")
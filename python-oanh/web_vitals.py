@@ -0,0 +1,212 @@
+"""
+Core Web Vitals for the public pages during normal test flows (pytest plugin).
+
+PerformanceObservers for LCP, CLS, long tasks and event timing (INP) are
+injected at document start (CDP Page.addScriptToEvaluateOnNewDocument).
+What they collected is read back before driver.get() & co. and at the end
+of each test; pages left some other way (a click that navigates) buffer
+their vitals in sessionStorage on pagehide, read with the next page. Only
+the routes listed in pytest.ini are kept:
+
+    web_vitals_routes =
+        /
+        /booking
+        ...
+
+Per page:  fcp, lcp (ms), cls (max session window), inp (ms, worst
+interaction - exact for the handful of interactions a test makes),
+long_tasks / tbt (ms of long-task time over 50ms).
+
+Reported per route at p75 (the Web Vitals convention), with the p75 LCP of
+the last runs as a trend, and appended to reports/perf/web_vitals.jsonl.
+"""
+import fnmatch
+import json
+import os
+from collections import defaultdict
+
+import pytest
+
+import driver_hooks
+import nav_timing
+import perf_run
+
+JSONL = "web_vitals.jsonl"
+TREND_RUNS = 5
+METRICS = ("fcp", "lcp", "cls", "inp", "long_tasks", "tbt", "interactions")
+
+OBSERVERS_JS = r"""
+(() => {
+    if (window.__webVitals) { return; }
+    const v = window.__webVitals = {fcp: null, lcp: null, lcp_element: null, cls: 0, inp: null,
+                                    interactions: 0, long_tasks: 0, tbt: 0};
+    const observe = (type, onEntry, options) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(onEntry))
+                .observe(Object.assign({type: type, buffered: true}, options || {}));
+        } catch (e) { /* entry type not supported */ }
+    };
+    observe("paint", e => { if (e.name === "first-contentful-paint") { v.fcp = e.startTime; } });
+    observe("largest-contentful-paint", e => {
+        v.lcp = e.startTime;
+        const el = e.element;
+        v.lcp_element = el ? el.tagName.toLowerCase() + (el.id ? "#" + el.id : "") + (el.className && typeof el.className === "string" ? "." + el.className.trim().split(/\s+/).join(".") : "") : null;
+    });
+    // CLS = largest session window (shifts < 1s apart, window <= 5s)
+    let windowValue = 0, windowStart = 0, lastShift = 0;
+    observe("layout-shift", e => {
+        if (e.hadRecentInput) { return; }
+        if (e.startTime - lastShift > 1000 || e.startTime - windowStart > 5000) { windowValue = 0; windowStart = e.startTime; }
+        windowValue += e.value;
+        lastShift = e.startTime;
+        v.cls = Math.max(v.cls, windowValue);
+    });
+    observe("longtask", e => { v.long_tasks += 1; v.tbt += Math.max(0, e.duration - 50); });
+    observe("event", e => {
+        if (!e.interactionId) { return; }
+        v.interactions += 1;
+        v.inp = Math.max(v.inp || 0, e.duration);
+    }, {durationThreshold: 16});
+    addEventListener("pagehide", () => {
+        try {
+            const list = JSON.parse(sessionStorage.getItem("__webVitals") || "[]");
+            list.push(Object.assign({url: location.href, timeOrigin: performance.timeOrigin}, v));
+            sessionStorage.setItem("__webVitals", JSON.stringify(list));
+        } catch (e) { /* storage unavailable */ }
+    });
+})();
+"""
+
+HARVEST_JS = """
+let buffered = [];
+try {
+    buffered = JSON.parse(sessionStorage.getItem("__webVitals") || "[]");
+    sessionStorage.removeItem("__webVitals");
+} catch (e) { /* storage unavailable */ }
+if (window.__webVitals) {
+    buffered.push(Object.assign({url: location.href, timeOrigin: performance.timeOrigin}, window.__webVitals));
+}
+return buffered;
+"""
+
+_samples = []
+_run_samples = []
+_drivers = []
+_routes = []
+
+
+def pytest_addoption(parser):
+    parser.addini("web_vitals_routes", "routes (fnmatch patterns) whose Web Vitals are collected", type="linelist",
+                  default=["/", "/booking", "/intro", "/assessment", "/results", "/contact", "/resources"])
+
+
+def pytest_configure(config):
+    _routes[:] = config.getini("web_vitals_routes")
+
+
+def instrument(driver):
+    """Called by the driver fixture: observers in every new document."""
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVERS_JS})
+    driver_hooks.install(driver)
+    _drivers.append(driver)
+    return driver
+
+
+def harvest(driver):
+    """Vitals of the pages left since the last harvest and of the current page, once per document,
+    for the watched routes. Returns the new samples."""
+    seen = driver.__dict__.setdefault("_vitals_seen", set())
+    samples = []
+    for vitals in driver.execute_script(HARVEST_JS) or []:
+        route = nav_timing.route_of(vitals["url"])
+        if not any(fnmatch.fnmatchcase(route, pattern) for pattern in _routes) or vitals["timeOrigin"] in seen:
+            continue
+        seen.add(vitals["timeOrigin"])
+        sample = {"test": perf_run.current_test(), "route": route, "lcp_element": vitals.get("lcp_element")}
+        sample.update({m: vitals.get(m) for m in METRICS})
+        samples.append(sample)
+    _samples.extend(samples)
+    return samples
+
+
+def _before_command(driver, command, params):
+    if command in nav_timing.NAV_COMMANDS and driver in _drivers:
+        harvest(driver)
+
+
+driver_hooks.add_hook(before=_before_command)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    yield
+    for driver in _drivers:
+        try:
+            if not nav_timing.alert_open(driver):
+                with driver_hooks.suspended():
+                    harvest(driver)
+        except Exception:
+            pass
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    if call.when == "teardown":
+        outcome.get_result().user_properties.append(("web_vitals", json.dumps(_samples)))
+        _samples.clear()
+
+
+def pytest_runtest_logreport(report):
+    if report.when != "teardown" or os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    for name, value in report.user_properties:
+        if name == "web_vitals":
+            _run_samples.extend(json.loads(value))
+
+
+def _p75(samples, metric):
+    values = [s[metric] for s in samples if s.get(metric) is not None]
+    return perf_run.percentile(values, 75) if values else None
+
+
+def route_vitals(samples):
+    """{route: {n, fcp, lcp, cls, inp, tbt}} at p75"""
+    grouped = defaultdict(list)
+    for s in samples:
+        grouped[s["route"]].append(s)
+    return {route: dict({"n": len(items)}, **{m: _p75(items, m) for m in ("fcp", "lcp", "cls", "inp", "tbt")})
+            for route, items in grouped.items()}
+
+
+def lcp_trend(route, runs=TREND_RUNS):
+    """p75 LCP of `route` in each of the last `runs` runs, oldest first."""
+    by_run = defaultdict(list)
+    order = []
+    for record in perf_run.read_jsonl(JSONL):
+        if record["route"] == route and record.get("lcp") is not None:
+            if record["run_id"] not in by_run:
+                order.append(record["run_id"])
+            by_run[record["run_id"]].append(record["lcp"])
+    return [perf_run.percentile(by_run[run], 75) for run in order[-runs:]]
+
+
+def pytest_sessionfinish(session):
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        perf_run.append_jsonl(JSONL, _run_samples)
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _run_samples:
+        return
+    fmt = lambda v, spec=".0f": format(v, spec) if v is not None else "-"
+    terminalreporter.write_sep("-", "web vitals per route (p75)")
+    terminalreporter.write_line(
+        f"{'route':<28} {'n':>3} {'FCP':>6} {'LCP':>6} {'CLS':>6} {'INP':>5} {'TBT':>6}  LCP trend (last {TREND_RUNS} runs)"
+    )
+    for route, v in sorted(route_vitals(_run_samples).items()):
+        trend = " > ".join(fmt(t) for t in lcp_trend(route)) or "-"
+        terminalreporter.write_line(
+            f"{route:<28} {v['n']:>3} {fmt(v['fcp']):>6} {fmt(v['lcp']):>6} {fmt(v['cls'], '.3f'):>6} "
+            f"{fmt(v['inp']):>5} {fmt(v['tbt']):>6}  {trend}"
+        )
@@ -120,12 +120,47 @@ def _fill_required_minimum_in_active_section(driver):
     except Exception:
         pass
 
-def complete_quiz_and_open_results(tos_accepted_driver, base_url, wait, use_admin_autofill=True):
+def accept_terms(driver, base_url, wait):
+    """Drive the /intro TOS flow so req.session.acceptedTOS = true."""
+    driver.get(base_url.rstrip("/") + "/intro")
+    wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+
+    # Open TOS modal
+    wait.until(EC.element_to_be_clickable((By.ID, "start-assessment-btn"))).click()
+
+    # Wait until the modal is displayed (presence + displayed)
+    wait.until(EC.visibility_of_element_located((By.ID, "terms-modal")))
+
+    # Scroll to bottom -> enable checkbox
+    terms_scroll = driver.find_element(By.ID, "terms-scroll")
+    driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", terms_scroll)
+
+    # Enable + tick checkbox
+    wait.until(lambda d: not d.find_element(By.ID, "terms-checkbox").get_attribute("disabled"))
+    driver.find_element(By.ID, "terms-checkbox").click()
+
+    # Continue
+    continue_btn = driver.find_element(By.ID, "continue-btn")
+    wait.until(lambda d: continue_btn.is_enabled())
+    before = driver.current_url
+    continue_btn.click()
+
+    # Robust wait: either URL changes OR the modal becomes invisible (both re-query)
+    wait.until(
+        EC.any_of(
+            EC.url_changes(before),
+            EC.invisibility_of_element_located((By.ID, "terms-modal")),
+        )
+    )
+    return driver
+
+def complete_quiz_and_open_results(tos_accepted_driver, base_url, wait, use_admin_autofill=True, open_assessment=True):
     d = tos_accepted_driver
 
-    # Go to /assessment
-    d.get(base_url.rstrip("/") + "/assessment")
-    wait.until(lambda drv: drv.execute_script("return document.readyState") == "complete")
+    # Go to /assessment (open_assessment=False: the caller already loaded it)
+    if open_assessment:
+        d.get(base_url.rstrip("/") + "/assessment")
+        wait.until(lambda drv: drv.execute_script("return document.readyState") == "complete")
 
     # Optional: admin autofill to speed up
     if use_admin_autofill:
@@ -15,6 +15,7 @@ from selenium.common.exceptions import StaleElementReferenceException, ElementCl
 from webdriver_manager.chrome import ChromeDriverManager        # Automatically downloads & manages correct ChromeDriver version
 from dotenv import load_dotenv                                  # Loads var from .env file into os.getenv()
 import contextlib                                               # for suppressing exceptions
+from chakra_ui_helpers import accept_terms                      # /intro TOS flow (shared with soak.py)
 
 # Load environment variables
 load_dotenv()
@@ -157,38 +158,7 @@ def admin_login(driver, wait, base_url):
 @pytest.fixture
 def tos_accepted_driver(driver, base_url):
     """Drive /intro TOS flow so req.session.acceptedTOS = true, then return driver."""
-    wait = WebDriverWait(driver, 15)
-    driver.get(base_url.rstrip("/") + "/intro")
-    wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
-
-    # Open TOS modal
-    wait.until(EC.element_to_be_clickable((By.ID, "start-assessment-btn"))).click()
-
-    # Wait until the modal is displayed (presence + displayed)
-    wait.until(EC.visibility_of_element_located((By.ID, "terms-modal")))
-
-    # Scroll to bottom -> enable checkbox
-    terms_scroll = driver.find_element(By.ID, "terms-scroll")
-    driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", terms_scroll)
-
-    # Enable + tick checkbox
-    wait.until(lambda d: not d.find_element(By.ID, "terms-checkbox").get_attribute("disabled"))
-    driver.find_element(By.ID, "terms-checkbox").click()
-
-    # Continue
-    continue_btn = driver.find_element(By.ID, "continue-btn")
-    wait.until(lambda d: continue_btn.is_enabled())
-    before = driver.current_url
-    continue_btn.click()
-
-    # Robust wait: either URL changes OR the modal becomes invisible (both re-query)
-    wait.until(
-        EC.any_of(
-            EC.url_changes(before),
-            EC.invisibility_of_element_located((By.ID, "terms-modal")),
-        )
-    )
-    return driver
+    return accept_terms(driver, base_url, WebDriverWait(driver, 15))
 
 """
     Provides a WebDriverWait instance for explicit waits
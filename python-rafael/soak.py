@@ -0,0 +1,202 @@
+"""
+Soak mode for the chakra assessment journey.
+
+K headless browsers loop the full journey (TOS on /intro -> every assessment
+section -> "Your Chakra & Archetype Insights") for a fixed duration:
+
+    python soak.py --browsers 4 --minutes 30
+
+Per iteration: time-to-results, success/error, server time (request -> first
+byte) of the /assessment and /results documents, and the page's JS heap.
+At the end two kinds of degradation are reported:
+
+    server  server time drifting up over the run (all browsers together)
+    client  time-to-results minus server time growing across the iterations
+            of one browser (leaks, piling-up state in a long-lived browser)
+
+comparing the first and last quarter of the run and a least-squares slope.
+Every iteration is written to reports/soak.jsonl.
+"""
+import argparse
+import json
+import os
+import statistics
+import threading
+import time
+from datetime import datetime
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+from chakra_ui_helpers import accept_terms, complete_quiz_and_open_results
+from conftest import BASE_URL, CHROMEDRIVER_VERSION
+
+REPORT = os.path.join(os.path.dirname(__file__), "reports", "soak.jsonl")
+DEGRADED = 1.2      # last quarter median / first quarter median
+
+SERVER_TIME_JS = """
+const n = performance.getEntriesByType("navigation")[0];
+return {path: location.pathname, server_ms: n ? n.responseStart - n.requestStart : null,
+        redirect_ms: n && n.redirectEnd ? n.redirectEnd - n.redirectStart : 0,
+        heap_mb: performance.memory ? performance.memory.usedJSHeapSize / 1048576 : null};
+"""
+
+
+def make_driver(driver_path):
+    options = Options()
+    for arg in ("--headless=new", "--no-sandbox", "--disable-dev-shm-usage", "--window-size=1366,900"):
+        options.add_argument(arg)
+    # one chromedriver per browser: a Service can't be shared between drivers
+    return webdriver.Chrome(service=Service(driver_path), options=options)
+
+
+def run_iteration(driver, base_url, wait):
+    """One fresh visitor through the journey; returns the iteration's measurements."""
+    driver.delete_all_cookies()
+    start = time.perf_counter()
+    accept_terms(driver, base_url, wait)
+    # accept_terms may return while still on /intro: load /assessment here and time that document
+    driver.get(base_url.rstrip("/") + "/assessment")
+    wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+    assessment = driver.execute_script(SERVER_TIME_JS)
+    if assessment["path"] != "/assessment":
+        raise RuntimeError(f"Expected /assessment after accepting the terms, got {assessment['path']}")
+    complete_quiz_and_open_results(driver, base_url, wait, use_admin_autofill=False, open_assessment=False)
+    elapsed = time.perf_counter() - start
+    # /results comes from the submit's redirect: POST handling + rendering the results page
+    results = driver.execute_script(SERVER_TIME_JS)
+    server_ms = sum(v or 0 for v in (assessment["server_ms"], results["redirect_ms"], results["server_ms"]))
+    return {
+        "time_to_results_s": elapsed,
+        "assessment_server_ms": assessment["server_ms"],
+        "submit_ms": results["redirect_ms"],
+        "results_server_ms": results["server_ms"],
+        "server_ms": server_ms,
+        "client_s": elapsed - server_ms / 1000,
+        "heap_mb": results["heap_mb"],
+    }
+
+
+def soak_browser(index, driver_path, base_url, deadline, records, lock):
+    driver = make_driver(driver_path)
+    wait = WebDriverWait(driver, 30, poll_frequency=0.1)
+    iteration = 0
+    try:
+        while time.monotonic() < deadline:
+            record = {"browser": index, "iteration": iteration, "at": datetime.now().isoformat(timespec="seconds"),
+                      "t": time.monotonic()}
+            try:
+                record.update(run_iteration(driver, base_url, wait), ok=True)
+            except Exception as e:
+                record.update(ok=False, error=f"{type(e).__name__}: {str(e).splitlines()[0] if str(e) else ''}"[:200])
+            with lock:
+                records.append(record)
+            iteration += 1
+    finally:
+        driver.quit()
+
+
+def slope(points):
+    """Least-squares slope of [(x, y)]."""
+    if len(points) < 2:
+        return 0.0
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    den = sum((x - mean_x) ** 2 for x, _ in points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / den if den else 0.0
+
+
+def drift(points):
+    """(first quarter median, last quarter median, ratio, slope) of [(x, y)] sorted by x."""
+    points = sorted(p for p in points if p[1] is not None)
+    if len(points) < 4:
+        return None
+    quarter = max(1, len(points) // 4)
+    first = statistics.median(y for _, y in points[:quarter])
+    last = statistics.median(y for _, y in points[-quarter:])
+    return first, last, (last / first if first else None), slope(points)
+
+
+def error_rates(records, started):
+    """Error rate in each quarter of the run (by start time)."""
+    if not records:
+        return []
+    span = max(r["t"] for r in records) - started or 1
+    quarters = [[] for _ in range(4)]
+    for r in records:
+        quarters[min(3, int((r["t"] - started) / span * 4))].append(r["ok"])
+    return [(len(q) - sum(q)) / len(q) if q else None for q in quarters]
+
+
+def analyse(records, started):
+    ok = [r for r in records if r["ok"]]
+    out = {
+        "iterations": len(records),
+        "errors": len(records) - len(ok),
+        "error_rate": (len(records) - len(ok)) / len(records) if records else 0,
+        "time_to_results_p50_s": statistics.median(r["time_to_results_s"] for r in ok) if ok else None,
+        "error_rate_by_quarter": error_rates(records, started),
+        "server": drift([((r["t"] - started) / 60, r["server_ms"]) for r in ok]),       # per minute of the run
+        "client": {},
+    }
+    for browser in sorted({r["browser"] for r in records}):
+        mine = [r for r in ok if r["browser"] == browser]
+        out["client"][browser] = {
+            "client_s": drift([(r["iteration"], r["client_s"]) for r in mine]),         # per iteration
+            "heap_mb": drift([(r["iteration"], r["heap_mb"]) for r in mine]),
+        }
+    return out
+
+
+def _drift_line(label, d, unit, per):
+    if d is None:
+        return f"  {label}: not enough iterations"
+    first, last, ratio, trend = d
+    flag = "  DEGRADED" if ratio and ratio >= DEGRADED else ""
+    return (f"  {label}: {first:.1f} -> {last:.1f} {unit} (x{ratio or 0:.2f}), "
+            f"slope {trend:+.2f} {unit}/{per}{flag}")
+
+
+def report_lines(summary, browsers, minutes):
+    lines = [
+        f"Soak: {browsers} browser(s) x {minutes:g} min - {summary['iterations']} iterations, "
+        f"{summary['errors']} errors ({summary['error_rate']:.1%}), "
+        f"time-to-results p50 {summary['time_to_results_p50_s'] or 0:.1f}s",
+        "error rate by quarter: " + " / ".join(f"{e:.0%}" if e is not None else "-" for e in summary["error_rate_by_quarter"]),
+        "server-side (all browsers):",
+        _drift_line("server time", summary["server"], "ms", "min"),
+        "client-side (per browser):",
+    ]
+    for browser, c in summary["client"].items():
+        lines.append(_drift_line(f"browser {browser} client time", c["client_s"], "s", "iteration"))
+        lines.append(_drift_line(f"browser {browser} JS heap", c["heap_mb"], "MiB", "iteration"))
+    return lines
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soak the chakra assessment journey with K headless browsers")
+    parser.add_argument("--base-url", default=BASE_URL, required=not BASE_URL)
+    parser.add_argument("--browsers", type=int, default=3)
+    parser.add_argument("--minutes", type=float, default=10)
+    args = parser.parse_args()
+
+    driver_path = ChromeDriverManager(CHROMEDRIVER_VERSION).install()
+    records, lock = [], threading.Lock()
+    started = time.monotonic()
+    deadline = started + args.minutes * 60
+    threads = [threading.Thread(target=soak_browser, args=(i, driver_path, args.base_url, deadline, records, lock))
+               for i in range(args.browsers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    os.makedirs(os.path.dirname(REPORT), exist_ok=True)
+    with open(REPORT, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(dict(record, t=record["t"] - started)) + "\n")
+    for line in report_lines(analyse(records, started), args.browsers, args.minutes):
+        print(line)
@@ -0,0 +1,268 @@
+"""
+Stats dashboard scaling benchmark.
+
+Seeds `chakraassessments` in a LOCAL Mongo at growing sizes and, for each
+size, times the Chakra Assessment Statistics refresh on /adminportal for the
+all-time and a per-month filter:
+
+    backend_ms   stats request (--stats-path): request start -> response end (Resource Timing)
+    hidden_ms    refresh click -> statsLoadingMessage hidden
+    render_ms    response end -> charts re-rendered (DOM changes in them) and painted
+    total_ms     refresh click -> charts re-rendered and painted
+
+    SEED_MONGO_URI=mongodb://localhost:27017 python stats_bench.py --sizes 100 1000 10000 50000
+
+The page ids (refreshStatsBtn, statsLoadingMessage, ...) are the ones
+tests/test_chakra_stats_charts.py uses. The stats endpoint is not: the
+default --stats-path was never checked against the real app, so pass the
+one the dashboard fetches. Charts default to the .stats-dashboard-section
+the suite waits for; --charts takes narrower selectors. A refresh with no
+matching stats request within --stats-wait-ms stops the run with an error.
+
+The app under test (TEST_BASE_URL) must use that database. Seeded documents
+carry testRunId and are deleted at the end. From the backend times it
+estimates the size at which a refresh exceeds --budget-ms, i.e. when the
+stats need precomputing. Results are appended to reports/stats_bench.jsonl.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import uuid
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+from conftest import ADMIN_PASSWORD, ADMIN_USERNAME, BASE_URL, CHROMEDRIVER_VERSION
+
+REPORT = os.path.join(os.path.dirname(__file__), "reports", "stats_bench.jsonl")
+COLLECTION = "chakraassessments"
+RUN_TAG_FIELD = "testRunId"
+CHAKRAS = ["rootChakra", "sacralChakra", "solarPlexusChakra", "heartChakra", "throatChakra", "thirdEyeChakra",
+           "crownChakra"]
+ARCHETYPES = ["workerBee", "lover", "warrior", "sage", "caregiver", "creator", "seeker"]
+STATS_PATH = "/adminportal/stats"             # unverified against the real app, see --stats-path
+CHARTS = (".stats-dashboard-section",)
+STATS_WAIT_MS = 15000
+
+# Clicks refresh from inside the page and resolves once the loading message is
+# hidden and every chart was re-rendered, plus one more frame so it is painted.
+# The previous refresh's charts are still in the DOM, so "re-rendered" means a
+# DOM mutation inside the chart after the stats response arrived (a
+# MutationObserver, not just the presence of a canvas/bar; changes to the
+# loading message and the count badge don't count). Charts that never change
+# within RENDER_WAIT_MS give render_ms null (drawn in place on a canvas).
+# Missing chart elements or no stats request within STATS_WAIT_MS resolve
+# with {error} instead of spinning until the script timeout.
+RENDER_WAIT_MS = 10000
+REFRESH_JS = """
+const done = arguments[arguments.length - 1];
+const charts = arguments[0], renderWaitMs = arguments[1], statsPath = arguments[2], statsWaitMs = arguments[3];
+const missing = charts.filter(sel => !document.querySelector(sel));
+if (missing.length) { return done({error: "no element matches chart selector(s) " + missing.join(", ")}); }
+const loading = document.getElementById("statsLoadingMessage");
+const badge = document.getElementById("submissionCountBadge");
+const hidden = () => !loading || loading.offsetParent === null || getComputedStyle(loading).display === "none";
+const ignored = (node) => [loading, badge].some(el => el && el.contains(node));
+const lastChange = {};
+const observers = charts.map(sel => {
+    const observer = new MutationObserver(records => {
+        if (records.some(r => !ignored(r.target))) { lastChange[sel] = performance.now(); }
+    });
+    observer.observe(document.querySelector(sel), {childList: true, subtree: true, attributes: true, characterData: true});
+    return observer;
+});
+const statsEntry = (t0) => performance.getEntriesByType("resource")
+    .filter(e => e.name.includes(statsPath) && e.startTime >= t0).pop();
+const t0 = performance.now();
+let hiddenAt = null;
+document.getElementById("refreshStatsBtn").click();
+const finish = (entry, rendered) => {
+    observers.forEach(o => o.disconnect());
+    requestAnimationFrame(() => requestAnimationFrame(() => {
+        const paintedAt = rendered ? performance.now() : null;
+        done({backend_ms: entry.responseEnd - entry.startTime, ttfb_ms: entry.responseStart - entry.requestStart,
+              hidden_ms: hiddenAt - t0, render_ms: paintedAt === null ? null : paintedAt - entry.responseEnd,
+              total_ms: paintedAt === null ? null : paintedAt - t0,
+              badge: (badge || {}).textContent});
+    }));
+};
+const tick = () => {
+    const entry = statsEntry(t0);
+    if (!entry && performance.now() - t0 > statsWaitMs) {
+        observers.forEach(o => o.disconnect());
+        return done({error: "no " + statsPath + " request within " + statsWaitMs + " ms of the refresh click"});
+    }
+    if (entry && entry.responseEnd > 0 && hidden()) {
+        hiddenAt = hiddenAt || performance.now();
+        if (charts.every(sel => lastChange[sel] >= entry.responseEnd)) {
+            return finish(entry, true);
+        }
+        if (performance.now() - entry.responseEnd > renderWaitMs) {
+            return finish(entry, false);
+        }
+    }
+    requestAnimationFrame(tick);
+};
+requestAnimationFrame(tick);
+"""
+
+SET_MONTH_JS = """
+const picker = document.getElementById("statsMonthPicker");
+picker.value = arguments[0];
+picker.dispatchEvent(new Event("input", {bubbles: true}));
+picker.dispatchEvent(new Event("change", {bubbles: true}));
+"""
+
+
+class AssessmentSeeder:
+    """Bulk inserts run-tagged chakraassessments; local databases only."""
+
+    def __init__(self, uri, db_name):
+        from pymongo import MongoClient
+
+        host = urlparse(uri).hostname or ""
+        if host not in ("localhost", "127.0.0.1", "::1") and not os.getenv("SEED_MONGO_ALLOW_REMOTE"):
+            raise SystemExit(f"Refusing to bulk-seed non-local Mongo host '{host}'")
+        self.client = MongoClient(uri)
+        self.collection = self.client[db_name][COLLECTION]
+        self.tag = f"statsbench-{uuid.uuid4().hex[:8]}"
+        self.count = 0
+
+    def grow_to(self, size, months=12, batch=5000):
+        """Insert documents until `size` are seeded, spread over the last `months` months."""
+        now = datetime.utcnow()
+        while self.count < size:
+            n = min(batch, size - self.count)
+            docs = [{
+                "fullName": "Stats Bench", "email": "test@example.com",
+                "focusChakra": random.choice(CHAKRAS), "archetype": random.choice(ARCHETYPES),
+                "createdAt": now - timedelta(days=random.uniform(0, 30 * months)),
+                RUN_TAG_FIELD: self.tag,
+            } for _ in range(n)]
+            self.collection.insert_many(docs, ordered=False)
+            self.count += n
+
+    def cleanup(self):
+        removed = self.collection.delete_many({RUN_TAG_FIELD: self.tag}).deleted_count
+        self.client.close()
+        return removed
+
+
+def make_driver(headed=False):
+    options = Options()
+    for arg in ("--no-sandbox", "--disable-dev-shm-usage", "--window-size=1366,900"):
+        options.add_argument(arg)
+    if not headed:
+        options.add_argument("--headless=new")
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager(CHROMEDRIVER_VERSION).install()), options=options)
+    driver.set_script_timeout((STATS_WAIT_MS + RENDER_WAIT_MS) / 1000 + 60)
+    return driver
+
+
+def login(driver, base_url):
+    """Same flow as the admin_login fixture: CSRF cookie first, then the login form."""
+    wait = WebDriverWait(driver, 15)
+    driver.get(base_url + "/login")
+    wait.until(lambda d: any(c["name"] == "_csrf" for c in d.get_cookies()))
+    wait.until(EC.presence_of_element_located((By.NAME, "username"))).send_keys(ADMIN_USERNAME)
+    driver.find_element(By.NAME, "password").send_keys(ADMIN_PASSWORD)
+    driver.find_element(By.CSS_SELECTOR, "button.login_button[type='submit']").click()
+    wait.until(EC.url_contains("/adminportal"))
+
+
+def refresh(driver, stats_path, charts):
+    sample = driver.execute_async_script(REFRESH_JS, list(charts), RENDER_WAIT_MS, stats_path, STATS_WAIT_MS)
+    if sample.get("error"):
+        raise SystemExit(f"Stats refresh not measurable: {sample['error']} (check --stats-path / --charts)")
+    return sample
+
+
+def measure(driver, base_url, month, repeats, stats_path=STATS_PATH, charts=CHARTS):
+    """`repeats` refreshes with the given month filter ("" = all time), after one warm-up."""
+    driver.get(base_url + "/adminportal")
+    WebDriverWait(driver, 30).until(EC.presence_of_element_located((By.ID, "refreshStatsBtn")))
+    if month:
+        driver.execute_script(SET_MONTH_JS, month)
+    else:
+        driver.find_element(By.ID, "clearMonthBtn").click()
+    refresh(driver, stats_path, charts)
+    return [refresh(driver, stats_path, charts) for _ in range(repeats)]
+
+
+def summarise(size, filter_name, samples):
+    row = {"size": size, "filter": filter_name, "repeats": len(samples), "badge": samples[-1].get("badge")}
+    for metric in ("backend_ms", "ttfb_ms", "hidden_ms", "render_ms", "total_ms"):
+        values = sorted(s[metric] for s in samples if s[metric] is not None)
+        row[f"{metric}_p50"] = statistics.median(values) if values else None
+        row[f"{metric}_max"] = values[-1] if values else None
+    return row
+
+
+def precompute_threshold(rows, budget_ms):
+    """Size at which the all-time backend time reaches budget_ms (linear fit), or None."""
+    points = [(r["size"], r["backend_ms_p50"]) for r in rows if r["filter"] == "all time"]
+    if len(points) < 2:
+        return None
+    mean_x = statistics.fmean(x for x, _ in points)
+    mean_y = statistics.fmean(y for _, y in points)
+    den = sum((x - mean_x) ** 2 for x, _ in points)
+    per_doc = sum((x - mean_x) * (y - mean_y) for x, y in points) / den if den else 0
+    if per_doc <= 0:
+        return None
+    return max(0, (budget_ms - (mean_y - per_doc * mean_x)) / per_doc)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the admin stats dashboard at growing assessment counts")
+    parser.add_argument("--base-url", default=BASE_URL, required=not BASE_URL)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1000, help="acceptable backend time for a refresh")
+    parser.add_argument("--stats-path", default=STATS_PATH, help="URL fragment of the request the refresh makes")
+    parser.add_argument("--charts", nargs="+", default=list(CHARTS), help="CSS selectors of the chart containers")
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    uri = os.getenv("SEED_MONGO_URI")
+    if not uri:
+        raise SystemExit("Set SEED_MONGO_URI to the local Mongo the app under test uses")
+    base_url = args.base_url.rstrip("/")
+    month = datetime.utcnow().strftime("%Y-%m")
+
+    seeder = AssessmentSeeder(uri, os.getenv("SEED_MONGO_DB", "bitbybitdevelopment"))
+    driver = make_driver(args.headed)
+    rows = []
+    try:
+        login(driver, base_url)
+        for size in sorted(args.sizes):
+            seeder.grow_to(size)
+            for filter_name, value in (("all time", ""), (f"month {month}", month)):
+                rows.append(summarise(size, filter_name, measure(driver, base_url, value, args.repeats, args.stats_path, args.charts)))
+    finally:
+        driver.quit()
+        print(f"Removed {seeder.cleanup()} seeded assessment(s)")
+
+    os.makedirs(os.path.dirname(REPORT), exist_ok=True)
+    at = datetime.now().isoformat(timespec="seconds")
+    with open(REPORT, "a", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(dict(row, base_url=base_url, at=at)) + "\n")
+
+    fmt = lambda v: format(v, ".0f") if v is not None else "-"
+    print(f"{'seeded':>7} {'filter':<15} {'backend':>8} {'ttfb':>7} {'hidden':>8} {'render':>8} {'total':>8}   (p50 ms)")
+    for r in rows:
+        print(f"{r['size']:>7} {r['filter']:<15} {fmt(r['backend_ms_p50']):>8} {fmt(r['ttfb_ms_p50']):>7} "
+              f"{fmt(r['hidden_ms_p50']):>8} {fmt(r['render_ms_p50']):>8} {fmt(r['total_ms_p50']):>8}")
+    threshold = precompute_threshold(rows, args.budget_ms)
+    if threshold is not None:
+        print(f"All-time backend time reaches {args.budget_ms:.0f} ms at ~{threshold:,.0f} assessments "
+              "- precompute the stats before that")